@@ -0,0 +1,30 @@
+"""Helpers shared by the benchmarks."""
+
+import tracemalloc
+from collections import abc
+from typing import NamedTuple
+
+type Benchmark = abc.Callable[..., object]
+"""The `benchmark` fixture of pytest-benchmark, whose methods are untyped."""
+
+
+class Retained(NamedTuple):
+    blocks: int
+    size: int
+    """In bytes."""
+
+
+def retained(f: abc.Callable[[], object], /) -> Retained:
+    """Measure the memory still held by the output of `f`."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        out = f()
+        after = tracemalloc.take_snapshot()
+
+    finally:
+        tracemalloc.stop()
+
+    del out
+    stats = after.compare_to(before, "filename")
+    return Retained(sum(s.count_diff for s in stats), sum(s.size_diff for s in stats))
@@ -0,0 +1,53 @@
+"""Columnar arrays against lists of variants."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from benchmarks.conftest import Benchmark
+from monads.arrays import OptionArray, ResultArray
+from monads.option import Null, Option, Some
+from monads.result import Err, Ok, Result
+from monads.tools import collect_results
+
+N = 100_000
+OPTIONS: list[Option[int]] = [Null.null if i % 10 == 0 else Some(i) for i in range(N)]
+RESULTS: list[Result[int, str]] = [Ok(i) for i in range(N)]
+
+
+@pytest.mark.benchmark(group="option-map")
+def test_option_map_list(benchmark: Benchmark) -> None:
+    benchmark(lambda: [o.map(lambda v: v * 2) for o in OPTIONS])
+
+
+@pytest.mark.benchmark(group="option-map")
+def test_option_map_array(benchmark: Benchmark) -> None:
+    array = OptionArray.from_options(OPTIONS)
+    benchmark(lambda: array.map(lambda v: v * 2))
+
+
+@pytest.mark.benchmark(group="option-unwrap-or")
+def test_option_unwrap_or_list(benchmark: Benchmark) -> None:
+    benchmark(lambda: [o.unwrap_or(0) for o in OPTIONS])
+
+
+@pytest.mark.benchmark(group="option-unwrap-or")
+def test_option_unwrap_or_array(benchmark: Benchmark) -> None:
+    array = OptionArray.from_options(OPTIONS)
+    benchmark(array.unwrap_or, 0)
+
+
+@pytest.mark.benchmark(group="result-collect")
+def test_result_collect_list(benchmark: Benchmark) -> None:
+    benchmark(collect_results, RESULTS)
+
+
+@pytest.mark.benchmark(group="result-collect")
+def test_result_collect_array(benchmark: Benchmark) -> None:
+    array = ResultArray.from_results([*RESULTS, Err("")])
+    benchmark(array.collect)
+
+
+@pytest.mark.benchmark(group="convert")
+def test_from_options(benchmark: Benchmark) -> None:
+    benchmark(OptionArray.from_options, OPTIONS)
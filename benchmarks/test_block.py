@@ -0,0 +1,55 @@
+"""`@result_block` against `map_into` chains and hand-written early returns."""
+
+from collections import abc
+from typing import Any
+
+import pytest
+
+from benchmarks.conftest import Benchmark
+from monads.decorators import result_block
+from monads.result import Err, Ok, Result
+
+N = 1000
+INPUTS = [str(i) if i % 10 else "x" for i in range(N)]
+
+
+def _parse(s: str) -> Result[int, str]:
+    return Ok(int(s)) if s.isdigit() else Err(s)
+
+
+def _half(v: int) -> Result[int, str]:
+    return Ok(v // 2)
+
+
+def _add(a: int, b: int) -> Result[int, str]:
+    return Ok(a + b)
+
+
+def chained(s: str) -> Result[int, str]:
+    return _parse(s).map_into(lambda a: _half(a).map_into(lambda b: _add(a, b)))
+
+
+@result_block
+def block(s: str) -> abc.Generator[Result[int, str], Any, int]:
+    a = yield _parse(s)
+    b = yield _half(a)
+    return (yield _add(a, b))
+
+
+def handwritten(s: str) -> Result[int, str]:
+    a = _parse(s)
+    if not a:
+        return a
+
+    b = _half(a.ok_value)
+    if not b:
+        return b
+
+    return _add(a.ok_value, b.ok_value)
+
+
+@pytest.mark.benchmark(group="block")
+@pytest.mark.parametrize("f", [chained, block, handwritten])
+def test_block(benchmark: Benchmark, f: abc.Callable[[str], Result[int, str]]) -> None:
+    assert f("4") == Ok(6)
+    benchmark(lambda: list(map(f, INPUTS)))
@@ -0,0 +1,90 @@
+"""`CatchResult` and `@returns_result` against `try_result` and a plain try/except."""
+
+# ruff: noqa: PLW2901
+
+import pytest
+
+from benchmarks.conftest import Benchmark
+from monads.decorators import returns_result
+from monads.result import Err, Ok, Result
+from monads.tools import CatchResult, try_result
+
+N = 1000
+
+INPUTS = [
+    pytest.param(["123"] * N, id="ok"),
+    pytest.param(["abc"] * N, id="err"),
+]
+
+
+@pytest.mark.benchmark(group="catch")
+@pytest.mark.parametrize("strings", INPUTS)
+def test_catch_result(benchmark: Benchmark, strings: list[str]) -> None:
+    def run() -> list[Result[int, ValueError]]:
+        results: list[Result[int, ValueError]] = []
+        for s in strings:
+            with CatchResult(ValueError) as catch:
+                catch @= int(s)
+
+            results.append(catch.result)
+
+        return results
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="catch")
+@pytest.mark.parametrize("strings", INPUTS)
+def test_catch_result_reused(benchmark: Benchmark, strings: list[str]) -> None:
+    def run() -> list[Result[int, ValueError]]:
+        results: list[Result[int, ValueError]] = []
+        catch = CatchResult(ValueError)
+        for s in strings:
+            with catch:
+                catch @= int(s)
+
+            results.append(catch.result)
+
+        return results
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="catch")
+@pytest.mark.parametrize("strings", INPUTS)
+def test_try_result(benchmark: Benchmark, strings: list[str]) -> None:
+    benchmark(lambda: [try_result(int, ValueError, s) for s in strings])
+
+
+@pytest.mark.benchmark(group="catch")
+@pytest.mark.parametrize("strings", INPUTS)
+def test_returns_result(benchmark: Benchmark, strings: list[str]) -> None:
+    parse = returns_result(ValueError)(int)
+    benchmark(lambda: [parse(s) for s in strings])
+
+
+@pytest.mark.benchmark(group="catch")
+@pytest.mark.parametrize("strings", INPUTS)
+def test_returns_result_signature(benchmark: Benchmark, strings: list[str]) -> None:
+    @returns_result(ValueError)
+    def parse(s: str) -> int:
+        return int(s)
+
+    benchmark(lambda: [parse(s) for s in strings])
+
+
+@pytest.mark.benchmark(group="catch")
+@pytest.mark.parametrize("strings", INPUTS)
+def test_try_except_baseline(benchmark: Benchmark, strings: list[str]) -> None:
+    def run() -> list[Result[int, ValueError]]:
+        results: list[Result[int, ValueError]] = []
+        for s in strings:
+            try:
+                results.append(Ok(int(s)))
+
+            except ValueError as err:
+                results.append(Err(err))
+
+        return results
+
+    benchmark(run)
@@ -0,0 +1,89 @@
+"""Construction & access cost of the variants, against the former `attrs` classes.
+
+Run with `pytest benchmarks`. Every benchmark processes a batch of `N` items, so
+the reported times divided by `N` give the per-operation cost.
+"""
+
+import operator
+from collections import abc
+
+import attrs
+import pytest
+
+from benchmarks.conftest import Benchmark
+from monads.option import Some
+from monads.result import Err, Ok
+
+N = 1000
+
+
+@attrs.frozen
+class AttrsSome:
+    value: object = attrs.field()
+
+
+@attrs.frozen
+class AttrsOk:
+    ok_value: object = attrs.field()
+
+
+@attrs.frozen
+class AttrsErr:
+    err_value: object = attrs.field()
+
+
+def _tuple(value: object, /) -> tuple[object]:
+    return (value,)
+
+
+CLASSES = [
+    pytest.param(Some, "value", id="Some"),
+    pytest.param(Ok, "ok_value", id="Ok"),
+    pytest.param(Err, "err_value", id="Err"),
+    pytest.param(AttrsSome, "value", id="attrs-Some"),
+    pytest.param(AttrsOk, "ok_value", id="attrs-Ok"),
+    pytest.param(AttrsErr, "err_value", id="attrs-Err"),
+]
+
+
+@pytest.mark.benchmark(group="construct")
+@pytest.mark.parametrize(("cls", "attr"), CLASSES)
+def test_construct(benchmark: Benchmark, cls: abc.Callable[[int], object], attr: str) -> None:
+    values = range(N)
+    benchmark(lambda: [cls(v) for v in values])
+
+
+@pytest.mark.benchmark(group="construct")
+def test_construct_tuple_baseline(benchmark: Benchmark) -> None:
+    values = range(N)
+    benchmark(lambda: [(v,) for v in values])
+
+
+@pytest.mark.benchmark(group="access")
+@pytest.mark.parametrize(("cls", "attr"), CLASSES)
+def test_access(benchmark: Benchmark, cls: abc.Callable[[int], object], attr: str) -> None:
+    read = operator.attrgetter(attr)
+    objs = [cls(v) for v in range(N)]
+    benchmark(lambda: list(map(read, objs)))
+
+
+@pytest.mark.benchmark(group="access")
+def test_access_tuple_baseline(benchmark: Benchmark) -> None:
+    objs = [_tuple(v) for v in range(N)]
+    read = operator.itemgetter(0)
+    benchmark(lambda: list(map(read, objs)))
+
+
+@pytest.mark.benchmark(group="eq")
+@pytest.mark.parametrize(("cls", "attr"), CLASSES)
+def test_eq(benchmark: Benchmark, cls: abc.Callable[[int], object], attr: str) -> None:
+    lhs = [cls(v) for v in range(N)]
+    rhs = [cls(v) for v in range(N)]
+    benchmark(lambda: [a == b for a, b in zip(lhs, rhs, strict=True)])
+
+
+@pytest.mark.benchmark(group="hash")
+@pytest.mark.parametrize(("cls", "attr"), CLASSES)
+def test_hash(benchmark: Benchmark, cls: abc.Callable[[int], object], attr: str) -> None:
+    objs = [cls(v) for v in range(N)]
+    benchmark(lambda: [hash(o) for o in objs])
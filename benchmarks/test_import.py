@@ -0,0 +1,49 @@
+"""Cold-start cost of importing `monads` modules, in fresh interpreters."""
+
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.conftest import Benchmark
+
+MODULES = ["monads", "monads.option", "monads.result", "monads.tools", "monads.all"]
+
+
+def _import(statement: str, /) -> str:
+    """Run `statement` in a fresh interpreter with `-X importtime`, returning its report."""
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return process.stderr
+
+
+def _cumulative_us(report: str, module: str, /) -> int:
+    """Find the time `module` took to import, its own imports included, in microseconds."""
+    for line in report.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+
+    msg = f"{module} not in the report"
+    raise LookupError(msg)
+
+
+@pytest.mark.benchmark(group="import")
+@pytest.mark.parametrize("module", MODULES)
+def test_import(benchmark: Benchmark, module: str) -> None:
+    report = _import(f"import {module}")
+    benchmark.extra_info["cumulative_us"] = _cumulative_us(report, module)  # pyright: ignore[reportFunctionMemberAccess]
+    benchmark.extra_info["modules"] = report.count("\n") - 1  # pyright: ignore[reportFunctionMemberAccess]
+    benchmark.pedantic(_import, (f"import {module}",), rounds=5)  # pyright: ignore[reportFunctionMemberAccess]
+
+
+def test_core_skips_optional_modules() -> None:
+    report = _import("from monads.all import Ok, Some, try_result")
+    imported = {line.split("|")[-1].strip() for line in report.splitlines()[1:]}
+    assert "attrs" not in imported
+    assert "traceback" not in imported
+    assert "monads.option" in imported
@@ -0,0 +1,37 @@
+"""Interned constructors against plain ones, in time and in allocations."""
+
+from collections import abc
+
+import pytest
+
+from benchmarks.conftest import Benchmark, retained
+from monads.intern import ok, some
+from monads.option import Some
+from monads.result import Ok
+
+N = 1000
+
+CONSTRUCTORS = [
+    pytest.param(Ok, id="Ok"),
+    pytest.param(ok, id="interned-ok"),
+    pytest.param(Some, id="Some"),
+    pytest.param(some, id="interned-some"),
+]
+
+
+@pytest.mark.benchmark(group="intern")
+@pytest.mark.parametrize("construct", CONSTRUCTORS)
+@pytest.mark.parametrize("value", [None, True, 0], ids=["None", "True", "0"])
+def test_construct(
+    benchmark: Benchmark, construct: abc.Callable[[object], object], value: object
+) -> None:
+    make = lambda: [construct(value) for _ in range(N)]  # noqa: E731
+    benchmark.extra_info["allocated_blocks"] = retained(make).blocks  # pyright: ignore[reportFunctionMemberAccess]
+    benchmark(make)
+
+
+def test_interned_allocations() -> None:
+    plain = retained(lambda: [Ok(None) for _ in range(N)]).blocks
+    interned = retained(lambda: [ok(None) for _ in range(N)]).blocks
+    # only the list remains with interning, against the list and `N` instances
+    assert interned < N <= plain
@@ -0,0 +1,40 @@
+"""`monads.iters` adaptors against `Some.__iter__` chaining and generator expressions."""
+
+import itertools
+
+import pytest
+
+from benchmarks.conftest import Benchmark
+from monads.iters import flatten_options, oks
+from monads.option import Null, Option, Some
+from monads.result import Err, Ok, Result
+
+N = 1000
+
+OPTIONS: list[Option[int]] = [Some(i) if i % 2 else Null.null for i in range(N)]
+RESULTS: list[Result[int, int]] = [Ok(i) if i % 2 else Err(i) for i in range(N)]
+
+
+@pytest.mark.benchmark(group="flatten-options")
+def test_flatten_options(benchmark: Benchmark) -> None:
+    benchmark(lambda: list(flatten_options(OPTIONS)))
+
+
+@pytest.mark.benchmark(group="flatten-options")
+def test_chain_from_iterable(benchmark: Benchmark) -> None:
+    benchmark(lambda: list(itertools.chain.from_iterable(OPTIONS)))
+
+
+@pytest.mark.benchmark(group="flatten-options")
+def test_generator_expression(benchmark: Benchmark) -> None:
+    benchmark(lambda: list(o.value for o in OPTIONS if o))  # noqa: C400
+
+
+@pytest.mark.benchmark(group="oks")
+def test_oks(benchmark: Benchmark) -> None:
+    benchmark(lambda: list(oks(RESULTS)))
+
+
+@pytest.mark.benchmark(group="oks")
+def test_oks_chain_from_iterable(benchmark: Benchmark) -> None:
+    benchmark(lambda: list(itertools.chain.from_iterable(RESULTS)))
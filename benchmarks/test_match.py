@@ -0,0 +1,83 @@
+"""Branching on the variant: `match`, truthiness, the `tag` and `dispatch`.
+
+Each benchmark sums over `N` results, all `Ok`, all `Err`, or alternating.
+"""
+
+import operator
+from collections import abc
+from typing import Any
+
+import pytest
+
+from benchmarks.conftest import Benchmark
+from monads.result import Err, Ok, Result
+
+N = 1000
+
+type Results = list[Result[int, int]]
+
+RESULTS: dict[str, Results] = {
+    "ok": [Ok(i) for i in range(N)],
+    "err": [Err(i) for i in range(N)],
+    "mixed": [Ok(i) if i % 2 else Err(i) for i in range(N)],
+}
+
+
+def _match(results: Results, /) -> int:
+    total = 0
+    for r in results:
+        match r:
+            case Ok(v):
+                total += v
+            case Err(e):
+                total -= e
+
+    return total
+
+
+def _bool(results: Results, /) -> int:
+    total = 0
+    for r in results:
+        if r:
+            total += r.ok_value
+        else:
+            total -= r.err_value
+
+    return total
+
+
+# `Any`, since type checkers narrow `Result` on truthiness, but not on the `tag`
+def _tag(results: list[Any], /) -> int:
+    total = 0
+    for r in results:
+        if r.tag == 1:
+            total += r.ok_value
+        else:
+            total -= r.err_value
+
+    return total
+
+
+def _dispatch(results: Results, /) -> int:
+    return sum(r.dispatch(operator.pos, operator.neg) for r in results)
+
+
+BRANCHES = [
+    pytest.param(_match, id="match"),
+    pytest.param(_bool, id="bool"),
+    pytest.param(_tag, id="tag"),
+    pytest.param(_dispatch, id="dispatch"),
+]
+
+
+@pytest.mark.benchmark(group="match")
+@pytest.mark.parametrize("branch", BRANCHES)
+@pytest.mark.parametrize("variants", list(RESULTS))
+def test_branch(benchmark: Benchmark, branch: abc.Callable[[Results], int], variants: str) -> None:
+    benchmark(branch, RESULTS[variants])
+
+
+@pytest.mark.parametrize("variants", list(RESULTS))
+def test_branches_agree(variants: str) -> None:
+    results = RESULTS[variants]
+    assert _match(results) == _bool(results) == _tag(results) == _dispatch(results)
@@ -0,0 +1,222 @@
+"""Every public method of `Some`, `Null`, `Ok` & `Err`, and the `monads.tools` helpers.
+
+Each benchmark calls the method on `N` instances; `extra_info` records the memory
+blocks its outputs keep alive per call, so `0` marks the methods returning an existing
+object (or nothing new). Compare runs across versions with pytest-benchmark's
+`--benchmark-autosave` and `--benchmark-compare`.
+"""
+
+import types
+from collections import abc
+from typing import Any
+
+import pytest
+
+from benchmarks.conftest import Benchmark, retained
+from monads.exceptions import UnwrapError
+from monads.option import Null, Some
+from monads.result import Err, Ok
+from monads.tools import (
+    collect_all_errors,
+    collect_options,
+    collect_results,
+    from_none,
+    from_none_many,
+    options_from_mapping,
+    partition_results,
+    stream_options,
+    stream_results,
+    try_option,
+    try_result,
+)
+
+N = 1000
+
+type Call = abc.Callable[[Any], object]
+
+DUNDERS = frozenset(
+    [
+        "__bool__",
+        "__eq__",
+        "__ge__",
+        "__gt__",
+        "__hash__",
+        "__iter__",
+        "__le__",
+        "__lt__",
+        "__repr__",
+    ]
+)
+
+
+def _identity(value: object, /) -> object:
+    return value
+
+
+def _raises(f: Call, /) -> Call:
+    def call(obj: object, /) -> object:
+        try:
+            return f(obj)
+
+        except UnwrapError:
+            return None
+
+    return call
+
+
+COMMON: dict[str, Call] = {
+    "__bool__": bool,
+    "__iter__": list,
+    "__repr__": repr,
+    "__gt__": lambda o: o > o,
+    "__ge__": lambda o: o >= o,
+    "__lt__": lambda o: o < o,
+    "__le__": lambda o: o <= o,
+    "inspect": lambda o: o.inspect(_identity),
+    "map": lambda o: o.map(_identity),
+    "map_or": lambda o: o.map_or(_identity, None),
+    "map_or_else": lambda o: o.map_or_else(_identity, object),
+    "unwrap_or": lambda o: o.unwrap_or(None),
+    "unwrap_or_else": lambda o: o.unwrap_or_else(object),
+}
+
+OPTION: dict[str, Call] = {
+    **COMMON,
+    "dispatch": lambda o: o.dispatch(_identity, object),
+    "flatten": lambda o: o.flatten(),
+    "is_null_or": lambda o: o.is_null_or(bool),
+    "is_some_and": lambda o: o.is_some_and(bool),
+    "map_into": lambda o: o.map_into(Some),
+    "ok_or": lambda o: o.ok_or(None),
+    "ok_or_else": lambda o: o.ok_or_else(object),
+    "xor": lambda o: o.xor(Null.null),
+}
+
+RESULT: dict[str, Call] = {
+    **COMMON,
+    "dispatch": lambda r: r.dispatch(_identity, _identity),
+    "err": lambda r: r.err(),
+    "inspect_err": lambda r: r.inspect_err(_identity),
+    "is_err_and": lambda r: r.is_err_and(bool),
+    "is_ok_and": lambda r: r.is_ok_and(bool),
+    "map_err": lambda r: r.map_err(_identity),
+    "map_err_into": lambda r: r.map_err_into(Err),
+    "map_into": lambda r: r.map_into(Ok),
+    "ok": lambda r: r.ok(),
+}
+
+VALUED: dict[str, Call] = {"__eq__": lambda o: o == o, "__hash__": hash}
+
+METHODS: dict[type, dict[str, Call]] = {
+    Some: {**OPTION, **VALUED, "unwrap": lambda o: o.unwrap()},
+    Null: {**OPTION, "unwrap": _raises(lambda o: o.unwrap())},
+    Ok: {
+        **RESULT,
+        **VALUED,
+        "unwrap": lambda r: r.unwrap(),
+        "unwrap_err": _raises(lambda r: r.unwrap_err()),
+    },
+    Err: {
+        **RESULT,
+        **VALUED,
+        "unwrap": _raises(lambda r: r.unwrap()),
+        "unwrap_err": lambda r: r.unwrap_err(),
+    },
+}
+
+
+def _instances(cls: type, /) -> list[Any]:
+    if cls is Null:
+        return [Null.null] * N
+
+    # nested, for `flatten`
+    return [cls(Some(i)) for i in range(N)]
+
+
+def _blocks_per_call(call: Call, objs: list[Any], /) -> float:
+    # minus the block of the output list itself
+    return (retained(lambda: [call(o) for o in objs]).blocks - 1) / len(objs)
+
+
+CASES = [
+    pytest.param(cls, call, id=f"{cls.__name__}.{name}")
+    for cls, methods in METHODS.items()
+    for name, call in methods.items()
+]
+
+
+@pytest.mark.benchmark(group="methods")
+@pytest.mark.parametrize(("cls", "call"), CASES)
+def test_method(benchmark: Benchmark, cls: type, call: Call) -> None:
+    objs = _instances(cls)
+    benchmark.extra_info["blocks_per_call"] = _blocks_per_call(call, objs)  # pyright: ignore[reportFunctionMemberAccess]
+    benchmark(lambda: [call(o) for o in objs])
+
+
+@pytest.mark.parametrize("cls", list(METHODS))
+def test_every_method_covered(cls: type) -> None:
+    public = {
+        name
+        for name, attr in vars(cls).items()
+        if callable(attr)
+        and not isinstance(attr, (type, types.MemberDescriptorType))
+        and (not name.startswith("_") or name in DUNDERS)
+    }
+    assert public <= METHODS[cls].keys()
+
+
+ALLOCATION_FREE = [
+    "Some.flatten",
+    "Some.inspect",
+    "Some.unwrap",
+    "Some.xor",
+    "Null.flatten",
+    "Null.inspect",
+    "Null.map",
+    "Null.map_into",
+    "Null.xor",
+    "Ok.inspect",
+    "Ok.inspect_err",
+    "Ok.map_err",
+    "Ok.map_err_into",
+    "Ok.unwrap",
+    "Err.inspect",
+    "Err.inspect_err",
+    "Err.map",
+    "Err.map_into",
+    "Err.unwrap_err",
+]
+
+
+@pytest.mark.parametrize("method", ALLOCATION_FREE)
+def test_allocation_free(method: str) -> None:
+    cls_name, name = method.split(".")
+    cls = next(cls for cls in METHODS if cls.__name__ == cls_name)
+    assert _blocks_per_call(METHODS[cls][name], _instances(cls)) < 0.01
+
+
+ROW = {i: i or None for i in range(N // 2)}
+
+TOOLS: dict[str, abc.Callable[[], object]] = {
+    "try_result": lambda: [try_result(int, ValueError, "1") for _ in range(N)],
+    "try_option": lambda: [try_option(int, ValueError, "1") for _ in range(N)],
+    "from_none": lambda: [from_none(i or None) for i in range(N)],
+    "from_none_many": lambda: from_none_many([i or None for i in range(N)]),
+    "options_from_mapping": lambda: options_from_mapping(ROW, range(N)),
+    "collect_options": lambda: collect_options(Some(i) for i in range(N)),
+    "collect_results": lambda: collect_results(Ok(i) for i in range(N)),
+    "collect_all_errors": lambda: collect_all_errors(Err(i) for i in range(N)),
+    "stream_options": lambda: list(stream_options(Some(i) for i in range(N))),
+    "stream_results": lambda: list(stream_results(Ok(i) for i in range(N))),
+    "partition_results": lambda: partition_results(
+        (Ok(i) if i % 2 else Err(i) for i in range(N)), _identity, _identity
+    ),
+}
+
+
+@pytest.mark.benchmark(group="tools")
+@pytest.mark.parametrize("run", [pytest.param(run, id=name) for name, run in TOOLS.items()])
+def test_tool(benchmark: Benchmark, run: abc.Callable[[], object]) -> None:
+    # each tool goes over `N` items
+    benchmark.extra_info["blocks_per_call"] = retained(run).blocks / N  # pyright: ignore[reportFunctionMemberAccess]
+    benchmark(run)
@@ -0,0 +1,37 @@
+"""Fused pipelines against chained combinator calls."""
+
+import pytest
+
+from benchmarks.conftest import Benchmark
+from monads.pipeline import ResultPipeline
+from monads.result import Err, Ok, Result
+
+N = 1000
+INPUTS: list[Result[int, str]] = [Ok(i) if i % 10 else Err("no") for i in range(N)]
+
+
+def _inc(v: int) -> int:
+    return v + 1
+
+
+def _check(v: int) -> Result[int, str]:
+    return Ok(v)
+
+
+PIPELINE = (
+    ResultPipeline[int, str]().map(_inc).map(_inc).map_into(_check).map(_inc).map_err(str.upper)
+)
+
+
+@pytest.mark.benchmark(group="pipeline")
+def test_chained(benchmark: Benchmark) -> None:
+    benchmark(
+        lambda: [
+            r.map(_inc).map(_inc).map_into(_check).map(_inc).map_err(str.upper) for r in INPUTS
+        ]
+    )
+
+
+@pytest.mark.benchmark(group="pipeline")
+def test_pipeline(benchmark: Benchmark) -> None:
+    benchmark(lambda: list(map(PIPELINE, INPUTS)))
@@ -0,0 +1,34 @@
+"""Round trips of a batch of `Result`s through pickle, JSON and MessagePack."""
+
+import json
+import pickle
+
+import pytest
+
+from benchmarks.conftest import Benchmark
+from monads import serde
+from monads.result import Err, Ok, Result
+
+N = 1000
+RESULTS: list[Result[int, str]] = [Ok(i) if i % 10 else Err("no") for i in range(N)]
+
+
+@pytest.mark.benchmark(group="serde")
+def test_pickle(benchmark: Benchmark) -> None:
+    benchmark(lambda: pickle.loads(pickle.dumps(RESULTS, pickle.HIGHEST_PROTOCOL)))
+
+
+@pytest.mark.benchmark(group="serde")
+def test_json(benchmark: Benchmark) -> None:
+    benchmark(lambda: serde.loads(serde.dumps(RESULTS)))
+
+
+@pytest.mark.benchmark(group="serde")
+def test_json_batch(benchmark: Benchmark) -> None:
+    benchmark(lambda: serde.from_tagged_many(json.loads(json.dumps(serde.to_tagged_many(RESULTS)))))
+
+
+@pytest.mark.benchmark(group="serde")
+def test_msgpack(benchmark: Benchmark) -> None:
+    serde_msgpack = pytest.importorskip("monads.serde_msgpack")
+    benchmark(lambda: serde_msgpack.unpackb(serde_msgpack.packb(RESULTS)))
@@ -0,0 +1,50 @@
+"""Memory kept alive by stored `Err`s, with and without their tracebacks."""
+
+from collections import abc
+
+import pytest
+
+from benchmarks.conftest import Benchmark, retained
+from monads.result import Result
+from monads.tools import drop_traceback, summarize_traceback, try_result
+
+N = 1000
+
+HANDLERS = [
+    pytest.param(None, id="keep"),
+    pytest.param(drop_traceback, id="drop"),
+    pytest.param(summarize_traceback, id="summary"),
+]
+
+
+def _load(row: int, /) -> int:
+    # a frame local that the traceback keeps alive, like a parsed batch would be
+    buffer = bytearray(1024)
+    return int(f"row {row}") + len(buffer)
+
+
+def _run(handler: abc.Callable[[BaseException], object] | None, /) -> list[Result[int, ValueError]]:
+    results = [try_result(_load, ValueError, row) for row in range(N)]
+    if handler is not None:
+        for r in results:
+            r.inspect_err(handler)
+
+    return results
+
+
+@pytest.mark.benchmark(group="traceback")
+@pytest.mark.parametrize("handler", HANDLERS)
+def test_store_errs(
+    benchmark: Benchmark, handler: abc.Callable[[BaseException], object] | None
+) -> None:
+    benchmark.extra_info["retained_bytes"] = retained(lambda: _run(handler)).size  # pyright: ignore[reportFunctionMemberAccess]
+    benchmark(_run, handler)
+
+
+def test_retention() -> None:
+    kept = retained(lambda: _run(None)).size
+    dropped = retained(lambda: _run(drop_traceback)).size
+    summarized = retained(lambda: _run(summarize_traceback)).size
+    # each kept traceback holds on to a 1 KiB local
+    assert dropped < summarized < kept
+    assert kept - dropped > N * 1024
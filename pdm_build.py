@@ -0,0 +1,19 @@
+"""Build hook compiling the optional `monads._speedups` extension.
+
+Set `MONADS_NO_EXTENSIONS=1` to build a pure-Python distribution. A failing
+compilation falls back to the pure-Python implementation as well.
+"""
+
+import os
+from typing import Any
+
+from setuptools import Extension
+
+
+def pdm_build_update_setup_kwargs(context: Any, setup_kwargs: dict[str, Any]) -> None:  # noqa: ANN401
+    if os.environ.get("MONADS_NO_EXTENSIONS"):
+        return
+
+    setup_kwargs["ext_modules"] = [
+        Extension("monads._speedups", ["src/monads/_speedups.c"], optional=True)
+    ]
@@ -3,4 +3,39 @@
 Copyright (c) 2024-present Eneg
 """
 
+import importlib
+from types import ModuleType
+
 __version__ = "0.1.3"
+
+# importing the package alone loads none of them; `monads.<name>` imports one on first access
+_SUBMODULES = frozenset(
+    [
+        "aio",
+        "all",
+        "arrays",
+        "cache",
+        "circuit",
+        "decorators",
+        "exceptions",
+        "instrument",
+        "intern",
+        "iters",
+        "option",
+        "parallel",
+        "pipeline",
+        "result",
+        "retry",
+        "serde",
+        "serde_msgpack",
+        "tools",
+    ]
+)
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in _SUBMODULES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    return importlib.import_module(f"{__name__}.{name}")
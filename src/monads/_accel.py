@@ -0,0 +1,22 @@
+"""Loading of the optional C speedups.
+
+Copyright (c) 2024-present Eneg
+"""
+
+import os
+from types import ModuleType
+
+__all__ = ("load_speedups",)
+
+
+def load_speedups() -> ModuleType | None:
+    """Import `monads._speedups`, unless unavailable or disabled via `MONADS_NO_SPEEDUPS`."""
+    if os.environ.get("MONADS_NO_SPEEDUPS"):
+        return None
+
+    try:
+        from monads import _speedups  # noqa: PLC0415
+    except ImportError:
+        return None
+
+    return _speedups
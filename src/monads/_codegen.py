@@ -0,0 +1,39 @@
+"""Source generation for functions specialized at runtime.
+
+Copyright (c) 2024-present Eneg
+"""
+
+import os
+from typing import Any
+
+__all__ = ("Codegen",)
+
+# inside the package, so that `monads.instrument` looks past the generated frames
+_FILENAME = os.path.join(os.path.dirname(__file__), "<generated>")  # noqa: PTH118, PTH120
+
+
+class Codegen:
+    """Builds the source of a function line by line, and compiles it.
+
+    Generating the code once, like `attrs` does for `__init__`, leaves no dispatch
+    at call time: each step is a direct call on a local or a global.
+    """
+
+    def __init__(self, namespace: dict[str, object]) -> None:
+        self.namespace = namespace
+        self.lines: list[str] = []
+
+    def name(self, obj: object, /) -> str:
+        """Add `obj` to the globals of the generated code, and return its name."""
+        name = f"_f{len(self.namespace)}"
+        self.namespace[name] = obj
+        return name
+
+    def emit(self, indent: int, line: str, /) -> None:
+        self.lines.append("    " * indent + line)
+
+    def compile(self, name: str, /) -> Any:  # noqa: ANN401
+        """Execute the source, and return the object it defined under `name`."""
+        code = compile("\n".join(self.lines), _FILENAME, "exec")
+        exec(code, self.namespace)  # noqa: S102
+        return self.namespace[name]
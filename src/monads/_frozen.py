@@ -0,0 +1,28 @@
+"""Helpers for hand-written frozen, slotted classes.
+
+Copyright (c) 2024-present Eneg
+"""
+
+from typing import Any, Never
+
+__all__ = ("frozen_delattr", "frozen_setattr", "slot_setter")
+
+
+def frozen_setattr(self: object, name: str, value: object, /) -> Never:
+    msg = f"cannot assign to field {name!r} of frozen {type(self).__name__!r}"
+    raise AttributeError(msg)
+
+
+def frozen_delattr(self: object, name: str, /) -> Never:
+    msg = f"cannot delete field {name!r} of frozen {type(self).__name__!r}"
+    raise AttributeError(msg)
+
+
+def slot_setter(cls: type, name: str, /) -> Any:  # noqa: ANN401
+    """Return the raw `__set__` of a slot, bypassing the frozen `__setattr__`.
+
+    Calling the member descriptor directly is the cheapest way to initialize a slot
+    from Python; `object.__setattr__(self, name, value)` pays for an attribute lookup
+    and a name resolution on every call.
+    """
+    return vars(cls)[name].__set__
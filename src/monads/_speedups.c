@@ -0,0 +1,700 @@
+/* Optional C implementation of the hot `Option`/`Result` methods.
+ *
+ * The classes themselves stay defined in `monads.option` and `monads.result`;
+ * `install_option` / `install_result` replace a handful of their methods with
+ * method descriptors bound to the functions below. Every function mirrors its
+ * pure-Python counterpart exactly, including the order in which operands are
+ * evaluated, so the two implementations are interchangeable.
+ *
+ * `run_result_block` / `run_option_block` drive the generators of
+ * `monads.decorators.result_block` / `option_block`; `PyIter_Send` reports the
+ * generator's return without raising `StopIteration`.
+ *
+ * `from_none_many` converts a whole sequence of `T | None` into `Option`s,
+ * allocating the `Some`s directly rather than calling the class per element.
+ *
+ * `call_constructors` makes every allocation go through the class instead,
+ * so that constructors patched by `monads.instrument` see each instance.
+ *
+ * Copyright (c) 2024-present Eneg
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+/* A variant with a single slot holding its payload. */
+typedef struct {
+    PyTypeObject *type;
+    PyObject *attr;
+    Py_ssize_t offset;
+} variant;
+
+static variant Some = {NULL, NULL, 0};
+static variant Ok = {NULL, NULL, 0};
+static variant Err = {NULL, NULL, 0};
+
+/* Whether `wrap` calls the class rather than allocating instances directly. */
+static int construct = 0;
+
+#define SLOT(obj, v) (*(PyObject **)((char *)(obj) + (v)->offset))
+
+/* Return a new reference to the payload, or raise like an unset slot would. */
+static PyObject *
+get_value(PyObject *obj, variant *v)
+{
+    PyObject *value = SLOT(obj, v);
+
+    if (value == NULL) {
+        PyErr_Format(PyExc_AttributeError, "'%s' object has no attribute '%U'",
+                     Py_TYPE(obj)->tp_name, v->attr);
+        return NULL;
+    }
+    return Py_NewRef(value);
+}
+
+/* Allocate an instance of the variant holding `value`; steals the reference. */
+static PyObject *
+wrap(variant *v, PyObject *value)
+{
+    PyObject *obj;
+
+    if (value == NULL) {
+        return NULL;
+    }
+    if (construct) {
+        obj = PyObject_CallOneArg((PyObject *)v->type, value);
+        Py_DECREF(value);
+        return obj;
+    }
+    obj = v->type->tp_alloc(v->type, 0);
+    if (obj == NULL) {
+        Py_DECREF(value);
+        return NULL;
+    }
+    SLOT(obj, v) = value;
+    return obj;
+}
+
+/* Parse `(f, /, default)` of `map_or`; `default` may be passed by keyword. */
+static int
+parse_map_or(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames,
+             PyObject **f, PyObject **dflt)
+{
+    Py_ssize_t nkw = kwnames == NULL ? 0 : PyTuple_GET_SIZE(kwnames);
+
+    if (nkw == 0 && nargs == 2) {
+        *f = args[0];
+        *dflt = args[1];
+        return 0;
+    }
+    if (nkw == 1 && nargs == 1
+        && PyUnicode_EqualToUTF8(PyTuple_GET_ITEM(kwnames, 0), "default"))
+    {
+        *f = args[0];
+        *dflt = args[1];
+        return 0;
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "map_or() takes a positional argument 'f' and an argument 'default'");
+    return -1;
+}
+
+/* `self.<attr> <op> other.<attr>`, or `otherwise` depending on `bool(other)`. */
+static PyObject *
+compare(PyObject *self, PyObject *other, variant *v, int op,
+        int compare_if_truthy, PyObject *otherwise)
+{
+    PyObject *lhs, *rhs, *res;
+    int truthy = PyObject_IsTrue(other);
+
+    if (truthy < 0) {
+        return NULL;
+    }
+    if (truthy != compare_if_truthy) {
+        return Py_NewRef(otherwise);
+    }
+    lhs = get_value(self, v);
+    if (lhs == NULL) {
+        return NULL;
+    }
+    rhs = PyObject_GetAttr(other, v->attr);
+    if (rhs == NULL) {
+        Py_DECREF(lhs);
+        return NULL;
+    }
+    res = PyObject_RichCompare(lhs, rhs, op);
+    Py_DECREF(lhs);
+    Py_DECREF(rhs);
+    return res;
+}
+
+/* Methods shared by the variants holding a value. */
+
+#define VALUE_METHODS(name, v)                                                 \
+    static PyObject *                                                          \
+    name##_eq(PyObject *self, PyObject *other)                                 \
+    {                                                                          \
+        PyObject *lhs, *rhs, *res;                                             \
+                                                                               \
+        if (Py_TYPE(other) != (v)->type) {                                     \
+            Py_RETURN_NOTIMPLEMENTED;                                          \
+        }                                                                      \
+        if ((lhs = get_value(self, v)) == NULL) {                              \
+            return NULL;                                                       \
+        }                                                                      \
+        if ((rhs = get_value(other, v)) == NULL) {                             \
+            Py_DECREF(lhs);                                                    \
+            return NULL;                                                       \
+        }                                                                      \
+        res = PyObject_RichCompare(lhs, rhs, Py_EQ);                           \
+        Py_DECREF(lhs);                                                        \
+        Py_DECREF(rhs);                                                        \
+        return res;                                                            \
+    }                                                                          \
+                                                                               \
+    static PyObject *                                                          \
+    name##_hash(PyObject *self, PyObject *Py_UNUSED(ignored))                  \
+    {                                                                          \
+        Py_hash_t hash;                                                        \
+        PyObject *value, *key;                                                 \
+                                                                               \
+        if ((value = get_value(self, v)) == NULL) {                            \
+            return NULL;                                                       \
+        }                                                                      \
+        key = PyTuple_Pack(2, (PyObject *)(v)->type, value);                   \
+        Py_DECREF(value);                                                      \
+        if (key == NULL) {                                                     \
+            return NULL;                                                       \
+        }                                                                      \
+        hash = PyObject_Hash(key);                                             \
+        Py_DECREF(key);                                                        \
+        return hash == -1 ? NULL : PyLong_FromSsize_t(hash);                   \
+    }
+
+VALUE_METHODS(some, &Some)
+VALUE_METHODS(ok, &Ok)
+VALUE_METHODS(err, &Err)
+
+/* Methods applying `f` to the payload: `Some` and `Ok`. */
+
+#define MAPPING_METHODS(name, v)                                               \
+    static PyObject *                                                          \
+    name##_map(PyObject *self, PyObject *f)                                    \
+    {                                                                          \
+        PyObject *value, *res;                                                 \
+                                                                               \
+        if ((value = get_value(self, v)) == NULL) {                            \
+            return NULL;                                                       \
+        }                                                                      \
+        res = PyObject_CallOneArg(f, value);                                   \
+        Py_DECREF(value);                                                      \
+        return wrap(v, res);                                                   \
+    }                                                                          \
+                                                                               \
+    static PyObject *                                                          \
+    name##_map_into(PyObject *self, PyObject *f)                               \
+    {                                                                          \
+        PyObject *value, *res;                                                 \
+                                                                               \
+        if ((value = get_value(self, v)) == NULL) {                            \
+            return NULL;                                                       \
+        }                                                                      \
+        res = PyObject_CallOneArg(f, value);                                   \
+        Py_DECREF(value);                                                      \
+        return res;                                                            \
+    }                                                                          \
+                                                                               \
+    static PyObject *                                                          \
+    name##_map_or(PyObject *self, PyObject *const *args, Py_ssize_t nargs,     \
+                  PyObject *kwnames)                                           \
+    {                                                                          \
+        PyObject *f, *dflt, *value, *res;                                      \
+                                                                               \
+        if (parse_map_or(args, nargs, kwnames, &f, &dflt) < 0) {               \
+            return NULL;                                                       \
+        }                                                                      \
+        if ((value = get_value(self, v)) == NULL) {                            \
+            return NULL;                                                       \
+        }                                                                      \
+        res = PyObject_CallOneArg(f, value);                                   \
+        Py_DECREF(value);                                                      \
+        return res;                                                            \
+    }                                                                          \
+                                                                               \
+    static PyObject *                                                          \
+    name##_unwrap_or(PyObject *self, PyObject *Py_UNUSED(dflt))                \
+    {                                                                          \
+        return get_value(self, v);                                             \
+    }                                                                          \
+                                                                               \
+    static PyObject *                                                          \
+    name##_bool(PyObject *Py_UNUSED(self), PyObject *Py_UNUSED(ignored))       \
+    {                                                                          \
+        Py_RETURN_TRUE;                                                        \
+    }
+
+MAPPING_METHODS(some, &Some)
+MAPPING_METHODS(ok, &Ok)
+
+/* Methods ignoring `f` and returning `self` or the default: `Null` and `Err`. */
+
+static PyObject *
+return_self(PyObject *self, PyObject *Py_UNUSED(f))
+{
+    return Py_NewRef(self);
+}
+
+static PyObject *
+return_default(PyObject *Py_UNUSED(self), PyObject *dflt)
+{
+    return Py_NewRef(dflt);
+}
+
+static PyObject *
+return_false(PyObject *Py_UNUSED(self), PyObject *Py_UNUSED(ignored))
+{
+    Py_RETURN_FALSE;
+}
+
+static PyObject *
+map_or_default(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs,
+               PyObject *kwnames)
+{
+    PyObject *f, *dflt;
+
+    if (parse_map_or(args, nargs, kwnames, &f, &dflt) < 0) {
+        return NULL;
+    }
+    return Py_NewRef(dflt);
+}
+
+/* `dispatch(on_value, on_other, /)`: call the handler at `index` with the payload. */
+
+static int
+check_dispatch(Py_ssize_t nargs)
+{
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError, "dispatch() takes exactly 2 arguments (%zd given)",
+                     nargs);
+        return -1;
+    }
+    return 0;
+}
+
+#define DISPATCH(name, v, index)                                               \
+    static PyObject *                                                          \
+    name##_dispatch(PyObject *self, PyObject *const *args, Py_ssize_t nargs)   \
+    {                                                                          \
+        PyObject *value, *res;                                                 \
+                                                                               \
+        if (check_dispatch(nargs) < 0) {                                       \
+            return NULL;                                                       \
+        }                                                                      \
+        if ((value = get_value(self, v)) == NULL) {                            \
+            return NULL;                                                       \
+        }                                                                      \
+        res = PyObject_CallOneArg(args[index], value);                         \
+        Py_DECREF(value);                                                      \
+        return res;                                                            \
+    }
+
+DISPATCH(some, &Some, 0)
+DISPATCH(ok, &Ok, 0)
+DISPATCH(err, &Err, 1)
+
+static PyObject *
+null_dispatch(PyObject *Py_UNUSED(self), PyObject *const *args, Py_ssize_t nargs)
+{
+    if (check_dispatch(nargs) < 0) {
+        return NULL;
+    }
+    return PyObject_CallNoArgs(args[1]);
+}
+
+/* Rich comparisons; see the pure-Python methods for the semantics. */
+
+#define COMPARISON(name, v, dunder, op, compare_if_truthy, otherwise)          \
+    static PyObject *                                                          \
+    name##_##dunder(PyObject *self, PyObject *other)                           \
+    {                                                                          \
+        return compare(self, other, v, op, compare_if_truthy, otherwise);     \
+    }
+
+COMPARISON(some, &Some, gt, Py_GT, 1, Py_True)
+COMPARISON(some, &Some, ge, Py_GE, 1, Py_True)
+COMPARISON(some, &Some, lt, Py_LT, 1, Py_False)
+COMPARISON(some, &Some, le, Py_LE, 1, Py_False)
+COMPARISON(ok, &Ok, gt, Py_GT, 1, Py_False)
+COMPARISON(ok, &Ok, ge, Py_GE, 1, Py_False)
+COMPARISON(ok, &Ok, lt, Py_LT, 1, Py_True)
+COMPARISON(ok, &Ok, le, Py_LE, 1, Py_True)
+COMPARISON(err, &Err, gt, Py_GT, 0, Py_True)
+COMPARISON(err, &Err, ge, Py_GE, 0, Py_True)
+COMPARISON(err, &Err, lt, Py_LT, 0, Py_False)
+COMPARISON(err, &Err, le, Py_LE, 0, Py_False)
+
+static PyObject *
+null_gt(PyObject *Py_UNUSED(self), PyObject *Py_UNUSED(other))
+{
+    Py_RETURN_FALSE;
+}
+
+static PyObject *
+null_ge(PyObject *Py_UNUSED(self), PyObject *other)
+{
+    int truthy = PyObject_IsTrue(other);
+
+    return truthy < 0 ? NULL : PyBool_FromLong(!truthy);
+}
+
+static PyObject *
+null_lt(PyObject *Py_UNUSED(self), PyObject *other)
+{
+    int truthy = PyObject_IsTrue(other);
+
+    return truthy < 0 ? NULL : PyBool_FromLong(truthy);
+}
+
+static PyObject *
+null_le(PyObject *Py_UNUSED(self), PyObject *Py_UNUSED(other))
+{
+    Py_RETURN_TRUE;
+}
+
+/* Method tables installed onto the Python classes.
+ *
+ * Each docstring carries the text signature of the pure-Python method, followed
+ * by its docstring, if any, so that `inspect` sees no difference.
+ */
+
+#define FASTCALL_KW (METH_FASTCALL | METH_KEYWORDS)
+
+/* The text signature of `name`, then its docstring. */
+#define DOC(name, params, doc) PyDoc_STR(name "(" params ")\n--\n\n" doc)
+#define SIG(name, params) DOC(name, params, "")
+
+#define SOME_DISPATCH_DOC                                                      \
+    "Call `on_some` with the value of a `Some`, or `on_null` for `Null`.\n"    \
+    "\n"                                                                       \
+    "A fold over the variants in a single method call, without `isinstance` "  \
+    "checks:\n"                                                                \
+    "```\n"                                                                    \
+    "label = option.dispatch(str, lambda: \"n/a\")\n"                          \
+    "```\n"
+
+#define OK_DISPATCH_DOC                                                        \
+    "Call `on_ok` with the value of an `Ok`, or `on_err` with the error of "   \
+    "an `Err`.\n"                                                              \
+    "\n"                                                                       \
+    "A fold over the variants in a single method call, without `isinstance` "  \
+    "checks:\n"                                                                \
+    "```\n"                                                                    \
+    "response = result.dispatch(render, error_page)\n"                         \
+    "```\n"
+
+#define COMPARISON_ENTRIES(name)                                               \
+    {"__gt__", (PyCFunction)name##_gt, METH_O, SIG("__gt__", "$self, other, /")}, \
+    {"__ge__", (PyCFunction)name##_ge, METH_O, SIG("__ge__", "$self, other, /")}, \
+    {"__lt__", (PyCFunction)name##_lt, METH_O, SIG("__lt__", "$self, other, /")}, \
+    {"__le__", (PyCFunction)name##_le, METH_O, SIG("__le__", "$self, other, /")}
+
+#define VALUE_ENTRIES(name)                                                    \
+    {"__eq__", (PyCFunction)name##_eq, METH_O, SIG("__eq__", "$self, other, /")}, \
+    {"__hash__", (PyCFunction)name##_hash, METH_NOARGS, SIG("__hash__", "$self")}, \
+    COMPARISON_ENTRIES(name)
+
+#define MAPPING_ENTRIES(name)                                                  \
+    {"map", (PyCFunction)name##_map, METH_O, SIG("map", "$self, f, /")},      \
+    {"map_into", (PyCFunction)name##_map_into, METH_O,                        \
+     SIG("map_into", "$self, f, /")},                                         \
+    {"map_or", (PyCFunction)(void (*)(void))name##_map_or, FASTCALL_KW,       \
+     SIG("map_or", "$self, f, /, default")},                                  \
+    {"unwrap_or", (PyCFunction)name##_unwrap_or, METH_O,                      \
+     SIG("unwrap_or", "$self, default, /")},                                  \
+    {"__bool__", (PyCFunction)name##_bool, METH_NOARGS, SIG("__bool__", "$self")}
+
+#define RETURN_SELF_ENTRY(method)                                              \
+    {method, (PyCFunction)return_self, METH_O, SIG(method, "$self, f, /")}
+
+#define DEFAULT_ENTRIES                                                        \
+    {"map_or", (PyCFunction)(void (*)(void))map_or_default, FASTCALL_KW,      \
+     SIG("map_or", "$self, f, /, default")},                                  \
+    {"unwrap_or", (PyCFunction)return_default, METH_O,                        \
+     SIG("unwrap_or", "$self, default, /")},                                  \
+    {"__bool__", (PyCFunction)return_false, METH_NOARGS, SIG("__bool__", "$self")}
+
+#define DISPATCH_ENTRY(name, params, doc)                                      \
+    {"dispatch", (PyCFunction)(void (*)(void))name##_dispatch, METH_FASTCALL, \
+     DOC("dispatch", "$self, " params ", /", doc)}
+
+static PyMethodDef some_methods[] = {
+    VALUE_ENTRIES(some),
+    MAPPING_ENTRIES(some),
+    DISPATCH_ENTRY(some, "on_some, on_null", SOME_DISPATCH_DOC),
+    {NULL, NULL, 0, NULL},
+};
+
+static PyMethodDef null_methods[] = {
+    RETURN_SELF_ENTRY("map"),
+    RETURN_SELF_ENTRY("map_into"),
+    DEFAULT_ENTRIES,
+    DISPATCH_ENTRY(null, "on_some, on_null", ""),
+    COMPARISON_ENTRIES(null),
+    {NULL, NULL, 0, NULL},
+};
+
+static PyMethodDef ok_methods[] = {
+    VALUE_ENTRIES(ok),
+    MAPPING_ENTRIES(ok),
+    DISPATCH_ENTRY(ok, "on_ok, on_err", OK_DISPATCH_DOC),
+    RETURN_SELF_ENTRY("map_err"),
+    RETURN_SELF_ENTRY("map_err_into"),
+    {NULL, NULL, 0, NULL},
+};
+
+static PyMethodDef err_methods[] = {
+    VALUE_ENTRIES(err),
+    RETURN_SELF_ENTRY("map"),
+    RETURN_SELF_ENTRY("map_into"),
+    DEFAULT_ENTRIES,
+    DISPATCH_ENTRY(err, "on_ok, on_err", ""),
+    {NULL, NULL, 0, NULL},
+};
+
+/* Blocks */
+
+/* Send the payloads of the `v` instances yielded by `gen` back into it.
+ *
+ * Return the generator's return value wrapped in `v`; or close the generator
+ * and return the first yielded object that is not a `v` instance.
+ */
+static PyObject *
+run_block(PyObject *gen, variant *v)
+{
+    PyObject *sent = Py_NewRef(Py_None), *yielded, *closed;
+    PySendResult rc;
+
+    if (v->type == NULL) {
+        PyErr_SetString(PyExc_RuntimeError, "variant classes are not installed");
+        Py_DECREF(sent);
+        return NULL;
+    }
+    for (;;) {
+        rc = PyIter_Send(gen, sent, &yielded);
+        Py_DECREF(sent);
+        if (rc == PYGEN_ERROR) {
+            return NULL;
+        }
+        if (rc == PYGEN_RETURN) {
+            return wrap(v, yielded);
+        }
+        if (!Py_IS_TYPE(yielded, v->type)) {
+            break;
+        }
+        sent = get_value(yielded, v);
+        Py_DECREF(yielded);
+        if (sent == NULL) {
+            return NULL;
+        }
+    }
+    if ((closed = PyObject_CallMethod(gen, "close", NULL)) == NULL) {
+        Py_DECREF(yielded);
+        return NULL;
+    }
+    Py_DECREF(closed);
+    return yielded;
+}
+
+static PyObject *
+run_result_block(PyObject *Py_UNUSED(module), PyObject *gen)
+{
+    return run_block(gen, &Ok);
+}
+
+static PyObject *
+run_option_block(PyObject *Py_UNUSED(module), PyObject *gen)
+{
+    return run_block(gen, &Some);
+}
+
+/* Bulk conversion */
+
+/* `[null if v is None else Some(v) for v in it]`, without calling `Some`. */
+static PyObject *
+from_none_many(PyObject *Py_UNUSED(module), PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *seq, *out, *item, *option;
+    Py_ssize_t i, n;
+
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError,
+                     "from_none_many() takes exactly 2 arguments (%zd given)", nargs);
+        return NULL;
+    }
+    if (Some.type == NULL) {
+        PyErr_SetString(PyExc_RuntimeError, "variant classes are not installed");
+        return NULL;
+    }
+    if ((seq = PySequence_Fast(args[0], "from_none_many() expects an iterable")) == NULL) {
+        return NULL;
+    }
+    n = PySequence_Fast_GET_SIZE(seq);
+    if ((out = PyList_New(n)) == NULL) {
+        Py_DECREF(seq);
+        return NULL;
+    }
+    for (i = 0; i < n; i++) {
+        item = PySequence_Fast_GET_ITEM(seq, i);
+        option = item == Py_None ? Py_NewRef(args[1]) : wrap(&Some, Py_NewRef(item));
+        if (option == NULL) {
+            Py_DECREF(out);
+            Py_DECREF(seq);
+            return NULL;
+        }
+        PyList_SET_ITEM(out, i, option);
+    }
+    Py_DECREF(seq);
+    return out;
+}
+
+/* Instrumentation */
+
+static PyObject *
+call_constructors(PyObject *Py_UNUSED(module), PyObject *flag)
+{
+    int rc = PyObject_IsTrue(flag);
+
+    if (rc < 0) {
+        return NULL;
+    }
+    construct = rc;
+    Py_RETURN_NONE;
+}
+
+/* Installation */
+
+static int
+bind_variant(variant *v, PyObject *type, const char *attr)
+{
+    PyObject *name, *descr;
+    PyMemberDef *member;
+
+    if ((name = PyUnicode_InternFromString(attr)) == NULL) {
+        return -1;
+    }
+    if ((descr = PyObject_GetAttr(type, name)) == NULL) {
+        Py_DECREF(name);
+        return -1;
+    }
+    if (!Py_IS_TYPE(descr, &PyMemberDescr_Type)
+        || (member = ((PyMemberDescrObject *)descr)->d_member)->type != Py_T_OBJECT_EX)
+    {
+        PyErr_Format(PyExc_TypeError, "%R.%U is not an object slot", type, name);
+        Py_DECREF(descr);
+        Py_DECREF(name);
+        return -1;
+    }
+    Py_XSETREF(v->type, (PyTypeObject *)Py_NewRef(type));
+    Py_XSETREF(v->attr, name);
+    v->offset = member->offset;
+    Py_DECREF(descr);
+    return 0;
+}
+
+static int
+install_methods(PyObject *type, PyMethodDef *methods)
+{
+    PyMethodDef *def;
+    PyObject *descr;
+    int rc;
+
+    for (def = methods; def->ml_name != NULL; def++) {
+        if ((descr = PyDescr_NewMethod((PyTypeObject *)type, def)) == NULL) {
+            return -1;
+        }
+        rc = PyObject_SetAttrString(type, def->ml_name, descr);
+        Py_DECREF(descr);
+        if (rc < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+static int
+check_classes(const char *func, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError, "%s() takes exactly 2 arguments (%zd given)",
+                     func, nargs);
+        return -1;
+    }
+    if (!PyType_Check(args[0]) || !PyType_Check(args[1])) {
+        PyErr_Format(PyExc_TypeError, "%s() expects two classes", func);
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+install_option(PyObject *Py_UNUSED(module), PyObject *const *args, Py_ssize_t nargs)
+{
+    if (check_classes("install_option", args, nargs) < 0
+        || bind_variant(&Some, args[0], "value") < 0
+        || install_methods(args[0], some_methods) < 0
+        || install_methods(args[1], null_methods) < 0)
+    {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+install_result(PyObject *Py_UNUSED(module), PyObject *const *args, Py_ssize_t nargs)
+{
+    if (check_classes("install_result", args, nargs) < 0
+        || bind_variant(&Ok, args[0], "ok_value") < 0
+        || bind_variant(&Err, args[1], "err_value") < 0
+        || install_methods(args[0], ok_methods) < 0
+        || install_methods(args[1], err_methods) < 0)
+    {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef module_methods[] = {
+    {"install_option", (PyCFunction)(void (*)(void))install_option, METH_FASTCALL,
+     PyDoc_STR("install_option(Some, Null, /)\n--\n\n"
+               "Replace the hot methods of `Some` and `Null` with C implementations.")},
+    {"install_result", (PyCFunction)(void (*)(void))install_result, METH_FASTCALL,
+     PyDoc_STR("install_result(Ok, Err, /)\n--\n\n"
+               "Replace the hot methods of `Ok` and `Err` with C implementations.")},
+    {"run_result_block", (PyCFunction)run_result_block, METH_O,
+     PyDoc_STR("run_result_block(gen, /)\n--\n\n"
+               "Drive the generator of a `result_block`.")},
+    {"run_option_block", (PyCFunction)run_option_block, METH_O,
+     PyDoc_STR("run_option_block(gen, /)\n--\n\n"
+               "Drive the generator of an `option_block`.")},
+    {"from_none_many", (PyCFunction)(void (*)(void))from_none_many, METH_FASTCALL,
+     PyDoc_STR("from_none_many(it, null, /)\n--\n\n"
+               "Turn an iterable of `T | None` into a list of `Some[T]` & `null`.")},
+    {"call_constructors", (PyCFunction)call_constructors, METH_O,
+     PyDoc_STR("call_constructors(flag, /)\n--\n\n"
+               "Create instances by calling their class, not by allocating them.")},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "monads._speedups",
+    .m_doc = "C implementation of the hot `Option` & `Result` methods, blocks & conversions.",
+    .m_size = -1,
+    .m_methods = module_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    return PyModule_Create(&speedups_module);
+}
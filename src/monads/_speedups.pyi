@@ -0,0 +1,10 @@
+from collections.abc import Generator, Iterable
+
+from monads.option import Null, Option
+
+def install_option(some: type, null: type, /) -> None: ...
+def install_result(ok: type, err: type, /) -> None: ...
+def run_result_block(gen: Generator[object, object, object], /) -> object: ...
+def run_option_block(gen: Generator[object, object, object], /) -> object: ...
+def from_none_many[T](it: Iterable[T | None], null: Null[T], /) -> list[Option[T]]: ...
+def call_constructors(flag: bool, /) -> None: ...
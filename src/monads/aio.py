@@ -0,0 +1,352 @@
+"""`asyncio`-aware tools for `Option` & `Result`.
+
+Copyright (c) 2024-present Eneg
+"""
+
+import asyncio
+import functools
+import itertools
+from collections import abc
+from inspect import isawaitable
+from typing import Any, cast, final, overload
+
+import attrs
+
+from monads.option import Null, Option, Some
+from monads.result import Err, Ok, Result
+
+__all__ = (
+    "AsyncOption",
+    "AsyncResult",
+    "gather_options",
+    "gather_results",
+    "map_async",
+    "map_err_async",
+    "map_into_async",
+    "try_option_async",
+    "try_result_async",
+)
+
+type _MaybeAwaitable[T] = T | abc.Awaitable[T]
+
+
+async def _resolve[T](value: _MaybeAwaitable[T], /) -> T:
+    if isawaitable(value):
+        return await cast("abc.Awaitable[T]", value)
+
+    return cast("T", value)
+
+
+async def map_async[T, E, U](
+    result: Result[T, E], f: abc.Callable[[T], abc.Awaitable[U]], /
+) -> Result[U, E]:
+    """`Result.map` taking a coroutine function."""
+    if not result:
+        return Err(result.err_value)
+
+    return Ok(await f(result.ok_value))
+
+
+async def map_into_async[T, E, U, F](
+    result: Result[T, E], f: abc.Callable[[T], abc.Awaitable[Result[U, F]]], /
+) -> Result[U, E | F]:
+    """`Result.map_into` taking a coroutine function."""
+    if not result:
+        return Err(result.err_value)
+
+    return await f(result.ok_value)
+
+
+async def map_err_async[T, E, F](
+    result: Result[T, E], f: abc.Callable[[E], abc.Awaitable[F]], /
+) -> Result[T, F]:
+    """`Result.map_err` taking a coroutine function."""
+    if result:
+        return Ok(result.ok_value)
+
+    return Err(await f(result.err_value))
+
+
+async def _try_result[ExcT: BaseException, **P, T](
+    f: abc.Callable[P, abc.Awaitable[T]],
+    exc: type[ExcT] | tuple[type[ExcT], ...],
+    /,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> Result[T, ExcT]:
+    try:
+        return Ok(await f(*args, **kwargs))
+
+    except exc as err:
+        return Err(err)
+
+
+async def _try_option[**P, T](
+    f: abc.Callable[P, abc.Awaitable[T]],
+    exc: type[BaseException] | tuple[type[BaseException], ...],
+    /,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> Option[T]:
+    try:
+        return Some(await f(*args, **kwargs))
+
+    except exc:
+        return Null.null
+
+
+def try_result_async[ExcT: BaseException, **P, T](
+    f: abc.Callable[P, abc.Awaitable[T]],
+    exc: type[ExcT] | tuple[type[ExcT], ...],
+    /,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> "AsyncResult[T, ExcT]":
+    """Await coroutine function `(...) -> T`, resolve to `Ok[T]` on success, or `Err[Exception]`.
+
+    ```
+    user = await try_result_async(client.get, OSError, "/user").map(parse_user)
+    ```
+    """
+    return AsyncResult(_try_result(f, exc, *args, **kwargs))
+
+
+def try_option_async[**P, T](
+    f: abc.Callable[P, abc.Awaitable[T]],
+    exc: type[BaseException] | tuple[type[BaseException], ...],
+    /,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> "AsyncOption[T]":
+    """Await coroutine function `(...) -> T`, resolve to `Some[T]` on success, or `Null`."""
+    return AsyncOption(_try_option(f, exc, *args, **kwargs))
+
+
+async def _map[T, E, U](
+    aw: abc.Awaitable[Result[T, E]], f: abc.Callable[[T], _MaybeAwaitable[U]], /
+) -> Result[U, E]:
+    result = await aw
+    if not result:
+        return Err(result.err_value)
+
+    return Ok(await _resolve(f(result.ok_value)))
+
+
+async def _map_into[T, E, U, F](
+    aw: abc.Awaitable[Result[T, E]], f: abc.Callable[[T], _MaybeAwaitable[Result[U, F]]], /
+) -> Result[U, E | F]:
+    result = await aw
+    if not result:
+        return Err(result.err_value)
+
+    return await _resolve(f(result.ok_value))
+
+
+async def _map_err[T, E, F](
+    aw: abc.Awaitable[Result[T, E]], f: abc.Callable[[E], _MaybeAwaitable[F]], /
+) -> Result[T, F]:
+    result = await aw
+    if result:
+        return Ok(result.ok_value)
+
+    return Err(await _resolve(f(result.err_value)))
+
+
+@final
+@attrs.frozen(eq=False)
+class AsyncResult[T, E]:
+    """Awaitable resolving to `Result[T, E]`, with chainable combinators.
+
+    Functions passed to the combinators may be sync or coroutine functions; any
+    awaitable they return is awaited. Like the wrapped awaitable, an `AsyncResult`
+    built over a coroutine can be awaited once.
+
+    ```
+    @AsyncResult.wrap
+    async def fetch(url: str) -> Result[bytes, OSError]: ...
+
+    data = await fetch(url).map_into(parse).map_err(log)
+    ```
+    """
+
+    _awaitable: abc.Awaitable[Result[T, E]]
+
+    @staticmethod
+    def wrap[**P, U, F](
+        f: abc.Callable[P, abc.Awaitable[Result[U, F]]], /
+    ) -> abc.Callable[P, "AsyncResult[U, F]"]:
+        """Decorate a coroutine function returning `Result` to return an `AsyncResult`."""
+
+        @functools.wraps(f)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> AsyncResult[U, F]:
+            return AsyncResult(f(*args, **kwargs))
+
+        return wrapper
+
+    def __await__(self) -> abc.Generator[Any, Any, Result[T, E]]:
+        return self._awaitable.__await__()
+
+    @overload
+    def map[U](self, f: abc.Callable[[T], abc.Awaitable[U]], /) -> "AsyncResult[U, E]": ...
+    @overload
+    def map[U](self, f: abc.Callable[[T], U], /) -> "AsyncResult[U, E]": ...
+
+    def map[U](self, f: abc.Callable[[T], _MaybeAwaitable[U]], /) -> "AsyncResult[U, E]":
+        return AsyncResult(_map(self._awaitable, f))
+
+    def map_into[U, F](
+        self, f: abc.Callable[[T], _MaybeAwaitable[Result[U, F]]], /
+    ) -> "AsyncResult[U, E | F]":
+        return AsyncResult(_map_into(self._awaitable, f))
+
+    @overload
+    def map_err[F](self, f: abc.Callable[[E], abc.Awaitable[F]], /) -> "AsyncResult[T, F]": ...
+    @overload
+    def map_err[F](self, f: abc.Callable[[E], F], /) -> "AsyncResult[T, F]": ...
+
+    def map_err[F](self, f: abc.Callable[[E], _MaybeAwaitable[F]], /) -> "AsyncResult[T, F]":
+        return AsyncResult(_map_err(self._awaitable, f))
+
+
+async def _option_map[T, U](
+    aw: abc.Awaitable[Option[T]], f: abc.Callable[[T], _MaybeAwaitable[U]], /
+) -> Option[U]:
+    option = await aw
+    if not option:
+        return Null.null
+
+    return Some(await _resolve(f(option.value)))
+
+
+async def _option_map_into[T, U](
+    aw: abc.Awaitable[Option[T]], f: abc.Callable[[T], _MaybeAwaitable[Option[U]]], /
+) -> Option[U]:
+    option = await aw
+    if not option:
+        return Null.null
+
+    return await _resolve(f(option.value))
+
+
+@final
+@attrs.frozen(eq=False)
+class AsyncOption[T]:
+    """Awaitable resolving to `Option[T]`, with chainable combinators; see `AsyncResult`."""
+
+    _awaitable: abc.Awaitable[Option[T]]
+
+    @staticmethod
+    def wrap[**P, U](
+        f: abc.Callable[P, abc.Awaitable[Option[U]]], /
+    ) -> abc.Callable[P, "AsyncOption[U]"]:
+        """Decorate a coroutine function returning `Option` to return an `AsyncOption`."""
+
+        @functools.wraps(f)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> AsyncOption[U]:
+            return AsyncOption(f(*args, **kwargs))
+
+        return wrapper
+
+    def __await__(self) -> abc.Generator[Any, Any, Option[T]]:
+        return self._awaitable.__await__()
+
+    @overload
+    def map[U](self, f: abc.Callable[[T], abc.Awaitable[U]], /) -> "AsyncOption[U]": ...
+    @overload
+    def map[U](self, f: abc.Callable[[T], U], /) -> "AsyncOption[U]": ...
+
+    def map[U](self, f: abc.Callable[[T], _MaybeAwaitable[U]], /) -> "AsyncOption[U]":
+        return AsyncOption(_option_map(self._awaitable, f))
+
+    def map_into[U](self, f: abc.Callable[[T], _MaybeAwaitable[Option[U]]], /) -> "AsyncOption[U]":
+        return AsyncOption(_option_map_into(self._awaitable, f))
+
+
+async def _gather[R: Option[Any] | Result[Any, Any]](
+    aws: abc.Iterable[abc.Awaitable[R]], limit: int | None, /
+) -> tuple[list[R], R | None]:
+    """Await `aws` concurrently until one resolves to `Null`/`Err`.
+
+    Returns the results in input order and `None`, or the partial results and the failure.
+    """
+    if limit is not None and limit < 1:
+        msg = f"limit must be a positive integer, got {limit}"
+        raise ValueError(msg)
+
+    indexed = enumerate(aws)
+    results: list[R] = []
+    pending: dict[asyncio.Future[R], int] = {}
+
+    def schedule(n: int | None, /) -> None:
+        for i, aw in itertools.islice(indexed, n):
+            results.append(None)  # pyright: ignore[reportArgumentType]
+            pending[asyncio.ensure_future(aw)] = i
+
+    schedule(limit)
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in sorted(done, key=pending.__getitem__):
+                result = task.result()
+                if not result:
+                    return results, result
+
+                results[pending.pop(task)] = result
+
+            if limit is not None:
+                schedule(len(done))
+
+    finally:
+        # past a failure under `limit`, the rest are never scheduled; closing their
+        # coroutines keeps them from warning that they were never awaited. Only when
+        # they already exist: a lazy iterator would build them just to close them,
+        # and an infinite one would never be exhausted
+        if isinstance(aws, abc.Collection):
+            for _, aw in indexed:
+                if asyncio.iscoroutine(aw):
+                    aw.close()
+
+        if pending:
+            for task in pending:
+                task.cancel()
+
+            # wait for the cancellations and retrieve the exceptions of the leftovers
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    return results, None
+
+
+async def gather_results[T, E](
+    aws: abc.Iterable[abc.Awaitable[Result[T, E]]], /, *, limit: int | None = None
+) -> Result[list[T], E]:
+    """Concurrent `collect_results`: await `Result`s, failing fast on the first `Err`.
+
+    As soon as an awaitable resolves to `Err`, the remaining ones are cancelled and
+    that `Err` is returned. At most `limit` awaitables run at once; the rest are only
+    scheduled as earlier ones finish.
+
+    Returns
+    -------
+        `Ok[list[T]]`, in input order, if none of the results is `Err`, else the first
+        `Err[E]` to complete.
+    """
+    results, failure = await _gather(aws, limit)
+    if failure is not None and not failure:
+        return Err(failure.err_value)
+
+    return Ok([r.unwrap() for r in results])
+
+
+async def gather_options[T](
+    aws: abc.Iterable[abc.Awaitable[Option[T]]], /, *, limit: int | None = None
+) -> Option[list[T]]:
+    """Concurrent `collect_options`: await `Option`s, failing fast on the first `Null`.
+
+    See `gather_results` for the cancellation and `limit` semantics.
+    """
+    results, failure = await _gather(aws, limit)
+    if failure is not None:
+        return Null.null
+
+    return Some([o.unwrap() for o in results])
@@ -3,30 +3,107 @@
 Copyright (c) 2024-present Eneg
 """
 
-from monads.exceptions import UnwrapError
-from monads.option import Null, Option, Some
-from monads.result import Err, Ok, Result
-from monads.tools import (
-    CatchResult,
-    collect_options,
-    collect_results,
-    from_none,
-    try_option,
-    try_result,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from monads.exceptions import CircuitOpen, ErrFound, UnwrapError
+    from monads.option import Null, Option, Some
+    from monads.result import Err, Ok, Result
+    from monads.tools import (
+        CatchResult,
+        Errors,
+        TracebackMode,
+        collect_all_errors,
+        collect_options,
+        collect_results,
+        drop_traceback,
+        from_none,
+        from_none_many,
+        from_nullable_columns,
+        options_from_mapping,
+        partition_results,
+        stream_options,
+        stream_results,
+        summarize_traceback,
+        traceback_summary,
+        try_option,
+        try_result,
+    )
 
 __all__ = (
     "CatchResult",
+    "CircuitOpen",
     "Err",
+    "ErrFound",
+    "Errors",
     "Null",
     "Ok",
     "Option",
     "Result",
     "Some",
+    "TracebackMode",
     "UnwrapError",
+    "collect_all_errors",
     "collect_options",
     "collect_results",
+    "drop_traceback",
     "from_none",
+    "from_none_many",
+    "from_nullable_columns",
+    "options_from_mapping",
+    "partition_results",
+    "stream_options",
+    "stream_results",
+    "summarize_traceback",
+    "traceback_summary",
     "try_option",
     "try_result",
 )
+
+# the modules are only imported once one of their symbols is looked up
+_MODULES: dict[str, str] = {
+    "CatchResult": "monads.tools",
+    "CircuitOpen": "monads.exceptions",
+    "Err": "monads.result",
+    "ErrFound": "monads.exceptions",
+    "Errors": "monads.tools",
+    "Null": "monads.option",
+    "Ok": "monads.result",
+    "Option": "monads.option",
+    "Result": "monads.result",
+    "Some": "monads.option",
+    "TracebackMode": "monads.tools",
+    "UnwrapError": "monads.exceptions",
+    "collect_all_errors": "monads.tools",
+    "collect_options": "monads.tools",
+    "collect_results": "monads.tools",
+    "drop_traceback": "monads.tools",
+    "from_none": "monads.tools",
+    "from_none_many": "monads.tools",
+    "from_nullable_columns": "monads.tools",
+    "options_from_mapping": "monads.tools",
+    "partition_results": "monads.tools",
+    "stream_options": "monads.tools",
+    "stream_results": "monads.tools",
+    "summarize_traceback": "monads.tools",
+    "traceback_summary": "monads.tools",
+    "try_option": "monads.tools",
+    "try_result": "monads.tools",
+}
+
+
+def __getattr__(name: str) -> object:
+    module = _MODULES.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(module), name)
+    # cached, so that further lookups no longer go through `__getattr__`
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,209 @@
+"""Columnar `Option` & `Result` arrays backed by NumPy.
+
+Requires the `numpy` extra.
+
+Copyright (c) 2024-present Eneg
+"""
+
+from collections import abc
+from typing import Any, Self, final
+
+import attrs
+import numpy as np
+import numpy.typing as npt
+
+from monads.option import Null, Option, Some
+from monads.result import Err, Ok, Result
+
+__all__ = ("OptionArray", "ResultArray")
+
+type Array = npt.NDArray[Any]
+type Mask = npt.NDArray[np.bool_]
+type Vectorized = abc.Callable[[Array], Array]
+
+
+def _scatter(values: abc.Sequence[object], mask: Mask, dtype: npt.DTypeLike | None) -> Array:
+    """Place `values` at the `True` positions of `mask`; other positions are zeroed."""
+    if dtype is None and len(set(map(type, values))) > 1:
+        # an inferred dtype would coerce the payloads into a common type, e.g. `1` into `"1"`
+        dtype = object
+
+    try:
+        present = np.asarray(values, dtype=dtype)
+
+    except ValueError:  # ragged sequences
+        present = None
+
+    if present is None or present.ndim != 1:
+        # keep sequences as elements instead of broadcasting them into extra dimensions
+        present = np.fromiter(values, dtype=object, count=len(values))
+
+    out = np.zeros(len(mask), dtype=present.dtype)
+    out[mask] = present
+    return out
+
+
+@final
+@attrs.frozen(eq=False)
+class OptionArray[T]:
+    """Array of `Option`s stored as a column of values and a validity mask.
+
+    `mask[i]` is `True` where the element is `Some(values[i])`; the values at
+    masked-out positions are unspecified. Functions passed to the combinators are
+    vectorized: they take and return whole arrays, and may be called with the
+    masked-out values as well.
+    """
+
+    values: Array
+    mask: Mask
+
+    def __attrs_post_init__(self) -> None:
+        if self.values.shape != self.mask.shape:
+            msg = f"values and mask shapes differ: {self.values.shape} != {self.mask.shape}"
+            raise ValueError(msg)
+
+    @staticmethod
+    def from_options[U](
+        options: abc.Iterable[Option[U]], /, dtype: npt.DTypeLike | None = None
+    ) -> "OptionArray[U]":
+        """Build the array from `Some`/`Null` instances in a single pass."""
+        values: list[U] = []
+        mask: list[bool] = []
+        append_value, append_mask = values.append, mask.append
+
+        for o in options:
+            if o:
+                append_value(o.value)
+                append_mask(True)  # noqa: FBT003
+
+            else:
+                append_mask(False)  # noqa: FBT003
+
+        bool_mask = np.array(mask, dtype=np.bool_)
+        return OptionArray(_scatter(values, bool_mask, dtype), bool_mask)
+
+    def to_options(self) -> list[Option[T]]:
+        null = Null.null
+        return [
+            Some(v) if m else null
+            for v, m in zip(self.values.tolist(), self.mask.tolist(), strict=True)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    def map(self, f: Vectorized, /) -> "OptionArray[Any]":
+        return OptionArray(f(self.values), self.mask)
+
+    def map_into(self, f: abc.Callable[[Array], "OptionArray[Any]"], /) -> "OptionArray[Any]":
+        other = f(self.values)
+        return OptionArray(other.values, self.mask & other.mask)
+
+    def filter(self, f: abc.Callable[[Array], Mask], /) -> Self:
+        """Turn into `Null` the elements for which `f` returns `False`."""
+        return attrs.evolve(self, mask=self.mask & f(self.values))
+
+    def unwrap_or(self, default: npt.ArrayLike, /) -> Array:
+        return np.where(self.mask, self.values, default)
+
+    def compress(self) -> Array:
+        """Values of the `Some` elements."""
+        return self.values[self.mask]
+
+    def collect(self) -> Option[Array]:
+        """Array-level `collect_options`: `Some[values]` if no element is `Null`, else `Null`."""
+        return Some(self.values) if self.mask.all() else Null.null
+
+
+@final
+@attrs.frozen(eq=False)
+class ResultArray[T, E]:
+    """Array of `Result`s stored as columns of ok and err values, and a discriminant mask.
+
+    `mask[i]` is `True` where the element is `Ok(ok_values[i])`, and `False` where
+    it is `Err(err_values[i])`; the other column holds an unspecified value.
+    Functions passed to the combinators are vectorized, see `OptionArray`.
+    """
+
+    ok_values: Array
+    err_values: Array
+    mask: Mask
+
+    def __attrs_post_init__(self) -> None:
+        if not self.ok_values.shape == self.err_values.shape == self.mask.shape:
+            msg = "ok_values, err_values and mask shapes differ"
+            raise ValueError(msg)
+
+    @staticmethod
+    def from_results[U, F](
+        results: abc.Iterable[Result[U, F]],
+        /,
+        dtype: npt.DTypeLike | None = None,
+        err_dtype: npt.DTypeLike | None = None,
+    ) -> "ResultArray[U, F]":
+        """Build the array from `Ok`/`Err` instances in a single pass."""
+        oks: list[U] = []
+        errs: list[F] = []
+        mask: list[bool] = []
+        append_ok, append_err, append_mask = oks.append, errs.append, mask.append
+
+        for r in results:
+            if r:
+                append_ok(r.ok_value)
+                append_mask(True)  # noqa: FBT003
+
+            else:
+                append_err(r.err_value)
+                append_mask(False)  # noqa: FBT003
+
+        bool_mask = np.array(mask, dtype=np.bool_)
+        return ResultArray(
+            _scatter(oks, bool_mask, dtype), _scatter(errs, ~bool_mask, err_dtype), bool_mask
+        )
+
+    def to_results(self) -> list[Result[T, E]]:
+        return [
+            Ok(ok) if m else Err(err)
+            for ok, err, m in zip(
+                self.ok_values.tolist(), self.err_values.tolist(), self.mask.tolist(), strict=True
+            )
+        ]
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    def ok(self) -> OptionArray[T]:
+        return OptionArray(self.ok_values, self.mask)
+
+    def err(self) -> OptionArray[E]:
+        return OptionArray(self.err_values, ~self.mask)
+
+    def map(self, f: Vectorized, /) -> "ResultArray[Any, E]":
+        return ResultArray(f(self.ok_values), self.err_values, self.mask)
+
+    def map_err(self, f: Vectorized, /) -> "ResultArray[T, Any]":
+        return ResultArray(self.ok_values, f(self.err_values), self.mask)
+
+    def map_into(
+        self, f: abc.Callable[[Array], "ResultArray[Any, Any]"], /
+    ) -> "ResultArray[Any, Any]":
+        other = f(self.ok_values)
+        return ResultArray(
+            other.ok_values,
+            np.where(self.mask, other.err_values, self.err_values),
+            self.mask & other.mask,
+        )
+
+    def unwrap_or(self, default: npt.ArrayLike, /) -> Array:
+        return np.where(self.mask, self.ok_values, default)
+
+    def partition(self) -> tuple[Array, Array]:
+        """Split into the values of the `Ok` elements, and the values of the `Err` elements."""
+        return self.ok_values[self.mask], self.err_values[~self.mask]
+
+    def collect(self) -> Result[Array, E]:
+        """Array-level `collect_results`: `Ok[ok_values]` if no element is `Err`, else the first."""
+        if self.mask.all():
+            return Ok(self.ok_values)
+
+        return Err(self.err_values.item(int(np.argmin(self.mask))))
@@ -0,0 +1,290 @@
+"""Memoization of functions returning `Result`, with separate lifetimes for `Ok` & `Err`.
+
+Copyright (c) 2024-present Eneg
+"""
+
+import asyncio
+import collections
+import contextlib
+import functools
+import threading
+import time
+import types
+from collections import abc
+from typing import Any, Concatenate, Final, Self, final, overload
+
+import attrs
+
+from monads.result import Result
+
+__all__ = (
+    "AsyncCachedResult",
+    "CacheInfo",
+    "CachedResult",
+    "cached_result",
+    "cached_result_async",
+)
+
+type _Entry = tuple[Result[Any, Any], float | None]
+
+_KWARGS_MARK: Final = object()
+
+
+@final
+@attrs.frozen
+class CacheInfo:
+    """Statistics of a `CachedResult`."""
+
+    hits: int
+    """Calls answered from the cache."""
+    err_hits: int
+    """Hits which returned a cached `Err`."""
+    misses: int
+    """Calls that ran the function."""
+    maxsize: int | None
+    currsize: int
+    shared: int = 0
+    """Calls that awaited an identical call already in flight; see `cached_result_async`."""
+
+
+def _make_key(args: tuple[object, ...], kwargs: dict[str, object], /) -> abc.Hashable:
+    return (*args, _KWARGS_MARK, *kwargs.items()) if kwargs else args
+
+
+class _ResultCache:
+    """LRU table of `Result`s with separate lifetimes for `Ok` & `Err`, and its statistics."""
+
+    def __init__(
+        self,
+        *,
+        maxsize: int | None,
+        ttl: float | None,
+        err_ttl: float | None,
+        lock: bool,
+    ) -> None:
+        for name, value in [("maxsize", maxsize), ("ttl", ttl), ("err_ttl", err_ttl)]:
+            if value is not None and value < 0:
+                msg = f"{name} must be non-negative or None, got {value}"
+                raise ValueError(msg)
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.err_ttl = err_ttl
+        self._entries: collections.OrderedDict[abc.Hashable, _Entry] = collections.OrderedDict()
+        self._lock: contextlib.AbstractContextManager[object] = (
+            threading.Lock() if lock else contextlib.nullcontext()
+        )
+        self._hits = self._err_hits = self._misses = self._shared = 0
+
+    def _get(self, key: abc.Hashable, /) -> Result[Any, Any] | None:
+        """Look up a live result under `key`, counting a hit, or a miss if `None`."""
+        entries = self._entries
+
+        with self._lock:
+            entry = entries.get(key)
+            if entry is not None:
+                result, expires = entry
+                if expires is None or time.monotonic() < expires:
+                    self._hits += 1
+                    if not result:
+                        self._err_hits += 1
+
+                    entries.move_to_end(key)
+                    return result
+
+                del entries[key]
+
+            self._misses += 1
+            return None
+
+    def _put(self, key: abc.Hashable, result: Result[Any, Any], /) -> None:
+        ttl = self.ttl if result else self.err_ttl
+        if ttl == 0 or self.maxsize == 0:
+            return
+
+        expires = None if ttl is None else time.monotonic() + ttl
+        entries = self._entries
+        with self._lock:
+            entries[key] = (result, expires)
+            if self.maxsize is not None and len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._err_hits,
+                self._misses,
+                self.maxsize,
+                len(self._entries),
+                self._shared,
+            )
+
+    def cache_clear(self) -> None:
+        """Drop the cached results and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._err_hits = self._misses = self._shared = 0
+
+
+@final
+class CachedResult[**P, T, E](_ResultCache):
+    """Function returning `Result`, with its results cached; see `cached_result`."""
+
+    def __init__(
+        self,
+        f: abc.Callable[P, Result[T, E]],
+        /,
+        *,
+        maxsize: int | None,
+        ttl: float | None,
+        err_ttl: float | None,
+        lock: bool,
+    ) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl, err_ttl=err_ttl, lock=lock)
+        self.__wrapped__ = f
+        functools.update_wrapper(self, f)
+
+    @overload
+    def __get__(self, obj: None, objtype: type, /) -> Self: ...
+    @overload
+    def __get__[S, **Q](
+        self: "CachedResult[Concatenate[S, Q], T, E]", obj: S, objtype: type | None = None, /
+    ) -> abc.Callable[Q, Result[T, E]]: ...
+
+    def __get__(self, obj: object, objtype: type | None = None, /) -> object:
+        # bound like a function, so `self` is part of the key, as with `functools.lru_cache`
+        return self if obj is None else types.MethodType(self, obj)
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Result[T, E]:
+        key = _make_key(args, kwargs)
+        result = self._get(key)
+        if result is None:
+            result = self.__wrapped__(*args, **kwargs)
+            self._put(key, result)
+
+        return result
+
+
+@final
+class AsyncCachedResult[**P, T, E](_ResultCache):
+    """Coroutine function returning `Result`, with shared calls; see `cached_result_async`."""
+
+    def __init__(
+        self,
+        f: abc.Callable[P, abc.Awaitable[Result[T, E]]],
+        /,
+        *,
+        maxsize: int | None,
+        ttl: float | None,
+        err_ttl: float | None,
+    ) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl, err_ttl=err_ttl, lock=False)
+        self.__wrapped__ = f
+        self._in_flight: dict[abc.Hashable, asyncio.Future[Result[T, E]]] = {}
+        functools.update_wrapper(self, f)
+
+    @overload
+    def __get__(self, obj: None, objtype: type, /) -> Self: ...
+    @overload
+    def __get__[S, **Q](
+        self: "AsyncCachedResult[Concatenate[S, Q], T, E]", obj: S, objtype: type | None = None, /
+    ) -> abc.Callable[Q, abc.Coroutine[Any, Any, Result[T, E]]]: ...
+
+    def __get__(self, obj: object, objtype: type | None = None, /) -> object:
+        return self if obj is None else types.MethodType(self, obj)
+
+    async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Result[T, E]:
+        key = _make_key(args, kwargs)
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._shared += 1
+
+        else:
+            result = self._get(key)
+            if result is not None:
+                return result
+
+            task = asyncio.ensure_future(self.__wrapped__(*args, **kwargs))
+            task.add_done_callback(functools.partial(self._settle, key))
+            self._in_flight[key] = task
+
+        # cancelling one of the awaiters leaves the call running for the others
+        return await asyncio.shield(task)
+
+    def _settle(self, key: abc.Hashable, task: asyncio.Future[Result[T, E]], /) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+        # exceptions are not cached, and every awaiter has been handed the same one
+        if not task.cancelled() and task.exception() is None:
+            self._put(key, task.result())
+
+
+def cached_result[**P, T, E](
+    *,
+    maxsize: int | None = 128,
+    ttl: float | None = None,
+    err_ttl: float | None = 0,
+    lock: bool = False,
+) -> abc.Callable[[abc.Callable[P, Result[T, E]]], CachedResult[P, T, E]]:
+    """Cache the `Result`s of a function by its arguments, which must be hashable.
+
+    Unlike `functools.lru_cache`, `Ok`s and `Err`s are kept for different times,
+    so e.g. a `NotFound` can be retried sooner than a found row is refreshed.
+    To cache a function that raises, stack it over `@returns_result`:
+
+    ```
+    @cached_result(maxsize=10_000, ttl=300, err_ttl=5)
+    @returns_result(LookupError)
+    def fetch_row(key: int) -> Row: ...
+    ```
+
+    Parameters
+    ----------
+    maxsize
+        How many results to keep at most, evicting the least recently used; `None`
+        for no limit.
+    ttl
+        Seconds to keep an `Ok` for; `None` to keep it until evicted.
+    err_ttl
+        Seconds to keep an `Err` for; `None` to keep it until evicted, `0` (the
+        default) not to cache errors at all.
+    lock
+        Guard the cache with a lock, for functions called from multiple threads.
+        Concurrent misses on the same key may still each run the function.
+    """
+
+    def decorator(f: abc.Callable[P, Result[T, E]], /) -> CachedResult[P, T, E]:
+        return CachedResult(f, maxsize=maxsize, ttl=ttl, err_ttl=err_ttl, lock=lock)
+
+    return decorator
+
+
+def cached_result_async[**P, T, E](
+    *,
+    maxsize: int | None = 128,
+    ttl: float | None = None,
+    err_ttl: float | None = 0,
+) -> abc.Callable[[abc.Callable[P, abc.Awaitable[Result[T, E]]]], AsyncCachedResult[P, T, E]]:
+    """`cached_result` for coroutine functions, which also collapses concurrent calls.
+
+    Calls made while an identical one is in flight await that call instead of starting
+    another, and all of them get the same `Ok` or `Err`: on a cache expiry, a burst of
+    requests for the same key costs a single backend call. With `ttl=0` and `err_ttl=0`
+    nothing is cached, and only the in-flight calls are shared.
+
+    ```
+    @cached_result_async(ttl=60, err_ttl=1)
+    async def fetch_user(user_id: int) -> Result[User, HttpError]: ...
+    ```
+
+    The shared call runs as a task of its own: cancelling an awaiter does not cancel
+    it for the others. An exception it raises is propagated to every awaiter, and is
+    not cached. The cache is meant to be used from a single event loop.
+    """
+
+    def decorator(f: abc.Callable[P, abc.Awaitable[Result[T, E]]], /) -> AsyncCachedResult[P, T, E]:
+        return AsyncCachedResult(f, maxsize=maxsize, ttl=ttl, err_ttl=err_ttl)
+
+    return decorator
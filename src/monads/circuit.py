@@ -0,0 +1,201 @@
+"""Circuit breaker short-circuiting calls to a failing backend into `Err`.
+
+Copyright (c) 2024-present Eneg
+"""
+
+import collections
+import threading
+import time
+from collections import abc
+from typing import Any, Final, Literal, final
+
+from monads._types import Predicate
+from monads.exceptions import CircuitOpen
+from monads.result import Err, Result
+
+__all__ = ("CircuitBreaker",)
+
+type CircuitState = Literal["closed", "open", "half_open"]
+
+_CLOSED: Final = "closed"
+_OPEN: Final = "open"
+_HALF_OPEN: Final = "half_open"
+
+
+@final
+class CircuitBreaker:
+    """Guard of calls returning `Result`, rejecting them while the backend keeps failing.
+
+    The breaker is *closed* at first, and watches the outcomes of the last `window`
+    calls; once the window is full and at least `failure_rate` of them failed, it
+    *opens*. An open breaker answers every call with the same preallocated
+    `Err[CircuitOpen]`, without running it. After `reset_timeout` seconds, a single trial
+    call is let through (*half-open*): the breaker closes if it succeeds, and opens
+    again if it fails.
+
+    ```
+    breaker = CircuitBreaker(window=50, failure_rate=0.5, reset_timeout=10)
+
+    def get_user(user_id: int) -> Result[User, OSError | CircuitOpen]:
+        return breaker.call(try_result, client.get_user, OSError, user_id)
+    ```
+
+    A breaker may be shared between threads, and between coroutines via `call_async`.
+    An exception raised by the call counts as a failure, and is propagated.
+    """
+
+    __slots__ = (
+        "_failures",
+        "_lock",
+        "_open_err",
+        "_outcomes",
+        "_retry_at",
+        "_state",
+        "failure_on",
+        "failure_rate",
+        "reset_timeout",
+        "window",
+    )
+
+    def __init__(
+        self,
+        *,
+        window: int = 20,
+        failure_rate: float = 0.5,
+        reset_timeout: float = 30.0,
+        failure_on: Predicate[Any] | None = None,
+    ) -> None:
+        """Create a closed breaker.
+
+        Parameters
+        ----------
+        window
+            How many of the latest outcomes the failure rate is computed over.
+        failure_rate
+            Share of failures in a full window at which the breaker opens, in `(0, 1]`.
+        reset_timeout
+            Seconds the breaker stays open before letting a trial call through.
+        failure_on
+            Whether an error counts as a failure; by default, every one does.
+        """
+        if window < 1:
+            msg = f"window must be a positive integer, got {window}"
+            raise ValueError(msg)
+
+        if not 0 < failure_rate <= 1:
+            msg = f"failure_rate must be in (0, 1], got {failure_rate}"
+            raise ValueError(msg)
+
+        self.window = window
+        self.failure_rate = failure_rate
+        self.reset_timeout = reset_timeout
+        self.failure_on = failure_on
+        self._state: CircuitState = _CLOSED
+        self._outcomes = collections.deque[bool](maxlen=window)
+        self._failures = 0
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+        self._open_err = Err(CircuitOpen())
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def _admit(self) -> bool:
+        """Whether a call may go through, moving an open breaker past its timeout to half-open."""
+        # unlocked fast path: rejecting while open takes no lock
+        if self._state == _OPEN and time.monotonic() < self._retry_at:
+            return False
+
+        with self._lock:
+            if self._state == _CLOSED:
+                return True
+
+            if self._state == _OPEN and time.monotonic() >= self._retry_at:
+                self._state = _HALF_OPEN
+                return True
+
+            # open, or half-open with the trial call in flight
+            return False
+
+    def _record(self, result: Result[Any, Any] | None, /) -> None:
+        """Record the outcome of an admitted call; `None` if it raised."""
+        failed = result is None or (
+            not result and (self.failure_on is None or result.is_err_and(self.failure_on))
+        )
+
+        with self._lock:
+            if self._state == _HALF_OPEN:
+                if failed:
+                    self._trip()
+
+                else:
+                    self._state = _CLOSED
+                    self._outcomes.clear()
+                    self._failures = 0
+
+            elif self._state == _CLOSED:
+                outcomes = self._outcomes
+                if len(outcomes) == self.window and outcomes[0]:
+                    self._failures -= 1
+
+                outcomes.append(failed)
+                self._failures += failed
+                if (
+                    len(outcomes) == self.window
+                    and self._failures >= self.failure_rate * self.window
+                ):
+                    self._trip()
+
+            # else a call admitted before the breaker opened finished late; it is ignored
+
+    def _trip(self) -> None:
+        self._state = _OPEN
+        self._retry_at = time.monotonic() + self.reset_timeout
+        self._outcomes.clear()
+        self._failures = 0
+
+    def call[**P, T, E](
+        self, f: abc.Callable[P, Result[T, E]], /, *args: P.args, **kwargs: P.kwargs
+    ) -> Result[T, E | CircuitOpen]:
+        """Call `f(*args, **kwargs)`, unless the breaker is open; then return `Err[CircuitOpen]`."""
+        if not self._admit():
+            return self._open_err
+
+        try:
+            result = f(*args, **kwargs)
+
+        except BaseException:
+            self._record(None)
+            raise
+
+        self._record(result)
+        return result
+
+    async def call_async[**P, T, E](
+        self,
+        f: abc.Callable[P, abc.Awaitable[Result[T, E]]],
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Result[T, E | CircuitOpen]:
+        """Await `f(*args, **kwargs)`, unless the breaker is open; see `call`."""
+        if not self._admit():
+            return self._open_err
+
+        try:
+            result = await f(*args, **kwargs)
+
+        except BaseException:
+            self._record(None)
+            raise
+
+        self._record(result)
+        return result
+
+    def reset(self) -> None:
+        """Close the breaker and forget the recorded outcomes."""
+        with self._lock:
+            self._state = _CLOSED
+            self._outcomes.clear()
+            self._failures = 0
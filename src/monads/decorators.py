@@ -0,0 +1,300 @@
+"""Decorators turning functions into ones returning `Result` or `Option`.
+
+Copyright (c) 2024-present Eneg
+"""
+
+import functools
+import inspect
+from collections import abc
+from typing import Any, Never, Protocol, overload
+
+from monads._accel import load_speedups
+from monads._codegen import Codegen
+from monads.option import Null, Option, Some
+from monads.result import Err, Ok, Result
+from monads.tools import TracebackMode, traceback_handler
+
+__all__ = ("option_block", "result_block", "returns_option", "returns_result")
+
+_speedups = load_speedups()
+_GENERIC_PARAMS: tuple[str, str] = ("*args, **kwargs", "*args, **kwargs")
+
+
+def _signature_source(f: abc.Callable[..., object], gen: Codegen, /) -> tuple[str, str]:
+    """Parameter list mirroring the signature of `f`, and the arguments forwarding them.
+
+    Binding the same parameters as `f` lets the wrapper pass them on positionally,
+    with no `*args, **kwargs` packing, unless `f` itself takes those.
+    """
+    if not inspect.isfunction(f):
+        # the signatures of builtins may not spell out their real defaults
+        return _GENERIC_PARAMS
+
+    signature = inspect.signature(f, follow_wrapped=False)
+
+    positional: list[str] = []
+    positional_or_keyword: list[str] = []
+    var_positional: list[str] = []
+    keyword: list[str] = []
+    var_keyword: list[str] = []
+    args: list[str] = []
+
+    for p in signature.parameters.values():
+        param = p.name if p.default is p.empty else f"{p.name}={gen.name(p.default)}"
+
+        match p.kind:
+            case inspect.Parameter.POSITIONAL_ONLY:
+                positional.append(param)
+                args.append(p.name)
+
+            case inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                positional_or_keyword.append(param)
+                args.append(p.name)
+
+            case inspect.Parameter.VAR_POSITIONAL:
+                var_positional.append(f"*{p.name}")
+                args.append(f"*{p.name}")
+
+            case inspect.Parameter.KEYWORD_ONLY:
+                keyword.append(param)
+                args.append(f"{p.name}={p.name}")
+
+            case inspect.Parameter.VAR_KEYWORD:
+                var_keyword.append(f"**{p.name}")
+                args.append(f"**{p.name}")
+
+    if not gen.namespace.keys().isdisjoint(signature.parameters):
+        # a parameter would shadow a global of the generated code
+        return _GENERIC_PARAMS
+
+    params = [
+        *positional,
+        *(["/"] if positional else []),
+        *positional_or_keyword,
+        *(var_positional or (["*"] if keyword else [])),
+        *keyword,
+        *var_keyword,
+    ]
+    return ", ".join(params), ", ".join(args)
+
+
+def _compile_wrapper(
+    f: abc.Callable[..., Any],
+    namespace: dict[str, object],
+    excs: type[BaseException] | tuple[type[BaseException], ...],
+    ok: str,
+    err: str,
+    /,
+) -> abc.Callable[..., Any]:
+    """Compile a wrapper around `f`, wrapping its outcome with the `ok` & `err` templates.
+
+    `ok` is formatted with the returned value; `err` may use the caught exception `e`.
+    """
+    # builtins under private aliases, which no parameter of `f` can shadow
+    gen = Codegen(
+        {
+            **namespace,
+            "_wrapped": f,
+            "_excs": excs,
+            "_next": next,
+            "_StopIteration": StopIteration,
+        }
+    )
+    params, args = _signature_source(f, gen)
+
+    if inspect.iscoroutinefunction(f):
+        gen.emit(0, f"async def wrapper({params}):")
+        gen.emit(1, "try:")
+        gen.emit(2, "return " + ok.format(f"await _wrapped({args})"))
+
+    elif inspect.isgeneratorfunction(f):
+        # items are wrapped one by one; the exception, if any, ends the stream
+        gen.emit(0, f"def wrapper({params}):")
+        gen.emit(1, f"it = _wrapped({args})")
+        gen.emit(1, "while True:")
+        gen.emit(2, "try:")
+        gen.emit(3, "value = _next(it)")
+        gen.emit(2, "except _StopIteration:")
+        gen.emit(3, "return")
+        gen.emit(2, "except _excs as e:")
+        gen.emit(3, f"yield {err}")
+        gen.emit(3, "return")
+        gen.emit(2, "yield " + ok.format("value"))
+        return functools.update_wrapper(gen.compile("wrapper"), f)
+
+    else:
+        gen.emit(0, f"def wrapper({params}):")
+        gen.emit(1, "try:")
+        gen.emit(2, "return " + ok.format(f"_wrapped({args})"))
+
+    gen.emit(1, "except _excs as e:")
+    gen.emit(2, f"return {err}")
+    return functools.update_wrapper(gen.compile("wrapper"), f)
+
+
+def _excs_tuple(
+    excs: tuple[type[BaseException], ...], /
+) -> type[BaseException] | tuple[type[BaseException], ...]:
+    # a lone class is matched a bit faster than a 1-tuple
+    return excs[0] if len(excs) == 1 else excs
+
+
+class _ResultDecorator[ExcT: BaseException](Protocol):
+    @overload
+    def __call__[**P, T](  # pyright: ignore[reportOverlappingOverload]
+        self, f: abc.Callable[P, abc.Coroutine[Any, Any, T]], /
+    ) -> abc.Callable[P, abc.Coroutine[Any, Any, Result[T, ExcT]]]: ...
+    @overload
+    def __call__[**P, T](
+        self, f: abc.Callable[P, abc.Generator[T, None, object]], /
+    ) -> abc.Callable[P, abc.Generator[Result[T, ExcT]]]: ...
+    @overload
+    def __call__[**P, T](self, f: abc.Callable[P, T], /) -> abc.Callable[P, Result[T, ExcT]]: ...
+
+
+class _OptionDecorator(Protocol):
+    @overload
+    def __call__[**P, T](  # pyright: ignore[reportOverlappingOverload]
+        self, f: abc.Callable[P, abc.Coroutine[Any, Any, T]], /
+    ) -> abc.Callable[P, abc.Coroutine[Any, Any, Option[T]]]: ...
+    @overload
+    def __call__[**P, T](
+        self, f: abc.Callable[P, abc.Generator[T, None, object]], /
+    ) -> abc.Callable[P, abc.Generator[Option[T]]]: ...
+    @overload
+    def __call__[**P, T](self, f: abc.Callable[P, T], /) -> abc.Callable[P, Option[T]]: ...
+
+
+def returns_result[ExcT: BaseException](
+    *excs: type[ExcT], traceback: TracebackMode = "keep"
+) -> _ResultDecorator[ExcT]:
+    """Make a function return `Ok[T]`, or `Err[ExcT]` if it raises; decorator form of `try_result`.
+
+    ```
+    @returns_result(KeyError, ValueError)
+    def parse(raw: dict[str, str]) -> int:
+        return int(raw["value"])
+
+    parse({"value": "1"})  # Ok(1)
+    ```
+
+    The wrapper is generated once per function, with the same parameters, so calls
+    are forwarded without repacking the arguments. Coroutine functions return
+    coroutines resolving to `Result`; generator functions yield `Ok` items, and an
+    `Err` ending the stream if the generator raises.
+
+    `traceback="drop"` or `"summary"` releases the frames of the caught exceptions;
+    see `drop_traceback` & `summarize_traceback`.
+    """
+    exc = _excs_tuple(excs)
+    on_exc = traceback_handler(traceback)
+    err = "Err(e)" if on_exc is None else "Err(_on_exc(e))"
+    namespace: dict[str, object] = {"Ok": Ok, "Err": Err, "_on_exc": on_exc}
+
+    def decorator(f: abc.Callable[..., Any], /) -> abc.Callable[..., Any]:
+        return _compile_wrapper(f, namespace, exc, "Ok({})", err)
+
+    return decorator
+
+
+def returns_option(*excs: type[BaseException]) -> _OptionDecorator:
+    """Make a function return `Some[T]`, or `Null` if it raises; decorator form of `try_option`.
+
+    See `returns_result`; a generator yields `Some` items, and `Null` if it raises.
+    """
+    exc = _excs_tuple(excs)
+
+    def decorator(f: abc.Callable[..., Any], /) -> abc.Callable[..., Any]:
+        return _compile_wrapper(f, {"Some": Some, "Null": Null}, exc, "Some({})", "Null.null")
+
+    return decorator
+
+
+def _compile_block(
+    f: abc.Callable[..., Any],
+    variant: type,
+    attr: str,
+    short_circuit: type,
+    run: abc.Callable[[abc.Generator[object, object, object]], object] | None,
+    /,
+) -> abc.Callable[..., Any]:
+    """Compile a driver of generator function `f`.
+
+    The `attr` of each `variant` yielded is sent back into the generator; anything
+    else ends it, and is returned if it is a `short_circuit`. The generator's return
+    value is wrapped in `variant`. `run`, if given, is the C implementation of the loop.
+    """
+    gen = Codegen(
+        {
+            "_variant": variant,
+            "_short_circuit": short_circuit,
+            "_wrong_type": _wrong_type,
+            "_wrapped": f,
+            "_run": run,
+            "_type": type,
+            "_next": next,
+            "_StopIteration": StopIteration,
+        }
+    )
+    params, args = _signature_source(f, gen)
+
+    gen.emit(0, f"def wrapper({params}):")
+    if run is not None:
+        gen.emit(1, f"r = _run(_wrapped({args}))")
+        gen.emit(1, "if _type(r) is _variant:")
+        gen.emit(2, "return r")
+
+    else:
+        gen.emit(1, f"it = _wrapped({args})")
+        gen.emit(1, "send = it.send")
+        gen.emit(1, "try:")
+        gen.emit(2, "r = _next(it)")
+        gen.emit(2, "while _type(r) is _variant:")
+        gen.emit(3, f"r = send(r.{attr})")
+        gen.emit(1, "except _StopIteration as stop:")
+        gen.emit(2, "return _variant(stop.value)")
+        gen.emit(1, "it.close()")
+
+    gen.emit(1, "if _type(r) is not _short_circuit:")
+    gen.emit(2, "_wrong_type(r, _variant, _short_circuit)")
+    gen.emit(1, "return r")
+    return functools.update_wrapper(gen.compile("wrapper"), f)
+
+
+def _wrong_type(value: object, *expected: type) -> Never:
+    names = " or ".join(cls.__name__ for cls in expected)
+    msg = f"block yielded {type(value).__name__!r}, expected {names}"
+    raise TypeError(msg)
+
+
+def result_block[**P, T, E](
+    f: abc.Callable[P, abc.Generator[Result[Any, E], Any, T]], /
+) -> abc.Callable[P, Result[T, E]]:
+    """Run generator function `f` as a block of early-returning `Result` steps.
+
+    Each `yield` of an `Ok` evaluates to its value; the first `Err` yielded ends the
+    block, which returns that `Err`. The value returned by `f` is wrapped in `Ok`.
+
+    ```
+    @result_block
+    def load(path: str) -> Generator[Result[Any, Error], Any, Config]:
+        text = yield read(path)
+        data = yield parse(text)
+        return Config(**data)
+    ```
+    """
+    return _compile_block(
+        f, Ok, "ok_value", Err, None if _speedups is None else _speedups.run_result_block
+    )
+
+
+def option_block[**P, T](
+    f: abc.Callable[P, abc.Generator[Option[Any], Any, T]], /
+) -> abc.Callable[P, Option[T]]:
+    """Run generator function `f` as a block of early-returning `Option` steps.
+
+    See `result_block`; the first `Null` yielded ends the block, which returns `Null`.
+    """
+    return _compile_block(
+        f, Some, "value", Null, None if _speedups is None else _speedups.run_option_block
+    )
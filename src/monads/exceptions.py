@@ -3,6 +3,27 @@
 Copyright (c) 2024-present Eneg
 """
 
+from typing import override
+
 
 class UnwrapError(Exception):
     """Unwrap operation on a missing value."""
+
+
+class ErrFound[E = object](UnwrapError):
+    """`Err` encountered where only `Ok` values were expected.
+
+    The `Err`'s value is kept in `err_value`.
+    """
+
+    def __init__(self, err_value: E, /) -> None:
+        super().__init__(err_value)
+        self.err_value = err_value
+
+    @override
+    def __str__(self) -> str:
+        return f"Err({self.err_value!r}) found"
+
+
+class CircuitOpen(Exception):
+    """Call rejected by an open `CircuitBreaker` without reaching the backend."""
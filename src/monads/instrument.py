@@ -0,0 +1,228 @@
+"""Opt-in counters of `Option` & `Result` creation and unwrap failures, by call site.
+
+Copyright (c) 2024-present Eneg
+"""
+
+import collections
+import contextlib
+import inspect
+import os
+from collections import abc
+from typing import Any, TypedDict
+
+from monads._accel import load_speedups
+from monads.exceptions import UnwrapError
+from monads.option import Null, Some
+from monads.result import Err, Ok
+
+__all__ = (
+    "Snapshot",
+    "disable",
+    "enable",
+    "instrumented",
+    "is_enabled",
+    "reset",
+    "snapshot",
+    "to_prometheus",
+)
+
+_speedups = load_speedups()
+
+_PACKAGE_DIR = os.path.dirname(__file__) + os.sep  # noqa: PTH120
+
+type _Site = str
+
+_created: collections.Counter[tuple[str, _Site]] = collections.Counter()
+_unwrap_errors: collections.Counter[_Site] = collections.Counter()
+_err_types: collections.Counter[str] = collections.Counter()
+
+# (class, attribute) -> the attribute in the class `__dict__`, or `None` if inherited
+_patched: dict[tuple[type, str], object] = {}
+
+
+class Snapshot(TypedDict):
+    created: dict[str, dict[_Site, int]]
+    """Per variant name, the number of instances created at each call site."""
+    unwrap_errors: dict[_Site, int]
+    """The number of `UnwrapError`s raised at each call site."""
+    err_types: dict[str, int]
+    """The number of `Err`s created per type of the error value."""
+
+
+def _call_site() -> _Site:
+    """Locate the first frame outside of this package, i.e. the user code responsible."""
+    frame = inspect.currentframe()
+    while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+        frame = frame.f_back
+
+    if frame is None:
+        return "<unknown>"
+
+    return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+
+def _type_name(cls: type, /) -> str:
+    if cls.__module__ == "builtins":
+        return cls.__qualname__
+
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _patch(cls: type, name: str, value: object, /) -> None:
+    _patched[cls, name] = vars(cls).get(name)
+    setattr(cls, name, value)
+
+
+def _counting_init(cls: type, sample_every: int, /) -> abc.Callable[..., None]:
+    """Wrap the `__init__` of a variant, recording every `sample_every`-th instance."""
+    init: abc.Callable[[object, object], None] = cls.__init__  # pyright: ignore[reportAssignmentType]
+    variant = cls.__name__
+    record_err_type = cls is Err
+    countdown = sample_every
+
+    def __init__(self: object, value: object, /) -> None:  # noqa: N807
+        nonlocal countdown
+        init(self, value)
+
+        countdown -= 1
+        if countdown:
+            return
+
+        countdown = sample_every
+        _created[variant, _call_site()] += sample_every
+        if record_err_type:
+            _err_types[_type_name(type(value))] += sample_every
+
+    return __init__
+
+
+def _counting_new(sample_every: int, /) -> abc.Callable[..., Any]:
+    new = Null.__new__
+    countdown = sample_every
+
+    def __new__(cls: type[Null[Any]]) -> Null[Any]:  # noqa: N807
+        nonlocal countdown
+        countdown -= 1
+        if not countdown:
+            countdown = sample_every
+            _created["Null", _call_site()] += sample_every
+
+        return new(cls)
+
+    return __new__
+
+
+def _counting_unwrap_error() -> abc.Callable[..., None]:
+    init = UnwrapError.__init__
+
+    def __init__(self: UnwrapError, /, *args: object) -> None:  # noqa: N807
+        init(self, *args)
+        _unwrap_errors[_call_site()] += 1
+
+    return __init__
+
+
+def enable(*, sample_every: int = 1) -> None:
+    """Start counting, by swapping in counting constructors.
+
+    While disabled, the classes are left untouched, so instrumentation costs nothing.
+    Enabled, every `sample_every`-th `Some`, `Ok` & `Err` is attributed to its call site,
+    with its count scaled by `sample_every`; walking the stack to the call site is
+    the expensive part, which sampling amortizes. `UnwrapError`s are always counted.
+
+    The call site of an instance is the first frame outside of `monads`, so an `Err`
+    made by `try_result` is attributed to the caller of `try_result`.
+
+    Notes
+    -----
+        `Null.null` is a shared constant, so only explicit `Null()` calls are counted.
+        While enabled, the C speedups create instances by calling their class, like the
+        pure-Python implementations, instead of allocating them directly.
+    """
+    if sample_every < 1:
+        msg = f"sample_every must be a positive integer, got {sample_every}"
+        raise ValueError(msg)
+
+    disable()
+    for cls in (Some, Ok, Err):
+        _patch(cls, "__init__", _counting_init(cls, sample_every))
+
+    _patch(Null, "__new__", _counting_new(sample_every))
+    _patch(UnwrapError, "__init__", _counting_unwrap_error())
+    if _speedups is not None:
+        _speedups.call_constructors(True)  # noqa: FBT003
+
+
+def disable() -> None:
+    """Stop counting, restoring the original constructors; the counts are kept."""
+    if _speedups is not None:
+        _speedups.call_constructors(False)  # noqa: FBT003
+
+    for (cls, name), original in _patched.items():
+        if original is None:
+            delattr(cls, name)
+
+        else:
+            setattr(cls, name, original)
+
+    _patched.clear()
+
+
+def is_enabled() -> bool:
+    return bool(_patched)
+
+
+def reset() -> None:
+    """Zero all the counts."""
+    _created.clear()
+    _unwrap_errors.clear()
+    _err_types.clear()
+
+
+@contextlib.contextmanager
+def instrumented(*, sample_every: int = 1) -> abc.Generator[None]:
+    """Count within a `with` block; see `enable`."""
+    enable(sample_every=sample_every)
+    try:
+        yield
+
+    finally:
+        disable()
+
+
+def snapshot() -> Snapshot:
+    """Copy the counts into plain dicts."""
+    created: dict[str, dict[_Site, int]] = {}
+    for (variant, site), count in _created.items():
+        created.setdefault(variant, {})[site] = count
+
+    return Snapshot(created=created, unwrap_errors=dict(_unwrap_errors), err_types=dict(_err_types))
+
+
+def _label(value: str, /) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def to_prometheus(prefix: str = "monads") -> str:
+    """Render the counts as Prometheus text exposition format counters."""
+    lines = [
+        f"# HELP {prefix}_created_total Option & Result instances created, by call site.",
+        f"# TYPE {prefix}_created_total counter",
+        *(
+            f'{prefix}_created_total{{variant="{variant}",site="{_label(site)}"}} {count}'
+            for (variant, site), count in sorted(_created.items())
+        ),
+        f"# HELP {prefix}_unwrap_errors_total UnwrapErrors raised, by call site.",
+        f"# TYPE {prefix}_unwrap_errors_total counter",
+        *(
+            f'{prefix}_unwrap_errors_total{{site="{_label(site)}"}} {count}'
+            for site, count in sorted(_unwrap_errors.items())
+        ),
+        f"# HELP {prefix}_err_values_total Err instances created, by type of the error.",
+        f"# TYPE {prefix}_err_values_total counter",
+        *(
+            f'{prefix}_err_values_total{{type="{_label(name)}"}} {count}'
+            for name, count in sorted(_err_types.items())
+        ),
+    ]
+    return "\n".join(lines) + "\n"
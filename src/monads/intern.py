@@ -0,0 +1,87 @@
+"""Interned `Some`, `Ok` & `Err` instances of common immutable values.
+
+Copyright (c) 2024-present Eneg
+"""
+
+from collections import abc
+from typing import Any
+
+from monads.option import Some
+from monads.result import Err, Ok
+
+__all__ = ("err", "ok", "register", "some")
+
+# per-type tables keep `True` and `1` apart, and rule out hashing values of other types
+_SOME: dict[type, dict[Any, Some[Any]]] = {}
+_OK: dict[type, dict[Any, Ok[Any]]] = {}
+_ERR: dict[type, dict[Any, Err[Any]]] = {}
+
+
+def register(*values: abc.Hashable) -> None:
+    """Intern `Some`, `Ok` & `Err` of `values`, e.g. sentinels.
+
+    The values must be immutable: an interned instance is shared by every caller.
+    Values are looked up by equality within their exact type.
+    """
+    for value in values:
+        _SOME.setdefault(type(value), {}).setdefault(value, Some(value))
+        _OK.setdefault(type(value), {}).setdefault(value, Ok(value))
+        _ERR.setdefault(type(value), {}).setdefault(value, Err(value))
+
+
+def some[T](value: T, /) -> Some[T]:
+    """`Some(value)`, reusing the interned instance for registered values."""
+    table = _SOME.get(type(value))
+    if table is not None:
+        try:
+            interned = table.get(value)
+
+        except TypeError:  # unhashable, e.g. a tuple holding a list
+            interned = None
+
+        if interned is not None:
+            return interned
+
+    return Some(value)
+
+
+def ok[T](value: T, /) -> Ok[T]:
+    """`Ok(value)`, reusing the interned instance for registered values.
+
+    ```
+    def save(row: Row) -> Result[None, DbError]:
+        ...
+        return ok(None)  # no allocation
+    ```
+    """
+    table = _OK.get(type(value))
+    if table is not None:
+        try:
+            interned = table.get(value)
+
+        except TypeError:
+            interned = None
+
+        if interned is not None:
+            return interned
+
+    return Ok(value)
+
+
+def err[E](value: E, /) -> Err[E]:
+    """`Err(value)`, reusing the interned instance for registered values."""
+    table = _ERR.get(type(value))
+    if table is not None:
+        try:
+            interned = table.get(value)
+
+        except TypeError:
+            interned = None
+
+        if interned is not None:
+            return interned
+
+    return Err(value)
+
+
+register(None, True, False, (), frozenset[object](), "", b"", *range(-5, 257))  # noqa: FBT003
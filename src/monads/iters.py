@@ -0,0 +1,64 @@
+"""Lazy `itertools`-style adaptors over streams of `Option`s & `Result`s.
+
+They are compositions of `map`, `filter` & `itertools` over the variants' truthiness,
+so elements are processed in C, without a generator frame per element, as e.g.
+`itertools.chain.from_iterable(options)` would create through `Some.__iter__`.
+
+Copyright (c) 2024-present Eneg
+"""
+
+import itertools
+from collections import abc
+from operator import attrgetter
+
+from monads.option import Null, Option
+from monads.result import Result
+
+__all__ = ("errs", "filter_map", "first_some", "flatten_options", "oks", "take_while_ok")
+
+_value = attrgetter("value")
+_ok_value = attrgetter("ok_value")
+_err_value = attrgetter("err_value")
+
+
+def filter_map[T, U](f: abc.Callable[[T], Option[U]], it: abc.Iterable[T], /) -> abc.Iterator[U]:
+    """Apply `f` to each item, yielding the values of the `Some`s it returns.
+
+    ```
+    list(filter_map(lambda s: try_option(int, ValueError, s), ["1", "x", "3"]))  # [1, 3]
+    ```
+    """
+    return flatten_options(map(f, it))
+
+
+def flatten_options[T](it: abc.Iterable[Option[T]], /) -> abc.Iterator[T]:
+    """Yield the values of the `Some`s, skipping `Null`s."""
+    return map(_value, filter(None, it))
+
+
+def oks[T](it: abc.Iterable[Result[T, object]], /) -> abc.Iterator[T]:
+    """Yield the values of the `Ok`s, skipping `Err`s."""
+    return map(_ok_value, filter(None, it))
+
+
+def errs[E](it: abc.Iterable[Result[object, E]], /) -> abc.Iterator[E]:
+    """Yield the errors of the `Err`s, skipping `Ok`s."""
+    return map(_err_value, itertools.filterfalse(None, it))
+
+
+def take_while_ok[T](it: abc.Iterable[Result[T, object]], /) -> abc.Iterator[T]:
+    """Yield the values of the `Ok`s up to the first `Err`, which ends the stream.
+
+    The `Err` is consumed from `it`, and dropped; see `stream_results` to get hold of it.
+    """
+    return map(_ok_value, itertools.takewhile(bool, it))
+
+
+def first_some[T](it: abc.Iterable[Option[T]], /) -> Option[T]:
+    """Return the first `Some`, consuming `it` no further; or `Null` if there is none.
+
+    ```
+    first_some(cache.get(key) for cache in (local, shared, remote))
+    ```
+    """
+    return next(filter(None, it), Null.null)
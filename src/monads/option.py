@@ -4,28 +4,13 @@ Copyright (c) 2024-present Eneg
 """
 
 from collections import abc
-from typing import (
-    TYPE_CHECKING,
-    Any,
-    Final,
-    Generic,
-    Literal,
-    Never,
-    Self,
-    TypeVar,
-    final,
-    overload,
-    override,
-)
-
-import attrs
+from typing import Any, Final, Generic, Literal, Never, Self, TypeVar, final, overload, override
 
+from monads._accel import load_speedups
+from monads._frozen import frozen_delattr, frozen_setattr, slot_setter
 from monads._types import Factory, Predicate, SupportsGe, SupportsGt, SupportsLe, SupportsLt
 from monads.exceptions import UnwrapError
 
-if TYPE_CHECKING:
-    from monads.result import Err, Ok
-
 __all__ = ("Null", "Option", "Some")
 
 type Option[T] = Some[T] | Null[T]
@@ -36,14 +21,40 @@ T = TypeVar("T", covariant=True)
 
 
 @final
-@attrs.frozen
 class Some(Generic[T]):
     """Option variant with some value of type `T`."""
 
-    value: Final[T] = attrs.field()
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+    """`case Some(v)` binds `v` to the value."""
+    value: Final[T]  # pyright: ignore[reportGeneralTypeIssues]
+    tag: Final = 1
+    """Discriminant of the variant: `1` for `Some`, `0` for `Null`, i.e. `int(bool(option))`."""
+
+    def __init__(self, value: T, /) -> None:
+        _set_value(self, value)
 
-    if TYPE_CHECKING:
-        def __init__(self, value: T, /) -> None: ...
+    __setattr__ = frozen_setattr
+    __delattr__ = frozen_delattr
+
+    @override
+    def __repr__(self) -> str:
+        return f"Some(value={self.value!r})"
+
+    @override
+    def __eq__(self, other: object, /) -> bool:
+        if type(other) is not Some:
+            return NotImplemented
+
+        return self.value == other.value  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+    @override
+    def __hash__(self) -> int:
+        return hash((Some, self.value))
+
+    @override
+    def __reduce__(self) -> tuple[type["Some[T]"], tuple[T]]:
+        return Some, (self.value,)
 
     def is_some_and(self, f: Predicate[T], /) -> bool:
         return f(self.value)
@@ -72,18 +83,24 @@ class Some(Generic[T]):
     def map_or_else[U](self, f: abc.Callable[[T], U], /, default: Factory[object]) -> U:
         return f(self.value)
 
+    def dispatch[U](self, on_some: abc.Callable[[T], U], on_null: Factory[object], /) -> U:
+        """Call `on_some` with the value of a `Some`, or `on_null` for `Null`.
+
+        A fold over the variants in a single method call, without `isinstance` checks:
+        ```
+        label = option.dispatch(str, lambda: "n/a")
+        ```
+        """
+        return on_some(self.value)
+
     def inspect(self, f: abc.Callable[[T], object], /) -> Self:
         f(self.value)
         return self
 
     def ok_or[E](self, err: E, /) -> "Ok[T, E]":
-        from monads.result import Ok
-
         return Ok(self.value)
 
     def ok_or_else[E](self, err: Factory[E], /) -> "Ok[T, E]":
-        from monads.result import Ok
-
         return Ok(self.value)
 
     @overload
@@ -119,13 +136,19 @@ class Some(Generic[T]):
         return self.value <= other.value if other else False
 
 
+_set_value = slot_setter(Some, "value")
+
+
 @final
 class Null[T = Never]:
     """Option variant of no value."""
 
     __slots__ = ()
+    __match_args__ = ()
     null: Final["Null[Any]"]  # pyright: ignore[reportGeneralTypeIssues]
     """Instance of `Null`."""
+    tag: Final = 0
+    """Discriminant of the variant: `1` for `Some`, `0` for `Null`, i.e. `int(bool(option))`."""
 
     def __new__(cls) -> "Null[T]":
         return cls.null
@@ -134,6 +157,11 @@ class Null[T = Never]:
     def __repr__(self) -> str:
         return "Null.null"
 
+    @override
+    def __reduce__(self) -> tuple[type["Null[T]"], tuple[()]]:
+        # unpickled through `__new__`, which returns the singleton
+        return Null, ()
+
     def is_some_and(self, f: Predicate[T], /) -> Literal[False]:
         return False
 
@@ -161,17 +189,16 @@ class Null[T = Never]:
     def map_or_else[D](self, f: abc.Callable[[T], object], /, default: Factory[D]) -> D:
         return default()
 
+    def dispatch[U](self, on_some: abc.Callable[[T], object], on_null: Factory[U], /) -> U:
+        return on_null()
+
     def inspect(self, f: abc.Callable[[T], object], /) -> Self:
         return self
 
     def ok_or[E](self, err: E, /) -> "Err[E, T]":
-        from monads.result import Err
-
         return Err(err)
 
     def ok_or_else[E](self, err: Factory[E], /) -> "Err[E, T]":
-        from monads.result import Err
-
         return Err(err())
 
     def xor[O: Option[Any]](self, other: O, /) -> O:
@@ -201,3 +228,9 @@ class Null[T = Never]:
 
 
 Null.null = object.__new__(Null)  # pyright: ignore[reportAttributeAccessIssue]
+
+if (_speedups := load_speedups()) is not None:
+    _speedups.install_option(Some, Null)
+
+# imported last: `monads.result` imports this module back, and needs its classes defined
+from monads.result import Err, Ok  # noqa: E402
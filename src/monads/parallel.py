@@ -0,0 +1,210 @@
+"""`collect_results` & `collect_options` over `concurrent.futures` executors.
+
+Copyright (c) 2024-present Eneg
+"""
+
+import collections
+import functools
+import itertools
+from collections import abc
+from concurrent.futures import Executor, Future
+from contextlib import closing
+from typing import Literal, overload
+
+from monads.option import Null, Option, Some
+from monads.result import Err, Ok, Result
+
+__all__ = ("collect_options_parallel", "collect_results_parallel")
+
+type _Excs[ExcT: BaseException] = type[ExcT] | tuple[type[ExcT], ...]
+
+
+def _result_chunk[ExcT: BaseException, T, U](
+    f: abc.Callable[[T], U],
+    exc: _Excs[ExcT],
+    fail_fast: bool,  # noqa: FBT001
+    chunk: list[T],
+    /,
+) -> list[Result[U, ExcT]]:
+    # runs in the worker; stopping at the first `Err` spares computing and sending the rest
+    results: list[Result[U, ExcT]] = []
+    append = results.append
+
+    for item in chunk:
+        try:
+            append(Ok(f(item)))
+
+        except exc as err:
+            append(Err(err))
+            if fail_fast:
+                break
+
+    return results
+
+
+def _option_chunk[T, U](
+    f: abc.Callable[[T], U], exc: _Excs[BaseException], chunk: list[T], /
+) -> list[U] | None:
+    # a bare list of values, or `None` standing for `Null`, is the cheapest to send back
+    values: list[U] = []
+    append = values.append
+
+    for item in chunk:
+        try:
+            append(f(item))
+
+        except exc:
+            return None
+
+    return values
+
+
+def _chunks[T](items: abc.Iterable[T], size: int, /) -> abc.Iterator[list[T]]:
+    it = iter(items)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+def _submit_all[T, R](
+    executor: Executor,
+    fn: abc.Callable[[list[T]], R],
+    items: abc.Iterable[T],
+    chunksize: int,
+    buffersize: int | None,
+    /,
+) -> abc.Generator[R]:
+    """Run `fn` over chunks of `items` in `executor`, yielding the outcomes in input order.
+
+    At most `buffersize` chunks are pending at once; the pending ones are cancelled
+    when the generator is closed early.
+    """
+    if chunksize < 1:
+        msg = f"chunksize must be a positive integer, got {chunksize}"
+        raise ValueError(msg)
+
+    if buffersize is not None and buffersize < 1:
+        msg = f"buffersize must be a positive integer, got {buffersize}"
+        raise ValueError(msg)
+
+    chunks = _chunks(items, chunksize)
+    pending = collections.deque[Future[R]](
+        executor.submit(fn, chunk) for chunk in itertools.islice(chunks, buffersize)
+    )
+    try:
+        while pending:
+            outcome = pending.popleft().result()
+            if buffersize is not None:
+                pending.extend(executor.submit(fn, chunk) for chunk in itertools.islice(chunks, 1))
+
+            yield outcome
+
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+@overload
+def collect_results_parallel[ExcT: BaseException, T, U](
+    f: abc.Callable[[T], U],
+    items: abc.Iterable[T],
+    exc: _Excs[ExcT],
+    /,
+    *,
+    executor: Executor,
+    chunksize: int = 1,
+    buffersize: int | None = None,
+    fail_fast: Literal[True] = True,
+) -> Result[list[U], ExcT]: ...
+@overload
+def collect_results_parallel[ExcT: BaseException, T, U](
+    f: abc.Callable[[T], U],
+    items: abc.Iterable[T],
+    exc: _Excs[ExcT],
+    /,
+    *,
+    executor: Executor,
+    chunksize: int = 1,
+    buffersize: int | None = None,
+    fail_fast: Literal[False],
+) -> Result[list[U], list[ExcT]]: ...
+def collect_results_parallel[ExcT: BaseException, T, U](  # noqa: PLR0913
+    f: abc.Callable[[T], U],
+    items: abc.Iterable[T],
+    exc: _Excs[ExcT],
+    /,
+    *,
+    executor: Executor,
+    chunksize: int = 1,
+    buffersize: int | None = None,
+    fail_fast: bool = True,
+) -> Result[list[U], ExcT] | Result[list[U], list[ExcT]]:
+    """Parallel `collect_results` of `try_result(f, exc, item)` for each of `items`.
+
+    `items` are sent to `executor` in chunks of `chunksize`, with at most `buffersize`
+    chunks pending at once (all of them if `None`). For a `ProcessPoolExecutor`, `f`,
+    the items and their outcomes must be picklable; a larger `chunksize` amortizes the
+    transfer.
+
+    ```
+    with ProcessPoolExecutor() as pool:
+        records = collect_results_parallel(
+            validate, rows, ValidationError, executor=pool, chunksize=10_000
+        )
+    ```
+
+    Returns
+    -------
+        `Ok[list[U]]`, in input order, if `f` raised for none of the items. Otherwise,
+        if `fail_fast`, the first `Err[ExcT]` in input order, and the chunks not yet
+        started are cancelled; else `Err[list[ExcT]]` of all the exceptions caught.
+    """
+    worker = functools.partial(_result_chunk, f, exc, fail_fast)
+    values: list[U] = []
+    errors: list[ExcT] = []
+
+    outcomes = _submit_all(executor, worker, items, chunksize, buffersize)
+    with closing(outcomes):
+        for chunk in outcomes:
+            for r in chunk:
+                if r:
+                    values.append(r.ok_value)
+
+                elif fail_fast:
+                    return Err(r.err_value)
+
+                else:
+                    errors.append(r.err_value)
+
+    return Err(errors) if errors else Ok(values)
+
+
+def collect_options_parallel[T, U](  # noqa: PLR0913
+    f: abc.Callable[[T], U],
+    items: abc.Iterable[T],
+    exc: _Excs[BaseException],
+    /,
+    *,
+    executor: Executor,
+    chunksize: int = 1,
+    buffersize: int | None = None,
+) -> Option[list[U]]:
+    """Parallel `collect_options` of `try_option(f, exc, item)` for each of `items`.
+
+    See `collect_results_parallel`; the first `Null` cancels the chunks not yet started.
+
+    Returns
+    -------
+        `Some[list[U]]`, in input order, if `f` raised for none of the items, else `Null`.
+    """
+    worker = functools.partial(_option_chunk, f, exc)
+    values: list[U] = []
+
+    outcomes = _submit_all(executor, worker, items, chunksize, buffersize)
+    with closing(outcomes):
+        for chunk in outcomes:
+            if chunk is None:
+                return Null.null
+
+            values += chunk
+
+    return Some(values)
@@ -0,0 +1,196 @@
+"""Reusable, lazily applied chains of `Option` & `Result` combinators.
+
+Copyright (c) 2024-present Eneg
+"""
+
+from collections import abc
+from typing import Any, Final, final
+
+import attrs
+
+from monads._codegen import Codegen
+from monads._frozen import slot_setter
+from monads.option import Null, Option, Some
+from monads.result import Err, Ok, Result
+
+__all__ = ("OptionPipeline", "ResultPipeline")
+
+type _Fn = abc.Callable[[Any], Any]
+type _Step = tuple[int, tuple[_Fn, ...]]
+
+_MAP: Final = 0
+_MAP_INTO: Final = 1
+_INSPECT: Final = 2
+_MAP_ERR: Final = 3
+_INSPECT_ERR: Final = 4
+
+
+def _push(steps: tuple[_Step, ...], kind: int, f: _Fn, /) -> tuple[_Step, ...]:
+    """Append a step, fusing it into the previous one if they are both `map`s or `map_err`s."""
+    if kind in {_MAP, _MAP_ERR} and steps and steps[-1][0] == kind:
+        return (*steps[:-1], (kind, (*steps[-1][1], f)))
+
+    return (*steps, (kind, (f,)))
+
+
+def _nested_call(names: abc.Sequence[str], arg: str, /) -> str:
+    """Source of applying the named functions in order: `f2(f1(f0(arg)))`."""
+    return "(".join(reversed(names)) + f"({arg}" + ")" * len(names)
+
+
+def _compile_result(steps: tuple[_Step, ...], /) -> abc.Callable[[Any], Any]:
+    gen = Codegen({"Ok": Ok, "Err": Err})
+    names = [tuple(map(gen.name, fs)) for _, fs in steps]
+
+    def err_track(start: int, indent: int, /) -> None:
+        # `r` is an `Err`; apply the error-side steps from `start` onwards
+        dirty = False
+        gen.emit(indent, "e = r.err_value")
+        for (kind, _), fs in zip(steps[start:], names[start:], strict=True):
+            if kind == _MAP_ERR:
+                gen.emit(indent, "e = " + _nested_call(fs, "e"))
+                dirty = True
+
+            elif kind == _INSPECT_ERR:
+                gen.emit(indent, f"{fs[0]}(e)")
+
+        gen.emit(indent, "return Err(e)" if dirty else "return r")
+
+    gen.emit(0, "def run(r, /):")
+    gen.emit(1, "if type(r) is Ok:")
+    gen.emit(2, "v = r.ok_value")
+    dirty = False
+    for i, ((kind, _), fs) in enumerate(zip(steps, names, strict=True)):
+        if kind == _MAP:
+            gen.emit(2, "v = " + _nested_call(fs, "v"))
+            dirty = True
+
+        elif kind == _INSPECT:
+            gen.emit(2, f"{fs[0]}(v)")
+
+        elif kind == _MAP_INTO:
+            gen.emit(2, f"r = {fs[0]}(v)")
+            gen.emit(2, "if type(r) is not Ok:")
+            err_track(i + 1, 3)
+            gen.emit(2, "v = r.ok_value")
+            dirty = False
+
+    gen.emit(2, "return Ok(v)" if dirty else "return r")
+    err_track(0, 1)
+    return gen.compile("run")
+
+
+def _compile_option(steps: tuple[_Step, ...], /) -> abc.Callable[[Any], Any]:
+    gen = Codegen({"Some": Some, "Null": Null})
+    names = [tuple(map(gen.name, fs)) for _, fs in steps]
+
+    gen.emit(0, "def run(o, /):")
+    gen.emit(1, "if type(o) is not Some:")
+    gen.emit(2, "return Null.null")
+    gen.emit(1, "v = o.value")
+    dirty = False
+    for (kind, _), fs in zip(steps, names, strict=True):
+        if kind == _MAP:
+            gen.emit(1, "v = " + _nested_call(fs, "v"))
+            dirty = True
+
+        elif kind == _INSPECT:
+            gen.emit(1, f"{fs[0]}(v)")
+
+        elif kind == _MAP_INTO:
+            gen.emit(1, f"o = {fs[0]}(v)")
+            gen.emit(1, "if type(o) is not Some:")
+            gen.emit(2, "return Null.null")
+            gen.emit(1, "v = o.value")
+            dirty = False
+
+    gen.emit(1, "return Some(v)" if dirty else "return o")
+    return gen.compile("run")
+
+
+@final
+@attrs.frozen
+class ResultPipeline[T, E, U = T, F = E]:
+    """Chain of `Result` combinators, recorded now and applied later to any number of inputs.
+
+    Applying the pipeline runs the steps on the bare values and allocates at most
+    one `Ok`/`Err` at the end; consecutive `map`s (and `map_err`s) are fused into a
+    single step. Pipelines are immutable, so one built at import time can be shared.
+    The steps are compiled into a single function on the first call, so building a
+    pipeline step by step costs no compilation.
+
+    ```
+    parse = ResultPipeline[str, Exception]().map(str.strip).map_into(to_int).map(abs)
+    parse(Ok(" -12 "))  # Ok(12)
+    ```
+    """
+
+    _steps: tuple[_Step, ...] = ()
+    # compiled on the first call
+    _run: abc.Callable[[Result[T, E]], Result[U, F]] | None = attrs.field(
+        init=False, repr=False, eq=False, default=None
+    )
+
+    def map[V](self, f: abc.Callable[[U], V], /) -> "ResultPipeline[T, E, V, F]":
+        return ResultPipeline(_push(self._steps, _MAP, f))
+
+    def map_into[V, G](
+        self, f: abc.Callable[[U], Result[V, G]], /
+    ) -> "ResultPipeline[T, E, V, F | G]":
+        return ResultPipeline(_push(self._steps, _MAP_INTO, f))
+
+    def map_err[G](self, f: abc.Callable[[F], G], /) -> "ResultPipeline[T, E, U, G]":
+        return ResultPipeline(_push(self._steps, _MAP_ERR, f))
+
+    def inspect(self, f: abc.Callable[[U], object], /) -> "ResultPipeline[T, E, U, F]":
+        return ResultPipeline(_push(self._steps, _INSPECT, f))
+
+    def inspect_err(self, f: abc.Callable[[F], object], /) -> "ResultPipeline[T, E, U, F]":
+        return ResultPipeline(_push(self._steps, _INSPECT_ERR, f))
+
+    def __call__(self, result: Result[T, E], /) -> Result[U, F]:
+        run = self._run
+        if run is None:
+            run = _compile_result(self._steps)
+            _set_result_run(self, run)
+
+        return run(result)
+
+
+_set_result_run = slot_setter(ResultPipeline, "_run")
+
+
+@final
+@attrs.frozen
+class OptionPipeline[T, U = T]:
+    """Chain of `Option` combinators, recorded now and applied later to any number of inputs.
+
+    See `ResultPipeline`; a `Null` input, or a `Null` returned by a `map_into` step,
+    short-circuits the rest of the pipeline.
+    """
+
+    _steps: tuple[_Step, ...] = ()
+    # compiled on the first call
+    _run: abc.Callable[[Option[T]], Option[U]] | None = attrs.field(
+        init=False, repr=False, eq=False, default=None
+    )
+
+    def map[V](self, f: abc.Callable[[U], V], /) -> "OptionPipeline[T, V]":
+        return OptionPipeline(_push(self._steps, _MAP, f))
+
+    def map_into[V](self, f: abc.Callable[[U], Option[V]], /) -> "OptionPipeline[T, V]":
+        return OptionPipeline(_push(self._steps, _MAP_INTO, f))
+
+    def inspect(self, f: abc.Callable[[U], object], /) -> "OptionPipeline[T, U]":
+        return OptionPipeline(_push(self._steps, _INSPECT, f))
+
+    def __call__(self, option: Option[T], /) -> Option[U]:
+        run = self._run
+        if run is None:
+            run = _compile_option(self._steps)
+            _set_option_run(self, run)
+
+        return run(option)
+
+
+_set_option_run = slot_setter(OptionPipeline, "_run")
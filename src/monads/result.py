@@ -4,16 +4,13 @@ Copyright (c) 2024-present Eneg
 """
 
 from collections import abc
-from typing import TYPE_CHECKING, Final, Generic, Literal, Never, Self, TypeVar, final
-
-import attrs
+from typing import Final, Generic, Literal, Never, Self, TypeVar, final, override
 
+from monads._accel import load_speedups
+from monads._frozen import frozen_delattr, frozen_setattr, slot_setter
 from monads._types import Factory, Predicate, SupportsGe, SupportsGt, SupportsLe, SupportsLt
 from monads.exceptions import UnwrapError
 
-if TYPE_CHECKING:
-    from monads.option import Null, Some
-
 __all__ = ("Err", "Ok", "Result")
 
 type Result[T, E] = Ok[T, E] | Err[E, T]
@@ -27,12 +24,38 @@ ErrT = TypeVar("ErrT", covariant=True, default=Never)
 
 
 @final
-@attrs.frozen
 class Ok(Generic[OkT, OkE]):
-    ok_value: Final[OkT] = attrs.field()
+    __slots__ = ("ok_value",)
+    __match_args__ = ("ok_value",)
+    """`case Ok(v)` binds `v` to the value."""
+    ok_value: Final[OkT]  # pyright: ignore[reportGeneralTypeIssues]
+    tag: Final = 1
+    """Discriminant of the variant: `1` for `Ok`, `0` for `Err`, i.e. `int(bool(result))`."""
+
+    def __init__(self, value: OkT, /) -> None:
+        _set_ok_value(self, value)
+
+    __setattr__ = frozen_setattr
+    __delattr__ = frozen_delattr
+
+    @override
+    def __repr__(self) -> str:
+        return f"Ok(ok_value={self.ok_value!r})"
+
+    @override
+    def __eq__(self, other: object, /) -> bool:
+        if type(other) is not Ok:
+            return NotImplemented
+
+        return self.ok_value == other.ok_value  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+    @override
+    def __hash__(self) -> int:
+        return hash((Ok, self.ok_value))
 
-    if TYPE_CHECKING:
-        def __init__(self, value: OkT, /) -> None: ...
+    @override
+    def __reduce__(self) -> tuple[type["Ok[OkT, OkE]"], tuple[OkT]]:
+        return Ok, (self.ok_value,)
 
     def is_ok_and(self, f: Predicate[OkT], /) -> bool:
         return f(self.ok_value)
@@ -41,13 +64,9 @@ class Ok(Generic[OkT, OkE]):
         return False
 
     def ok(self) -> "Some[OkT]":
-        from monads.option import Some
-
         return Some(self.ok_value)
 
     def err(self) -> "Null[OkE]":
-        from monads.option import Null
-
         return Null.null
 
     def map[U](self, f: abc.Callable[[OkT], U], /) -> "Ok[U, OkE]":
@@ -62,11 +81,25 @@ class Ok(Generic[OkT, OkE]):
     def map_or_else[U](self, f: abc.Callable[[OkT], U], /, default: Factory[object]) -> U:
         return f(self.ok_value)
 
+    def dispatch[U](
+        self, on_ok: abc.Callable[[OkT], U], on_err: abc.Callable[[OkE], object], /
+    ) -> U:
+        """Call `on_ok` with the value of an `Ok`, or `on_err` with the error of an `Err`.
+
+        A fold over the variants in a single method call, without `isinstance` checks:
+        ```
+        response = result.dispatch(render, error_page)
+        ```
+        """
+        return on_ok(self.ok_value)
+
+    # the error type is only nominal, so an `Ok` is returned as is, retyped
+
     def map_err[F](self, f: abc.Callable[[OkE], F], /) -> "Ok[OkT, F]":
-        return Ok(self.ok_value)
+        return self  # pyright: ignore[reportReturnType]
 
     def map_err_into[U, F](self, f: abc.Callable[[OkE], Result[U, F]], /) -> "Ok[OkT, F]":
-        return Ok(self.ok_value)
+        return self  # pyright: ignore[reportReturnType]
 
     def inspect(self, f: abc.Callable[[OkT], object], /) -> Self:
         f(self.ok_value)
@@ -106,13 +139,42 @@ class Ok(Generic[OkT, OkE]):
         return self.ok_value <= other.ok_value if other else True
 
 
+_set_ok_value = slot_setter(Ok, "ok_value")
+
+
 @final
-@attrs.frozen
 class Err(Generic[ErrE, ErrT]):
-    err_value: Final[ErrE] = attrs.field()
+    __slots__ = ("err_value",)
+    __match_args__ = ("err_value",)
+    """`case Err(e)` binds `e` to the error."""
+    err_value: Final[ErrE]  # pyright: ignore[reportGeneralTypeIssues]
+    tag: Final = 0
+    """Discriminant of the variant: `1` for `Ok`, `0` for `Err`, i.e. `int(bool(result))`."""
 
-    if TYPE_CHECKING:
-        def __init__(self, value: ErrE, /) -> None: ...
+    def __init__(self, value: ErrE, /) -> None:
+        _set_err_value(self, value)
+
+    __setattr__ = frozen_setattr
+    __delattr__ = frozen_delattr
+
+    @override
+    def __repr__(self) -> str:
+        return f"Err(err_value={self.err_value!r})"
+
+    @override
+    def __eq__(self, other: object, /) -> bool:
+        if type(other) is not Err:
+            return NotImplemented
+
+        return self.err_value == other.err_value  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+    @override
+    def __hash__(self) -> int:
+        return hash((Err, self.err_value))
+
+    @override
+    def __reduce__(self) -> tuple[type["Err[ErrE, ErrT]"], tuple[ErrE]]:
+        return Err, (self.err_value,)
 
     def is_ok_and(self, f: Predicate[ErrT], /) -> Literal[False]:
         return False
@@ -121,20 +183,18 @@ class Err(Generic[ErrE, ErrT]):
         return f(self.err_value)
 
     def ok(self) -> "Null[ErrT]":
-        from monads.option import Null
-
         return Null.null
 
     def err(self) -> "Some[ErrE]":
-        from monads.option import Some
-
         return Some(self.err_value)
 
+    # the value type is only nominal, so an `Err` is returned as is, retyped
+
     def map[U](self, f: abc.Callable[[ErrT], U], /) -> "Err[ErrE, U]":
-        return Err(self.err_value)
+        return self  # pyright: ignore[reportReturnType]
 
     def map_into[U, F](self, f: abc.Callable[[ErrT], Result[U, F]], /) -> "Err[ErrE, U]":
-        return Err(self.err_value)
+        return self  # pyright: ignore[reportReturnType]
 
     def map_or[D](self, f: abc.Callable[[ErrT], object], /, default: D) -> D:
         return default
@@ -142,6 +202,11 @@ class Err(Generic[ErrE, ErrT]):
     def map_or_else[D](self, f: abc.Callable[[ErrT], object], /, default: Factory[D]) -> D:
         return default()
 
+    def dispatch[U](
+        self, on_ok: abc.Callable[[ErrT], object], on_err: abc.Callable[[ErrE], U], /
+    ) -> U:
+        return on_err(self.err_value)
+
     def map_err[F](self, f: abc.Callable[[ErrE], F], /) -> "Err[F, ErrT]":
         return Err(f(self.err_value))
 
@@ -185,3 +250,12 @@ class Err(Generic[ErrE, ErrT]):
 
     def __le__[U, F](self: "Err[SupportsLe[F], SupportsLe[U]]", other: Result[U, F], /) -> bool:
         return False if other else self.err_value <= other.err_value
+
+
+_set_err_value = slot_setter(Err, "err_value")
+
+if (_speedups := load_speedups()) is not None:
+    _speedups.install_result(Ok, Err)
+
+# imported last: `monads.option` imports this module back, and needs its classes defined
+from monads.option import Null, Some  # noqa: E402
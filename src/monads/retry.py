@@ -0,0 +1,176 @@
+"""Retrying of functions returning `Result`, with jittered exponential backoff.
+
+Copyright (c) 2024-present Eneg
+"""
+
+import asyncio
+import random
+import time
+from collections import abc
+from typing import Any, final
+
+import attrs
+
+from monads._types import Factory, Predicate
+from monads.result import Result
+
+__all__ = ("Backoff", "Retried", "retry_result", "retry_result_async")
+
+
+@final
+@attrs.frozen
+class Backoff:
+    """Exponential backoff: `initial * multiplier ** (attempt - 1)` seconds, up to `max_delay`.
+
+    With `jitter`, the delay is drawn uniformly from `[0, delay]` instead ("full jitter"),
+    so that clients failing together do not retry together.
+    """
+
+    initial: float = 0.1
+    multiplier: float = 2.0
+    max_delay: float = 30.0
+    jitter: bool = True
+
+    def __call__(self, attempt: int, /) -> float:
+        """Delay before the attempt following the `attempt`-th one."""
+        try:
+            delay = min(self.initial * self.multiplier ** (attempt - 1), self.max_delay)
+
+        except OverflowError:
+            delay = self.max_delay
+
+        return random.uniform(0, delay) if self.jitter else delay  # noqa: S311
+
+
+@final
+@attrs.frozen
+class Retried[T, E]:
+    """The `Result` of the last attempt, and how many attempts were made."""
+
+    result: Result[T, E]
+    attempts: int
+
+
+_DEFAULT_BACKOFF = Backoff()
+
+
+def _check_attempts(attempts: int | None, /) -> None:
+    if attempts is not None and attempts < 1:
+        msg = f"attempts must be a positive integer or None, got {attempts}"
+        raise ValueError(msg)
+
+
+def _next_delay(  # noqa: PLR0913, PLR0917
+    result: Result[Any, Any],
+    attempt: int,
+    attempts: int | None,
+    backoff: abc.Callable[[int], float],
+    retry_on: Predicate[Any] | None,
+    stop: float | None,
+    /,
+) -> float | None:
+    """Delay before the next attempt, or `None` to give up with `result`."""
+    if result or attempt == attempts:
+        return None
+
+    if retry_on is not None and not result.is_err_and(retry_on):
+        return None
+
+    delay = backoff(attempt)
+    if stop is not None and time.monotonic() + delay >= stop:
+        # the next attempt could not start within the deadline
+        return None
+
+    return delay
+
+
+def retry_result[T, E](  # noqa: PLR0913
+    f: Factory[Result[T, E]],
+    /,
+    *,
+    attempts: int | None = 3,
+    backoff: abc.Callable[[int], float] = _DEFAULT_BACKOFF,
+    retry_on: Predicate[E] | None = None,
+    deadline: float | None = None,
+    on_err: abc.Callable[[E], object] | None = None,
+) -> Retried[T, E]:
+    """Call `f` until it returns `Ok`, or an `Err` not worth retrying.
+
+    To retry a function that raises, wrap it with `try_result`:
+
+    ```
+    retried = retry_result(
+        lambda: try_result(fetch, OSError, url),
+        attempts=5,
+        retry_on=lambda e: not isinstance(e, PermissionError),
+    )
+    page = retried.result.unwrap_or(None)
+    ```
+
+    Parameters
+    ----------
+    attempts
+        How many times to call `f` at most; `None` for no limit.
+    backoff
+        Seconds to sleep after the n-th failed attempt; see `Backoff`.
+    retry_on
+        Whether an error is worth retrying; by default, every one is.
+    deadline
+        Seconds from the first call after which no attempt is started.
+    on_err
+        Called with the error of each failed attempt, via `Result.inspect_err`.
+
+    Returns
+    -------
+        `Retried` holding the `Result` of the last attempt and the attempt count.
+    """
+    _check_attempts(attempts)
+    stop = None if deadline is None else time.monotonic() + deadline
+    attempt = 1
+
+    while True:
+        result = f()
+        if on_err is not None:
+            result.inspect_err(on_err)
+
+        delay = _next_delay(result, attempt, attempts, backoff, retry_on, stop)
+        if delay is None:
+            return Retried(result, attempt)
+
+        time.sleep(delay)
+        attempt += 1
+
+
+async def retry_result_async[T, E](  # noqa: PLR0913
+    f: Factory[abc.Awaitable[Result[T, E]]],
+    /,
+    *,
+    attempts: int | None = 3,
+    backoff: abc.Callable[[int], float] = _DEFAULT_BACKOFF,
+    retry_on: Predicate[E] | None = None,
+    deadline: float | None = None,
+    on_err: abc.Callable[[E], object] | None = None,
+) -> Retried[T, E]:
+    """`retry_result` for coroutine functions, sleeping with `asyncio.sleep`.
+
+    ```
+    retried = await retry_result_async(
+        lambda: try_result_async(client.get, OSError, url), deadline=10
+    )
+    ```
+    """
+    _check_attempts(attempts)
+    stop = None if deadline is None else time.monotonic() + deadline
+    attempt = 1
+
+    while True:
+        result = await f()
+        if on_err is not None:
+            result.inspect_err(on_err)
+
+        delay = _next_delay(result, attempt, attempts, backoff, retry_on, stop)
+        if delay is None:
+            return Retried(result, attempt)
+
+        await asyncio.sleep(delay)
+        attempt += 1
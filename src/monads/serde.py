@@ -0,0 +1,108 @@
+"""Tagged representation of `Option` & `Result`, for JSON and other plain-data formats.
+
+`Some(v)`, `Null.null`, `Ok(v)` and `Err(e)` are represented as single-key dicts:
+`{"Some": v}`, `{"Null": None}`, `{"Ok": v}` and `{"Err": e}`.
+
+Copyright (c) 2024-present Eneg
+"""
+
+import json
+from collections import abc
+from operator import methodcaller
+from typing import Any
+
+from monads.option import Null, Option, Some
+from monads.result import Err, Ok, Result
+
+__all__ = (
+    "dumps",
+    "from_tagged",
+    "from_tagged_many",
+    "loads",
+    "to_tagged",
+    "to_tagged_many",
+)
+
+type Tagged = dict[str, Any]
+
+_ENCODERS: dict[type, abc.Callable[[Any], Tagged]] = {
+    Some: lambda o: {"Some": o.value},
+    Null: lambda _: {"Null": None},
+    Ok: lambda r: {"Ok": r.ok_value},
+    Err: lambda r: {"Err": r.err_value},
+}
+_DECODERS: dict[str, abc.Callable[[Any], Option[Any] | Result[Any, Any]]] = {
+    "Some": Some,
+    "Null": lambda _: Null.null,
+    "Ok": Ok,
+    "Err": Err,
+}
+_items = methodcaller("items")
+
+
+def to_tagged(obj: object, /) -> Tagged:
+    """Represent an `Option` or `Result` as a tagged dict.
+
+    Usable as the `default` hook of `json.dumps` or `msgpack.packb`: nested values
+    are encoded by the serializer itself.
+
+    Raises
+    ------
+    TypeError
+        `obj` is not an `Option` or `Result`.
+    """
+    try:
+        encode = _ENCODERS[type(obj)]
+
+    except KeyError:
+        msg = f"Object of type {type(obj).__name__} is not an Option or Result"
+        raise TypeError(msg) from None
+
+    return encode(obj)
+
+
+def from_tagged(data: dict[str, Any], /) -> Any:  # noqa: ANN401
+    """Turn a tagged dict back into an `Option` or `Result`; return other dicts as they are.
+
+    Usable as the `object_hook` of `json.loads` or `msgpack.unpackb`.
+    """
+    if len(data) == 1:
+        for tag, value in data.items():
+            if (decode := _DECODERS.get(tag)) is not None:
+                return decode(value)
+
+    return data
+
+
+def to_tagged_many(items: abc.Iterable[Option[Any] | Result[Any, Any]], /) -> list[Tagged]:
+    """Batch `to_tagged`, dispatching on the exact type of each item."""
+    encoders = _ENCODERS
+    return [encoders[type(o)](o) for o in items]
+
+
+def from_tagged_many(items: abc.Iterable[Tagged], /) -> list[Option[Any] | Result[Any, Any]]:
+    """Batch `from_tagged`; every item must be a tagged dict.
+
+    Raises
+    ------
+    ValueError
+        An item has more or fewer than one key, or an unknown tag.
+    """
+    decoders = _DECODERS
+    try:
+        # unpacking `[(tag, value)]` rejects dicts without exactly one key
+        return [decoders[tag](value) for [(tag, value)] in map(_items, items)]
+
+    except (KeyError, ValueError):
+        msg = "expected dicts of a single key, tagged 'Some', 'Null', 'Ok' or 'Err'"
+        raise ValueError(msg) from None
+
+
+def dumps(obj: object, /, **kwargs: Any) -> str:  # noqa: ANN401
+    """`json.dumps` with `Option`s and `Result`s in tagged representation."""
+    return json.dumps(obj, default=to_tagged, **kwargs)
+
+
+def loads(s: str | bytes, /, **kwargs: Any) -> Any:  # noqa: ANN401
+    """`json.loads` turning tagged dicts into `Option`s and `Result`s."""
+    return json.loads(s, object_hook=from_tagged, **kwargs)
@@ -0,0 +1,90 @@
+"""MessagePack codec for `Option` & `Result`, as extension types.
+
+Requires the `msgpack` extra.
+
+Copyright (c) 2024-present Eneg
+"""
+
+import functools
+from collections import abc
+from operator import attrgetter
+from typing import Any, Final
+
+import msgpack  # pyright: ignore[reportMissingTypeStubs]
+
+from monads.option import Null, Some
+from monads.result import Err, Ok
+
+__all__ = (
+    "EXT_ERR",
+    "EXT_NULL",
+    "EXT_OK",
+    "EXT_SOME",
+    "ext_default",
+    "ext_hook",
+    "packb",
+    "unpackb",
+)
+
+EXT_SOME: Final = 0x10
+EXT_NULL: Final = 0x11
+EXT_OK: Final = 0x12
+EXT_ERR: Final = 0x13
+
+_NULL_EXT: Final = msgpack.ExtType(EXT_NULL, b"")
+_PAYLOADS: dict[type, tuple[int, abc.Callable[[Any], object]]] = {
+    Some: (EXT_SOME, attrgetter("value")),
+    Ok: (EXT_OK, attrgetter("ok_value")),
+    Err: (EXT_ERR, attrgetter("err_value")),
+}
+_DECODERS: dict[int, abc.Callable[[Any], object]] = {EXT_SOME: Some, EXT_OK: Ok, EXT_ERR: Err}
+
+
+def ext_default(obj: object, /, **kwargs: Any) -> msgpack.ExtType:  # noqa: ANN401
+    """Encode an `Option` or `Result` as an extension type; the `default` hook of `msgpack.packb`.
+
+    The payload is packed with `packb(payload, **kwargs)`; it may hold variants in turn.
+    """
+    if obj is Null.null:
+        return _NULL_EXT
+
+    try:
+        code, payload = _PAYLOADS[type(obj)]
+
+    except KeyError:
+        msg = f"Object of type {type(obj).__name__} is not serializable"
+        raise TypeError(msg) from None
+
+    return msgpack.ExtType(code, packb(payload(obj), **kwargs))
+
+
+def ext_hook(code: int, data: bytes, /, **kwargs: Any) -> Any:  # noqa: ANN401
+    """Decode the extension types of `ext_default`; the `ext_hook` of `msgpack.unpackb`.
+
+    The payload is unpacked with `unpackb(data, **kwargs)`.
+    """
+    if code == EXT_NULL:
+        return Null.null
+
+    if (decode := _DECODERS.get(code)) is not None:
+        return decode(unpackb(data, **kwargs))
+
+    return msgpack.ExtType(code, data)
+
+
+def packb(obj: object, /, **kwargs: Any) -> bytes:  # noqa: ANN401
+    """`msgpack.packb` encoding `Option`s and `Result`s, e.g. a whole list of them at once.
+
+    `kwargs` apply to the payloads of the variants as well.
+    """
+    default = functools.partial(ext_default, **kwargs) if kwargs else ext_default
+    return msgpack.packb(obj, default=default, **kwargs)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType, reportReturnType]
+
+
+def unpackb(data: bytes, /, **kwargs: Any) -> Any:  # noqa: ANN401
+    """`msgpack.unpackb` decoding `Option`s and `Result`s.
+
+    `kwargs` apply to the payloads of the variants as well.
+    """
+    hook = functools.partial(ext_hook, **kwargs) if kwargs else ext_hook
+    return msgpack.unpackb(data, ext_hook=hook, **kwargs)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
@@ -4,34 +4,161 @@ Copyright (c) 2024-present Eneg
 """
 
 from collections import abc
-from typing import Never, Protocol, Self, overload
-
-import attrs
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Final,
+    Literal,
+    Never,
+    Protocol,
+    Self,
+    final,
+    overload,
+    override,
+    runtime_checkable,
+)
 
+from monads._accel import load_speedups
+from monads._frozen import frozen_delattr, frozen_setattr, slot_setter
+from monads.exceptions import ErrFound, UnwrapError
 from monads.option import Null, Option, Some
 from monads.result import Err, Ok, Result
 
+if TYPE_CHECKING:
+    from traceback import StackSummary
+
+_speedups = load_speedups()
+
 __all__ = (
     "CatchResult",
+    "Errors",
+    "TracebackMode",
+    "collect_all_errors",
     "collect_options",
     "collect_results",
+    "drop_traceback",
     "from_none",
+    "from_none_many",
+    "from_nullable_columns",
+    "options_from_mapping",
+    "partition_results",
+    "stream_options",
+    "stream_results",
+    "summarize_traceback",
+    "traceback_summary",
     "try_option",
     "try_result",
 )
 
+type TracebackMode = Literal["keep", "drop", "summary"]
+"""What to do with the traceback of a caught exception: see `drop_traceback` and
+`summarize_traceback`.
+"""
+
+_SUMMARY_ATTR = "__traceback_summary__"
+
+
+def _exception_chain(exc: BaseException, /) -> abc.Iterator[BaseException]:
+    """Iterate over `exc` and the exceptions it chains or groups, each once."""
+    seen: set[int] = set()
+    stack = [exc]
+
+    while stack:
+        e = stack.pop()
+        if id(e) in seen:
+            continue
+
+        seen.add(id(e))
+        yield e
+
+        if e.__cause__ is not None:
+            stack.append(e.__cause__)
+
+        if e.__context__ is not None:
+            stack.append(e.__context__)
+
+        if isinstance(e, BaseExceptionGroup):
+            stack += e.exceptions  # pyright: ignore[reportUnknownMemberType]
+
+
+def drop_traceback[ExcT: BaseException](exc: ExcT, /) -> ExcT:
+    """Detach the tracebacks of `exc` and of the exceptions it chains, and return `exc`.
+
+    A stored exception keeps its traceback alive, and with it every frame it passed
+    through and their locals. In place, so it composes with `Result.inspect_err`:
+
+    ```
+    results = [try_result(parse, ValueError, row).inspect_err(drop_traceback) for row in rows]
+    ```
+    """
+    for e in _exception_chain(exc):
+        e.__traceback__ = None
+
+    return exc
+
+
+def _extract_stack(tb: TracebackType | None, /) -> "StackSummary":
+    # deferred: `traceback` takes longer to import than the rest of this module
+    from traceback import StackSummary, walk_tb  # noqa: PLC0415
+
+    return StackSummary.extract(walk_tb(tb), lookup_lines=False)
+
+
+def summarize_traceback[ExcT: BaseException](exc: ExcT, /) -> ExcT:
+    """Like `drop_traceback`, but first record where the exceptions were raised.
+
+    The file, line and function of each frame are kept, without the frames themselves;
+    the source lines are only read when the summary is formatted. See `traceback_summary`.
+    """
+    for e in _exception_chain(exc):
+        if e.__traceback__ is not None:
+            setattr(e, _SUMMARY_ATTR, _extract_stack(e.__traceback__))
+            e.__traceback__ = None
+
+    return exc
+
+
+def traceback_summary(exc: BaseException, /) -> "StackSummary":
+    """Get the stack of `exc`, from its traceback or as kept by `summarize_traceback`.
+
+    ```
+    print("".join(traceback_summary(err.err_value).format()))
+    ```
+    """
+    summary: StackSummary | None = getattr(exc, _SUMMARY_ATTR, None)
+    if summary is not None:
+        return summary
+
+    return _extract_stack(exc.__traceback__)
+
+
+_TRACEBACK_HANDLERS: dict[str, abc.Callable[[BaseException], object] | None] = {
+    "keep": None,
+    "drop": drop_traceback,
+    "summary": summarize_traceback,
+}
+
+
+def traceback_handler(mode: TracebackMode, /) -> abc.Callable[[BaseException], object] | None:
+    """Look up the function applying `mode` to a caught exception, `None` to keep it as is."""
+    try:
+        return _TRACEBACK_HANDLERS[mode]
+
+    except KeyError:
+        msg = f"traceback must be one of {', '.join(map(repr, _TRACEBACK_HANDLERS))}, got {mode!r}"
+        raise ValueError(msg) from None
+
 
 class HasResult[T, E](Protocol):
     @property
     def result(self) -> Ok[T, E]: ...
 
+    def __enter__(self) -> Self: ...
+    def __exit__(self, _: object, exc: BaseException | None, __: object, /) -> bool: ...
+    def __imatmul__[U](self, value: U, /) -> "HasResult[U, E]": ...
 
-@attrs.frozen
-class _Success[T]:
-    result: Ok[T]
 
-
-@attrs.define
+@final
 class CatchResult[ExcT: BaseException]:
     """Context manager catching exceptions into `Result` type.
 
@@ -41,31 +168,65 @@ class CatchResult[ExcT: BaseException]:
 
     print(catch.result)  # Ok(123) | Err(ValueError(...))
     ```
+
+    The outcome is stored on the instance, which can be reused; entering the
+    block again clears it:
+
+    ```
+    catch = CatchResult(ValueError)
+    for s in strings:
+        with catch:
+            catch @= int(s)
+
+        results.append(catch.result)
+    ```
+
+    `traceback="drop"` or `"summary"` releases the frames of the caught exception;
+    see `drop_traceback` & `summarize_traceback`.
     """
 
+    __slots__ = ("_on_exc", "_result", "excs")
+
     excs: tuple[type[ExcT], ...]
-    _result: Option[ExcT]
+    _result: Result[object, ExcT] | None
+    _on_exc: abc.Callable[[BaseException], object] | None
 
-    def __init__(self, *excs: type[ExcT]) -> None:
+    def __init__(self, *excs: type[ExcT], traceback: TracebackMode = "keep") -> None:
         self.excs = excs
-        self._result = Null.null
+        self._result = None
+        self._on_exc = traceback_handler(traceback)
+
+    @override
+    def __repr__(self) -> str:
+        return f"CatchResult(excs={self.excs!r}, result={self._result!r})"
 
     def __enter__(self) -> Self:
+        self._result = None
         return self
 
-    def __exit__(self, _: object, exc: BaseException | None, __: object) -> bool:
-        if exc is not None and isinstance(exc, self.excs):
-            self._result = Some(exc)
+    def __exit__(self, _: object, exc: BaseException | None, __: object, /) -> bool:
+        if isinstance(exc, self.excs):
+            if self._on_exc is not None:
+                self._on_exc(exc)
+
+            self._result = Err(exc)
             return True
 
         return False
 
     def __imatmul__[U](self, value: U, /) -> HasResult[U, ExcT]:  # noqa: PYI034
-        return _Success(Ok(value))
+        self._result = Ok(value)
+        # the same object, retyped so that `catch.result` after `catch @= value` is an `Ok`;
+        # not using `cast`, which is a function call on this hot path
+        return self  # pyright: ignore[reportReturnType]
 
     @property
     def result(self) -> Err[ExcT, Never]:
-        return self._result.map(Err).unwrap("No exception caught and @= not called")
+        if self._result is None:
+            msg = "No exception caught and @= not called"
+            raise UnwrapError(msg)
+
+        return self._result  # pyright: ignore[reportReturnType]
 
 
 def try_result[ExcT: BaseException, **P, T](
@@ -108,6 +269,55 @@ def from_none[T](obj: T | None, /) -> Option[T]:
     return Null.null if obj is None else Some(obj)
 
 
+def from_none_many[T](it: abc.Iterable[T | None], /) -> list[Option[T]]:
+    """Turn an iterable of `T | None` into a `list` of `Option[T]`, all `None`s to `Null.null`.
+
+    Equivalent to `[from_none(v) for v in it]`, without a function call per element.
+    """
+    if _speedups is not None:
+        return _speedups.from_none_many(it, Null.null)
+
+    null = Null.null
+    return [null if v is None else Some(v) for v in it]
+
+
+def options_from_mapping[K, V](
+    mapping: abc.Mapping[K, V | None], keys: abc.Iterable[K], /
+) -> list[Option[V]]:
+    """Look up `keys` in `mapping`, turning missing keys and `None` values into `Null`.
+
+    ```
+    options_from_mapping({"a": 1, "b": None}, ["a", "b", "c"])  # [Some(1), Null, Null]
+    ```
+    """
+    return from_none_many(map(mapping.get, keys))
+
+
+@runtime_checkable
+class _Column[T](Protocol):
+    def tolist(self) -> list[T | None]: ...
+
+
+def from_nullable_columns[K, T](
+    columns: abc.Mapping[K, abc.Iterable[T | None] | _Column[T]], /
+) -> dict[K, list[Option[T]]]:
+    """Convert each nullable column to a `list` of `Option`s, see `from_none_many`.
+
+    Columns with a `tolist` method, like NumPy arrays, are converted through it; masked
+    entries of `numpy.ma` arrays become `None` there, and so `Null`. Nullable pandas
+    columns can be passed as `series.to_numpy(object, na_value=None)`.
+
+    ```
+    names = [d[0] for d in cursor.description]
+    columns = from_nullable_columns(dict(zip(names, zip(*cursor.fetchall()), strict=True)))
+    ```
+    """
+    return {
+        name: from_none_many(column.tolist() if isinstance(column, _Column) else column)
+        for name, column in columns.items()
+    }
+
+
 def collect_options[T](it: abc.Iterable[Option[T]], /) -> Option[list[T]]:
     """Collect an iterable of `Option`s into a `list` of contained values.
 
@@ -162,3 +372,168 @@ def collect_results[T, E](it: abc.Iterable[Result[T, E]], /) -> Result[list[T],
         values.append(r.ok_value)
 
     return Ok(values)
+
+
+@final
+class Errors[E]:
+    """Errors collected by `collect_all_errors`: the first `len(values)` of `count` errors."""
+
+    __slots__ = ("count", "values")
+    __match_args__ = ("values", "count")
+    values: Final[tuple[E, ...]]  # pyright: ignore[reportGeneralTypeIssues]
+    count: Final[int]  # pyright: ignore[reportGeneralTypeIssues]
+
+    def __init__(self, values: abc.Iterable[E], count: int) -> None:
+        # a tuple, so that the frozen instance is hashable
+        _set_errors_values(self, tuple(values))
+        _set_errors_count(self, count)
+
+    __setattr__ = frozen_setattr
+    __delattr__ = frozen_delattr
+
+    @override
+    def __repr__(self) -> str:
+        return f"Errors(values={self.values!r}, count={self.count!r})"
+
+    @override
+    def __eq__(self, other: object, /) -> bool:
+        if type(other) is not Errors:
+            return NotImplemented
+
+        return (self.values, self.count) == (other.values, other.count)  # pyright: ignore[reportUnknownMemberType]
+
+    @override
+    def __hash__(self) -> int:
+        return hash((Errors, self.values, self.count))
+
+    @override
+    def __reduce__(self) -> tuple[type["Errors[E]"], tuple[tuple[E, ...], int]]:
+        return Errors, (self.values, self.count)
+
+
+_set_errors_values = slot_setter(Errors, "values")
+_set_errors_count = slot_setter(Errors, "count")
+
+
+def collect_all_errors[T, E](
+    it: abc.Iterable[Result[T, E]], /, max_errors: int | None = None
+) -> Result[list[T], Errors[E]]:
+    """Collect an iterable of `Result`s, like `collect_results`, but without stopping at an `Err`.
+
+    ```
+    results = [Ok(2), Err("no"), Ok(8), Err("yes")]
+    assert collect_all_errors(results) == Err(Errors(["no", "yes"], 2))
+    assert collect_all_errors(results, max_errors=1) == Err(Errors(["no"], 2))
+    ```
+
+    Parameters
+    ----------
+    max_errors
+        How many errors to keep at most; the ones past that are only counted.
+
+    Returns
+    -------
+        `Ok[list[T]]` if none of the elements is `Err`, else `Err[Errors[E]]`.
+    """
+    if max_errors is not None and max_errors < 0:
+        msg = f"max_errors must be a non-negative integer, got {max_errors}"
+        raise ValueError(msg)
+
+    values: list[T] = []
+    append = values.append
+    it = iter(it)
+
+    for r in it:
+        if not r:
+            errors = [r.err_value]
+            break
+
+        append(r.ok_value)
+
+    else:
+        return Ok(values)
+
+    # past the first error, the result is an `Err`; the values need not be kept
+    del values
+    count = 1
+    for r in it:
+        if not r:
+            count += 1
+            if max_errors is None or len(errors) < max_errors:
+                errors.append(r.err_value)
+
+    return Err(Errors(errors[:max_errors], count))
+
+
+def stream_options[T](it: abc.Iterable[Option[T]], /) -> abc.Generator[T]:
+    """Lazy `collect_options`: yield the contained values, raise `UnwrapError` on `Null`."""
+    for o in it:
+        if not o:
+            msg = "Null found"
+            raise UnwrapError(msg)
+
+        yield o.value
+
+
+def stream_results[T, E](
+    it: abc.Iterable[Result[T, E]], /, on_err: abc.Callable[[E], object] | None = None
+) -> abc.Generator[T]:
+    """Lazy `collect_results`: yield the contained values without building a `list`.
+
+    ```
+    for record in stream_results(map(parse, lines)):
+        db.insert(record)  # ErrFound raised on the first bad line
+
+    errors: list[ParseError] = []
+    for record in stream_results(map(parse, lines), on_err=errors.append):
+        db.insert(record)  # bad lines skipped
+    ```
+
+    Parameters
+    ----------
+    on_err
+        Called with the value of each `Err`, which is then skipped. If `None`, the first
+        `Err` raises `ErrFound` instead.
+    """
+    if on_err is None:
+        for r in it:
+            if not r:
+                raise ErrFound(r.err_value)
+
+            yield r.ok_value
+
+    else:
+        for r in it:
+            if r:
+                yield r.ok_value
+
+            else:
+                on_err(r.err_value)
+
+
+def partition_results[T, E](
+    it: abc.Iterable[Result[T, E]],
+    /,
+    on_ok: abc.Callable[[T], object],
+    on_err: abc.Callable[[E], object],
+) -> tuple[int, int]:
+    """Consume `Result`s, passing the values of `Ok`s to `on_ok` and of `Err`s to `on_err`.
+
+    The sinks, e.g. `list.append` or a file's `write`, decide what is kept in memory.
+
+    Returns
+    -------
+        The number of `Ok`s and `Err`s seen.
+    """
+    oks = errs = 0
+
+    for r in it:
+        if r:
+            on_ok(r.ok_value)
+            oks += 1
+
+        else:
+            on_err(r.err_value)
+            errs += 1
+
+    return oks, errs
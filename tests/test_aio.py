@@ -0,0 +1,179 @@
+import asyncio
+import inspect
+import itertools
+from collections import abc
+
+import pytest
+
+from monads.aio import (
+    AsyncOption,
+    AsyncResult,
+    gather_options,
+    gather_results,
+    map_async,
+    map_err_async,
+    map_into_async,
+    try_option_async,
+    try_result_async,
+)
+from monads.option import Null, Option, Some
+from monads.result import Err, Ok, Result
+
+
+def _run[T](aw: abc.Awaitable[T], /) -> T:
+    async def main() -> T:
+        return await aw
+
+    return asyncio.run(main())
+
+
+async def _parse(value: str) -> int:
+    await asyncio.sleep(0)
+    return int(value)
+
+
+async def _check(value: int) -> Result[int, str]:
+    await asyncio.sleep(0)
+    return Ok(value) if value > 0 else Err("not positive")
+
+
+def test_try_result_async() -> None:
+    assert _run(try_result_async(_parse, ValueError, "12")) == Ok(12)
+
+    result = _run(try_result_async(_parse, ValueError, "abc"))
+    assert type(result) is Err
+    assert type(result.err_value) is ValueError
+
+
+def test_try_result_async_does_not_swallow() -> None:
+    with pytest.raises(ValueError, match="invalid literal"):
+        _run(try_result_async(_parse, TypeError, "abc"))
+
+
+def test_try_option_async() -> None:
+    assert _run(try_option_async(_parse, ValueError, "12")) == Some(12)
+    assert _run(try_option_async(_parse, ValueError, "abc")) is Null.null
+
+
+def test_async_result_chain() -> None:
+    def chain(value: str) -> AsyncResult[str, ValueError | str]:
+        return (
+            try_result_async(_parse, ValueError, value)
+            .map(abs)
+            .map_into(_check)
+            .map(str)
+            .map_err(lambda e: str(e).upper())
+        )
+
+    assert _run(chain("-3")) == Ok("3")
+    assert _run(chain("0")) == Err("NOT POSITIVE")
+
+
+def test_async_result_wrap() -> None:
+    @AsyncResult.wrap
+    async def fetch(value: int) -> Result[int, str]:
+        return await _check(value)
+
+    assert _run(fetch(2).map(_parse_int_plus_one)) == Ok(3)
+    assert _run(fetch(-2).map(_parse_int_plus_one)) == Err("not positive")
+
+
+async def _parse_int_plus_one(value: int) -> int:
+    return value + 1
+
+
+def test_async_option_chain() -> None:
+    async def half(value: int) -> Option[int]:
+        return Some(value // 2) if value % 2 == 0 else Null.null
+
+    @AsyncOption.wrap
+    async def lookup(key: str) -> Option[int]:
+        return Some(len(key))
+
+    assert _run(lookup("four").map_into(half).map(str)) == Some("2")
+    assert _run(lookup("odd").map_into(half).map(str)) is Null.null
+
+
+def test_map_async_functions() -> None:
+    assert _run(map_async(Ok("1"), _parse)) == Ok(1)
+    assert _run(map_async(Err("e"), _parse)) == Err("e")
+    assert _run(map_into_async(Ok(1), _check)) == Ok(1)
+    assert _run(map_into_async(Ok(-1), _check)) == Err("not positive")
+    assert _run(map_err_async(Err("1"), _parse)) == Err(1)
+    assert _run(map_err_async(Ok("1"), _parse)) == Ok("1")
+
+
+async def _delayed[T](value: T, delay: float = 0) -> T:
+    await asyncio.sleep(delay)
+    return value
+
+
+def test_gather_results_ok_in_order() -> None:
+    aws = [_delayed(Ok(i), 0.01 * (3 - i)) for i in range(3)]
+    assert _run(gather_results(aws)) == Ok([0, 1, 2])
+
+
+def test_gather_results_fails_fast() -> None:
+    cancelled: list[bool] = []
+
+    async def slow() -> Result[int, str]:
+        try:
+            await asyncio.sleep(10)
+
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+        return Ok(1)
+
+    async def main() -> Result[list[int], str]:
+        return await asyncio.wait_for(gather_results([slow(), _delayed(Err("no"))]), 1)
+
+    assert asyncio.run(main()) == Err("no")
+    assert cancelled == [True]
+
+
+def test_gather_results_limit() -> None:
+    running = peak = 0
+
+    async def tracked(i: int) -> Result[int, str]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return Ok(i)
+
+    assert _run(gather_results((tracked(i) for i in range(10)), limit=3)) == Ok(list(range(10)))
+    assert peak == 3
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+def test_gather_results_limit_closes_unscheduled() -> None:
+    aws = [_delayed(Err("no")), *(_check(i) for i in range(1, 5))]
+    assert _run(gather_results(aws, limit=1)) == Err("no")
+    assert [inspect.getcoroutinestate(aw) for aw in aws[1:]] == [inspect.CORO_CLOSED] * 4
+
+
+def test_gather_results_limit_infinite_iterator() -> None:
+    pulled = 0
+
+    def aws() -> abc.Iterator[abc.Awaitable[Result[int, str]]]:
+        nonlocal pulled
+        yield _delayed(Err("no"))
+        for i in itertools.count(1):
+            pulled += 1
+            yield _check(i)
+
+    assert _run(gather_results(aws(), limit=1)) == Err("no")
+    assert pulled == 0
+
+
+def test_gather_results_limit_invalid() -> None:
+    with pytest.raises(ValueError, match="limit"):
+        _run(gather_results(list[abc.Awaitable[Result[int, str]]](), limit=0))
+
+
+def test_gather_options() -> None:
+    assert _run(gather_options([_delayed(Some(1)), _delayed(Some(2))])) == Some([1, 2])
+    assert _run(gather_options([_delayed(Some(1)), _delayed(Null.null)])) is Null.null
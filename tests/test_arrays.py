@@ -0,0 +1,95 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+import numpy as np
+import numpy.typing as npt
+
+from monads.arrays import OptionArray, ResultArray
+from monads.option import Null, Option, Some
+from monads.result import Err, Ok, Result
+from monads.tools import from_nullable_columns
+
+OPTIONS: list[Option[int]] = [Some(1), Null.null, Some(3)]
+RESULTS: list[Result[int, str]] = [Ok(1), Err("two"), Ok(3), Err("four")]
+
+
+def test_option_roundtrip() -> None:
+    array = OptionArray.from_options(OPTIONS)
+    assert array.mask.tolist() == [True, False, True]
+    assert array.to_options() == OPTIONS
+
+
+def test_option_sequences_stay_elements() -> None:
+    options: list[Option[tuple[int, int]]] = [Some((1, 2)), Null.null]
+    assert OptionArray.from_options(options).to_options() == options
+
+
+@pytest.mark.parametrize(
+    "values", [["a", 1], [True, 2], [1, 2.5]], ids=["str-int", "bool-int", "int-float"]
+)
+def test_option_heterogeneous_roundtrip(values: list[object]) -> None:
+    options = OptionArray.from_options([Some(v) for v in values]).to_options()
+    assert [type(o.unwrap()) for o in options] == [type(v) for v in values]
+    assert options == [Some(v) for v in values]
+
+
+def test_option_map() -> None:
+    array = OptionArray.from_options(OPTIONS).map(lambda v: v * 2)
+    assert array.to_options() == [Some(2), Null.null, Some(6)]
+
+
+def test_option_map_into() -> None:
+    array = OptionArray.from_options(OPTIONS).map_into(lambda v: OptionArray(v, v > 1))
+    assert array.to_options() == [Null.null, Null.null, Some(3)]
+
+
+def test_option_filter_unwrap_or() -> None:
+    array = OptionArray.from_options(OPTIONS).filter(lambda v: v < 3)
+    assert array.unwrap_or(0).tolist() == [1, 0, 0]
+    assert array.compress().tolist() == [1]
+
+
+def test_option_collect() -> None:
+    assert OptionArray.from_options(OPTIONS).collect() is Null.null
+    collected = OptionArray.from_options([Some(1), Some(2)]).collect()
+    assert collected.map(lambda v: v.tolist()) == Some([1, 2])
+
+
+def test_result_roundtrip() -> None:
+    array = ResultArray.from_results(RESULTS)
+    assert array.mask.tolist() == [True, False, True, False]
+    assert array.to_results() == RESULTS
+
+
+def test_result_map_map_err() -> None:
+    array = ResultArray.from_results(RESULTS).map(lambda v: v + 1).map_err(np.char.upper)
+    assert array.to_results() == [Ok(2), Err("TWO"), Ok(4), Err("FOUR")]
+
+
+def test_result_map_into() -> None:
+    def check(v: npt.NDArray[np.int_]) -> ResultArray[int, str]:
+        return ResultArray(v, np.full(len(v), "big"), v < 2)
+
+    array = ResultArray.from_results(RESULTS).map_into(check)
+    assert array.to_results() == [Ok(1), Err("two"), Err("big"), Err("four")]
+
+
+def test_result_partition_collect() -> None:
+    array = ResultArray.from_results(RESULTS)
+    oks, errs = array.partition()
+    assert oks.tolist() == [1, 3]
+    assert errs.tolist() == ["two", "four"]
+    assert array.collect() == Err("two")
+    assert array.unwrap_or(0).tolist() == [1, 0, 3, 0]
+    assert array.ok().to_options() == [Some(1), Null.null, Some(3), Null.null]
+
+
+def test_shape_mismatch() -> None:
+    with pytest.raises(ValueError, match="shapes differ"):
+        OptionArray(np.arange(3), np.ones(2, dtype=bool))
+
+
+def test_from_nullable_masked_column() -> None:
+    column = np.ma.MaskedArray([1, 2, 3], mask=[False, True, False])
+    assert from_nullable_columns({"a": column}) == {"a": OPTIONS}
@@ -0,0 +1,265 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from monads.cache import CacheInfo, cached_result, cached_result_async
+from monads.result import Err, Ok, Result
+
+
+def test_caches_ok() -> None:
+    calls: list[int] = []
+
+    @cached_result()
+    def lookup(key: int) -> Result[str, str]:
+        calls.append(key)
+        return Ok(str(key)) if key >= 0 else Err("negative")
+
+    assert lookup(1) == Ok("1")
+    assert lookup(1) == Ok("1")
+    assert lookup(key=1) == Ok("1")
+    assert calls == [1, 1]
+    assert lookup.cache_info() == CacheInfo(hits=1, err_hits=0, misses=2, maxsize=128, currsize=2)
+
+
+def test_errors_not_cached_by_default() -> None:
+    calls: list[int] = []
+
+    @cached_result()
+    def lookup(key: int) -> Result[str, str]:
+        calls.append(key)
+        return Err("negative")
+
+    assert lookup(-1) == Err("negative")
+    assert lookup(-1) == Err("negative")
+    assert calls == [-1, -1]
+
+
+def test_errors_cached_separately() -> None:
+    calls: list[int] = []
+
+    @cached_result(ttl=None, err_ttl=0.01)
+    def lookup(key: int) -> Result[str, str]:
+        calls.append(key)
+        return Ok(str(key)) if key >= 0 else Err("negative")
+
+    for key in [1, -1, 1, -1]:
+        lookup(key)
+
+    assert calls == [1, -1]
+    assert lookup.cache_info().err_hits == 1
+
+    time.sleep(0.02)
+    for key in [1, -1]:
+        lookup(key)
+
+    assert calls == [1, -1, -1]
+
+
+def test_ttl() -> None:
+    calls: list[int] = []
+
+    @cached_result(ttl=0.01)
+    def lookup(key: int) -> Result[int, str]:
+        calls.append(key)
+        return Ok(key)
+
+    for key in [1, 1]:
+        lookup(key)
+
+    time.sleep(0.02)
+    lookup(1)
+    assert calls == [1, 1]
+
+
+def test_lru_eviction() -> None:
+    calls: list[int] = []
+
+    @cached_result(maxsize=2)
+    def lookup(key: int) -> Result[int, str]:
+        calls.append(key)
+        return Ok(key)
+
+    for key in [1, 2, 1, 3]:
+        lookup(key)
+
+    # 2, the least recently used, was evicted
+    for key in [1, 2]:
+        lookup(key)
+
+    assert calls == [1, 2, 3, 2]
+    assert lookup.cache_info().currsize == 2
+
+
+def test_cache_clear() -> None:
+    @cached_result()
+    def lookup(key: int) -> Result[int, str]:
+        return Ok(key)
+
+    for key in [1, 1]:
+        lookup(key)
+
+    lookup.cache_clear()
+    assert lookup.cache_info() == CacheInfo(hits=0, err_hits=0, misses=0, maxsize=128, currsize=0)
+
+
+def test_keeps_metadata() -> None:
+    @cached_result()
+    def lookup(key: int) -> Result[int, str]:
+        """Look up."""
+        return Ok(key)
+
+    assert lookup.__name__ == "lookup"  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+    assert lookup.__doc__ == "Look up."
+
+
+def test_method() -> None:
+    class Repo:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        @cached_result()
+        def get(self, key: int) -> Result[str, str]:
+            return Ok(f"{self.name}:{key}")
+
+    a, b = Repo("a"), Repo("b")
+    assert a.get(1) == Ok("a:1")
+    assert a.get(key=1) == Ok("a:1")
+    assert b.get(1) == Ok("b:1")
+    assert Repo.get(a, 1) == Ok("a:1")
+    assert Repo.get.cache_info().hits == 1
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="ttl"):
+        cached_result(ttl=-1)(lambda: Ok(1))
+
+
+def test_lock() -> None:
+    @cached_result(maxsize=10, lock=True)
+    def lookup(key: int) -> Result[int, str]:
+        return Ok(key)
+
+    def work() -> None:
+        for i in range(1000):
+            assert lookup(i % 20) == Ok(i % 20)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+
+    for t in threads:
+        t.join()
+
+    info = lookup.cache_info()
+    assert info.hits + info.misses == 4000
+    assert info.currsize == 10
+
+
+def test_async_shares_in_flight_calls() -> None:
+    calls: list[int] = []
+
+    @cached_result_async(ttl=0, err_ttl=0)
+    async def fetch(key: int) -> Result[int, str]:
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return Err("timeout")
+
+    async def main() -> list[Result[int, str]]:
+        return await asyncio.gather(*[fetch(1) for _ in range(5)], fetch(2))
+
+    results = asyncio.run(main())
+    assert results == [Err("timeout")] * 6
+    assert results[0] is results[4]
+    assert calls == [1, 2]
+    assert fetch.cache_info() == CacheInfo(
+        hits=0, err_hits=0, misses=2, maxsize=128, currsize=0, shared=4
+    )
+
+    asyncio.run(main())
+    assert calls == [1, 2, 1, 2]
+
+
+def test_async_caches_after_completion() -> None:
+    calls: list[int] = []
+
+    @cached_result_async(err_ttl=None)
+    async def fetch(key: int) -> Result[int, str]:
+        calls.append(key)
+        await asyncio.sleep(0)
+        return Ok(key) if key >= 0 else Err("negative")
+
+    async def main() -> None:
+        assert await fetch(1) == Ok(1)
+        assert await fetch(1) == Ok(1)
+        assert await fetch(-1) == Err("negative")
+        assert await fetch(-1) == Err("negative")
+
+    asyncio.run(main())
+    assert calls == [1, -1]
+    assert fetch.cache_info().err_hits == 1
+
+
+def test_async_cancelled_awaiter_does_not_cancel_call() -> None:
+    calls: list[int] = []
+
+    @cached_result_async()
+    async def fetch(key: int) -> Result[int, str]:
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return Ok(key)
+
+    async def main() -> Result[int, str]:
+        first = asyncio.ensure_future(fetch(1))
+        second = asyncio.ensure_future(fetch(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == Ok(1)
+    assert calls == [1]
+
+
+def test_async_exception_reaches_every_awaiter() -> None:
+    calls: list[int] = []
+
+    @cached_result_async()
+    async def fetch(key: int) -> Result[int, str]:
+        calls.append(key)
+        await asyncio.sleep(0)
+        raise RuntimeError(key)
+
+    async def main() -> tuple[object, object]:
+        return await asyncio.gather(fetch(1), fetch(1), return_exceptions=True)
+
+    first, second = asyncio.run(main())
+    assert isinstance(first, RuntimeError)
+    assert first is second
+    assert fetch.cache_info().currsize == 0
+
+    asyncio.run(main())
+    assert calls == [1, 1]
+
+
+def test_async_method() -> None:
+    calls: list[tuple[str, int]] = []
+
+    class Client:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        @cached_result_async()
+        async def fetch(self, key: int) -> Result[str, str]:
+            calls.append((self.name, key))
+            await asyncio.sleep(0)
+            return Ok(f"{self.name}:{key}")
+
+    a, b = Client("a"), Client("b")
+
+    async def main() -> list[Result[str, str]]:
+        return list(await asyncio.gather(a.fetch(1), a.fetch(1), b.fetch(1)))
+
+    assert asyncio.run(main()) == [Ok("a:1"), Ok("a:1"), Ok("b:1")]
+    assert calls == [("a", 1), ("b", 1)]
+    assert Client.fetch.cache_info().shared == 1
@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+import pytest
+
+from monads.circuit import CircuitBreaker
+from monads.exceptions import CircuitOpen
+from monads.result import Err, Ok, Result
+
+
+def _echo(result: Result[int, str], /) -> Result[int, str]:
+    return result
+
+
+def test_opens_at_failure_rate() -> None:
+    breaker = CircuitBreaker(window=4, failure_rate=0.5)
+
+    for result in [Ok(1), Err("a"), Ok(2)]:
+        assert breaker.call(_echo, result) == result
+
+    assert breaker.state == "closed"
+    assert breaker.call(_echo, Err("b")) == Err("b")
+    assert breaker.state == "open"
+
+    calls: list[int] = []
+
+    def backend() -> Result[int, str]:
+        calls.append(1)
+        return Ok(1)
+
+    rejected = breaker.call(backend)
+    assert not rejected
+    assert isinstance(rejected.err_value, CircuitOpen)
+    assert breaker.call(backend) is rejected
+    assert calls == []
+
+
+def test_window_slides() -> None:
+    breaker = CircuitBreaker(window=2, failure_rate=1)
+
+    for result in [Err("a"), Ok(1), Err("b"), Ok(2)]:
+        breaker.call(_echo, result)
+
+    breaker.call(_echo, Err("c"))
+    assert breaker.state == "closed"
+    breaker.call(_echo, Err("d"))
+    assert breaker.state == "open"
+
+
+def test_half_open_trial() -> None:
+    breaker = CircuitBreaker(window=1, failure_rate=1, reset_timeout=0.01)
+    breaker.call(_echo, Err("a"))
+    assert breaker.state == "open"
+
+    time.sleep(0.02)
+    assert breaker.call(_echo, Err("b")) == Err("b")
+    assert breaker.state == "open"
+
+    time.sleep(0.02)
+    assert breaker.call(_echo, Ok(1)) == Ok(1)
+    assert breaker.state == "closed"
+
+
+def test_failure_on() -> None:
+    breaker = CircuitBreaker(window=1, failure_on=lambda e: e == "timeout")
+    breaker.call(_echo, Err("not found"))
+    assert breaker.state == "closed"
+    breaker.call(_echo, Err("timeout"))
+    assert breaker.state == "open"
+
+    breaker.reset()
+    assert breaker.state == "closed"
+
+
+def test_exception_counts_as_failure() -> None:
+    breaker = CircuitBreaker(window=1)
+
+    def backend() -> Result[int, str]:
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        breaker.call(backend)
+
+    assert breaker.state == "open"
+
+
+def test_async() -> None:
+    breaker = CircuitBreaker(window=1)
+
+    async def backend() -> Result[int, str]:
+        await asyncio.sleep(0)
+        return Err("a")
+
+    async def main() -> tuple[Result[int, str | CircuitOpen], ...]:
+        return (await breaker.call_async(backend), await breaker.call_async(backend))
+
+    first, second = asyncio.run(main())
+    assert first == Err("a")
+    assert not second
+    assert isinstance(second.err_value, CircuitOpen)
+
+
+@pytest.mark.parametrize(("window", "failure_rate"), [(0, 0.5), (1, 0), (1, 1.5)])
+def test_invalid_arguments(window: int, failure_rate: float) -> None:
+    with pytest.raises(ValueError, match="must be"):
+        CircuitBreaker(window=window, failure_rate=failure_rate)
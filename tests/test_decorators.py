@@ -0,0 +1,198 @@
+import asyncio
+import inspect
+from collections import abc
+from typing import Any
+
+import pytest
+
+from monads.decorators import option_block, result_block, returns_option, returns_result
+from monads.option import Null, Option, Some
+from monads.result import Err, Ok, Result
+
+
+@returns_result(ValueError, KeyError)
+def _parse(raw: dict[str, str], key: str = "value") -> int:
+    """Parse."""
+    return int(raw[key])
+
+
+def test_returns_result() -> None:
+    assert _parse({"value": "1"}) == Ok(1)
+    assert _parse(raw={"other": "2"}, key="other") == Ok(2)
+    assert type(_parse({}).unwrap_err()) is KeyError
+    assert type(_parse({"value": "x"}).unwrap_err()) is ValueError
+
+
+def test_returns_result_does_not_swallow() -> None:
+    with pytest.raises(TypeError):
+        _parse({"value": None})  # pyright: ignore[reportArgumentType]
+
+
+def test_returns_result_keeps_metadata() -> None:
+    assert _parse.__name__ == "_parse"
+    assert _parse.__doc__ == "Parse."
+    assert str(inspect.signature(_parse)) == "(raw: dict[str, str], key: str = 'value') -> int"
+
+
+def test_returns_result_signature_kinds() -> None:
+    @returns_result(ValueError)
+    def f(
+        a: int, b: int = 2, /, c: int = 3, *args: int, d: int, e: int = 5, **kw: int
+    ) -> tuple[object, ...]:
+        return a, b, c, args, d, e, kw
+
+    assert f(1, d=4) == Ok((1, 2, 3, (), 4, 5, dict[str, int]()))
+    assert f(1, 0, 0, 9, d=0, e=0, z=1) == Ok((1, 0, 0, (9,), 0, 0, {"z": 1}))
+
+    @returns_result(ValueError)
+    def g(*, key: int) -> int:
+        return key
+
+    assert g(key=1) == Ok(1)
+    with pytest.raises(TypeError):
+        g(1)  # pyright: ignore[reportCallIssue]
+
+
+def test_returns_result_shadowing_parameter() -> None:
+    @returns_result(ValueError)
+    def f(Ok: str) -> int:  # noqa: N803
+        return int(Ok)
+
+    assert f("1") == Ok(1)
+
+
+def test_returns_result_generator_builtin_parameters() -> None:
+    @returns_result(ValueError)
+    def f(next: int, type: str = "int") -> abc.Generator[int]:  # noqa: A002
+        yield next
+        yield int(type)
+
+    results = list(f(1))
+    assert results[0] == Ok(1)
+    assert results[1].unwrap_err().args == ("invalid literal for int() with base 10: 'int'",)
+
+
+def test_returns_result_builtin() -> None:
+    assert returns_result(ValueError)(int)("1") == Ok(1)
+
+
+def test_returns_result_coroutine() -> None:
+    @returns_result(ValueError)
+    async def f(value: str) -> int:
+        await asyncio.sleep(0)
+        return int(value)
+
+    assert inspect.iscoroutinefunction(f)
+    assert asyncio.run(f("1")) == Ok(1)
+    assert type(asyncio.run(f("x"))) is Err
+
+
+def test_returns_result_generator() -> None:
+    @returns_result(ValueError)
+    def f(*values: str) -> abc.Generator[int]:
+        for v in values:
+            yield int(v)
+
+    assert list(f("1", "2")) == [Ok(1), Ok(2)]
+    results = list(f("1", "x", "3"))
+    assert results[0] == Ok(1)
+    assert type(results[1]) is Err
+    assert len(results) == 2
+
+
+def test_returns_option() -> None:
+    @returns_option(ValueError)
+    def f(value: str) -> int:
+        return int(value)
+
+    assert f("1") == Some(1)
+    assert f("x") is Null.null
+
+
+def test_returns_option_coroutine() -> None:
+    @returns_option(ValueError)
+    async def f(value: str) -> int:
+        return int(value)
+
+    assert asyncio.run(f("1")) == Some(1)
+    assert asyncio.run(f("x")) is Null.null
+
+
+def test_returns_option_generator() -> None:
+    @returns_option(ValueError)
+    def f(*values: str) -> abc.Generator[int]:
+        yield from map(int, values)
+
+    assert list(f("1", "x", "3")) == [Some(1), Null.null]
+
+
+def _check(s: str) -> Result[int, str]:
+    return Ok(int(s)) if s.isdigit() else Err(f"not a number: {s}")
+
+
+def test_result_block() -> None:
+    closed: list[bool] = []
+
+    @result_block
+    def add(a: str, b: str) -> abc.Generator[Result[int, str], Any, int]:
+        try:
+            x = yield _check(a)
+            y = yield _check(b)
+            return x + y
+
+        finally:
+            closed.append(True)
+
+    assert add("1", "2") == Ok(3)
+    assert add("x", b="2") == Err("not a number: x")
+    assert add("1", "y") == Err("not a number: y")
+    assert closed == [True, True, True]
+
+
+def test_result_block_no_steps() -> None:
+    @result_block
+    def f() -> abc.Generator[Result[int, str], Any, int]:
+        return 1
+        yield Ok(0)  # pyright: ignore[reportUnreachable]
+
+    assert f() == Ok(1)
+
+
+def test_result_block_builtin_parameters() -> None:
+    @result_block
+    def load(path: str, type: str = "json") -> abc.Generator[Result[int, str], Any, str]:  # noqa: A002
+        size = yield _check(path)
+        return f"{size} {type}"
+
+    assert load("1") == Ok("1 json")
+    assert load("x", type="toml") == Err("not a number: x")
+
+
+def test_result_block_wrong_type() -> None:
+    @result_block
+    def f() -> abc.Generator[Any, Any, int]:
+        yield Some(1)
+        return 1
+
+    with pytest.raises(TypeError, match="'Some', expected Ok or Err"):
+        f()
+
+
+def test_option_block() -> None:
+    @option_block
+    def f(a: Option[int], b: Option[int]) -> abc.Generator[Option[int], Any, int]:
+        x = yield a
+        y = yield b
+        return x + y
+
+    assert f(Some(1), Some(2)) == Some(3)
+    assert f(Some(1), Null.null) is Null.null
+
+
+def test_returns_result_drops_traceback() -> None:
+    @returns_result(ValueError, traceback="drop")
+    def parse(raw: str) -> int:
+        return int(raw)
+
+    assert parse("1") == Ok(1)
+    assert parse("x").unwrap_err().__traceback__ is None
@@ -0,0 +1,132 @@
+from collections import abc
+
+import pytest
+
+from monads import instrument
+from monads.decorators import result_block
+from monads.exceptions import UnwrapError
+from monads.option import Null, Some
+from monads.result import Err, Ok, Result
+from monads.tools import from_none_many, try_result
+
+_PATCHED = [
+    (Some, "__init__"),
+    (Ok, "__init__"),
+    (Err, "__init__"),
+    (Null, "__new__"),
+    (UnwrapError, "__init__"),
+]
+
+
+@pytest.fixture(autouse=True)
+def _clean() -> abc.Iterator[None]:
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def _body_site(f: abc.Callable[..., object], /) -> str:
+    """Locate the first line of the body of `f`."""
+    return f"{__file__}:{f.__code__.co_firstlineno + 1}"
+
+
+def _make() -> None:
+    _ = [Ok(1), Ok(2), Err("e"), Some(1), Null()]
+
+
+def _parse() -> Result[int, ValueError]:
+    return try_result(int, ValueError, "x")
+
+
+def _unwrap() -> None:
+    Null.null.unwrap()
+
+
+def test_counts_creation_by_call_site() -> None:
+    with instrument.instrumented():
+        assert instrument.is_enabled()
+        _make()
+        _parse()
+
+    assert not instrument.is_enabled()
+    _make()
+
+    make, parse = _body_site(_make), _body_site(_parse)
+    assert instrument.snapshot() == {
+        "created": {
+            "Ok": {make: 2},
+            "Err": {make: 1, parse: 1},
+            "Some": {make: 1},
+            "Null": {make: 1},
+        },
+        "unwrap_errors": {},
+        "err_types": {"str": 1, "ValueError": 1},
+    }
+
+
+def test_counts_unwrap_errors() -> None:
+    with instrument.instrumented(), pytest.raises(UnwrapError):
+        _unwrap()
+
+    assert instrument.snapshot()["unwrap_errors"] == {_body_site(_unwrap): 1}
+
+
+def test_sampling() -> None:
+    with instrument.instrumented(sample_every=2):
+        for _ in range(3):
+            _make()
+
+    # the 2nd, 4th & 6th `Ok`s are recorded, twice each
+    assert instrument.snapshot()["created"]["Ok"] == {_body_site(_make): 6}
+
+
+def test_disable_restores_classes() -> None:
+    originals = [vars(cls).get(name) for cls, name in _PATCHED]
+
+    with instrument.instrumented():
+        assert [vars(cls).get(name) for cls, name in _PATCHED] != originals
+
+    assert [vars(cls).get(name) for cls, name in _PATCHED] == originals
+    assert Ok(1) == Ok(1)
+    assert Null() is Null.null
+
+
+def test_to_prometheus() -> None:
+    with instrument.instrumented():
+        _parse()
+
+    text = instrument.to_prometheus()
+    assert "# TYPE monads_created_total counter\n" in text
+    assert f'monads_created_total{{variant="Err",site="{_body_site(_parse)}"}} 1\n' in text
+    assert 'monads_err_values_total{type="ValueError"} 1\n' in text
+
+
+def _steps() -> abc.Generator[Result[int, str], int, int]:
+    value = yield Ok(1)
+    return value + 1
+
+
+_block = result_block(_steps)
+
+
+def _combinators() -> None:
+    _ = [Some(1).map(str), Ok(1).map(str), _block(), from_none_many([1, None])]
+
+
+def test_combinators_counted() -> None:
+    with instrument.instrumented():
+        _combinators()
+
+    # `map`, the return of `_block` & `from_none_many` create instances as well,
+    # with or without speedups
+    site = _body_site(_combinators)
+    assert instrument.snapshot()["created"] == {
+        "Some": {site: 3},
+        "Ok": {site: 3, _body_site(_steps): 1},
+    }
+
+
+def test_invalid_sample_every() -> None:
+    with pytest.raises(ValueError, match="sample_every"):
+        instrument.enable(sample_every=0)
@@ -0,0 +1,39 @@
+from monads.intern import err, ok, register, some
+from monads.option import Some
+from monads.result import Err, Ok
+
+
+def test_interned() -> None:
+    for value in [None, True, False, 0, 256, (), ""]:
+        assert ok(value) is ok(value)
+        assert err(value) is err(value)
+        assert some(value) is some(value)
+
+
+def test_interned_values_keep_type() -> None:
+    assert type(ok(True).ok_value) is bool  # noqa: FBT003
+    assert type(ok(1).ok_value) is int
+    assert ok(1) is not ok(True)  # noqa: FBT003
+
+
+def test_not_interned() -> None:
+    assert ok(1000) is not ok(1000)
+    assert ok(1000) == Ok(1000)
+    assert some([]) == Some([])
+    assert err(1.5) == Err(1.5)
+
+
+def test_register() -> None:
+    sentinel = object()
+    assert ok(sentinel) is not ok(sentinel)
+
+    register(sentinel)
+    assert ok(sentinel) is ok(sentinel)
+    assert ok(sentinel).ok_value is sentinel
+
+
+def test_unhashable_tuple() -> None:
+    value = (1, [2])
+    assert ok(value) == Ok(value)
+    assert err(value) == Err(value)
+    assert some(value) == Some(value)
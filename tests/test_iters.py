@@ -0,0 +1,44 @@
+import itertools
+
+from monads.iters import errs, filter_map, first_some, flatten_options, oks, take_while_ok
+from monads.option import Null, Option, Some
+from monads.result import Err, Ok, Result
+from monads.tools import try_option
+
+OPTIONS: list[Option[int]] = [Some(1), Null.null, Some(2), Null.null]
+RESULTS: list[Result[int, str]] = [Ok(1), Err("a"), Ok(2), Err("b")]
+
+
+def test_filter_map() -> None:
+    def parse(s: str) -> Option[int]:
+        return try_option(int, ValueError, s)
+
+    assert list(filter_map(parse, ["1", "x", "3"])) == [1, 3]
+
+
+def test_flatten_options() -> None:
+    assert list(flatten_options(OPTIONS)) == [1, 2]
+    assert list(flatten_options(OPTIONS)) == list(itertools.chain.from_iterable(OPTIONS))
+
+
+def test_oks_errs() -> None:
+    assert list(oks(RESULTS)) == [1, 2]
+    assert list(errs(RESULTS)) == ["a", "b"]
+
+
+def test_take_while_ok() -> None:
+    it = iter(RESULTS)
+    assert list(take_while_ok(it)) == [1]
+    assert next(it) == Ok(2)
+
+
+def test_first_some() -> None:
+    it = iter([Null.null, Some(1), Some(2)])
+    assert first_some(it) == Some(1)
+    assert next(it) == Some(2)
+    assert first_some([Null.null]) is Null.null
+    assert first_some([]) is Null.null
+
+
+def test_lazy() -> None:
+    assert list(itertools.islice(oks(map(Ok, itertools.count())), 3)) == [0, 1, 2]
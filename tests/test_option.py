@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from monads.option import Null, Option, Some
@@ -68,3 +70,46 @@ def test_rich_comparison(
     assert (lhs >= rhs) == (lhs_t >= rhs_t)
     assert (lhs < rhs) == (lhs_t < rhs_t)
     assert (lhs <= rhs) == (lhs_t <= rhs_t)
+
+
+def test_frozen() -> None:
+    some = Some(1)
+
+    with pytest.raises(AttributeError):
+        some.value = 2  # pyright: ignore[reportAttributeAccessIssue]
+
+    with pytest.raises(AttributeError):
+        del some.value  # pyright: ignore[reportAttributeAccessIssue]
+
+    assert some.value == 1
+
+
+def test_hash() -> None:
+    assert hash(Some(1)) == hash(Some(1))
+    assert len({Some(1), Some(1), Some(2), Null.null}) == 3
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol: int) -> None:
+    assert pickle.loads(pickle.dumps(Some(1), protocol)) == Some(1)
+    assert pickle.loads(pickle.dumps(Null.null, protocol)) is Null.null
+
+
+def test_tag() -> None:
+    assert Some(1).tag == 1
+    assert Null.null.tag == 0
+    assert [o.tag for o in [Some(0), Null.null]] == [bool(Some(0)), bool(Null.null)]
+
+
+@pytest.mark.parametrize(("option", "expected"), [(Some(1), "1"), (Null.null, "n/a")])
+def test_dispatch(option: Option[int], expected: str) -> None:
+    assert option.dispatch(str, lambda: "n/a") == expected
+
+
+def test_match_null_class_pattern() -> None:
+    match Null.null:
+        case Null():
+            pass
+
+        case _:
+            pytest.fail("Null should match to Null()")
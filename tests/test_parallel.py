@@ -0,0 +1,82 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from monads.option import Null, Some
+from monads.parallel import collect_options_parallel, collect_results_parallel
+from monads.result import Err, Ok
+
+
+def _boom(s: str) -> int:
+    raise TypeError(s)
+
+
+def test_collect_results_parallel_ok() -> None:
+    with ThreadPoolExecutor(4) as pool:
+        result = collect_results_parallel(
+            int, map(str, range(100)), ValueError, executor=pool, chunksize=7
+        )
+
+    assert result == Ok(list(range(100)))
+
+
+def test_collect_results_parallel_fail_fast() -> None:
+    calls: list[str] = []
+
+    def parse(s: str) -> int:
+        calls.append(s)
+        return int(s)
+
+    items = ["1", "x", "2", "y", *map(str, range(100))]
+    with ThreadPoolExecutor(1) as pool:
+        result = collect_results_parallel(
+            parse, items, ValueError, executor=pool, chunksize=2, buffersize=1
+        )
+
+    assert type(result) is Err
+    assert str(result.err_value) == "invalid literal for int() with base 10: 'x'"
+    assert len(calls) < len(items)
+
+
+def test_collect_results_parallel_all_errors() -> None:
+    with ThreadPoolExecutor(2) as pool:
+        result = collect_results_parallel(
+            int, ["1", "x", "2", "y"], ValueError, executor=pool, fail_fast=False
+        )
+
+    assert type(result) is Err
+    assert [str(e)[-3:] for e in result.err_value] == ["'x'", "'y'"]
+
+
+def test_collect_results_parallel_process_pool() -> None:
+    with ProcessPoolExecutor(2) as pool:
+        result = collect_results_parallel(
+            int, [*map(str, range(10)), "x"], ValueError, executor=pool, chunksize=3
+        )
+
+    assert type(result) is Err
+    assert type(result.err_value) is ValueError
+
+
+def test_collect_results_parallel_does_not_swallow() -> None:
+    with ThreadPoolExecutor(2) as pool, pytest.raises(TypeError):
+        collect_results_parallel(_boom, ["1"], ValueError, executor=pool)
+
+
+def test_collect_results_parallel_invalid_sizes() -> None:
+    with ThreadPoolExecutor(2) as pool:
+        with pytest.raises(ValueError, match="chunksize"):
+            collect_results_parallel(int, ["1"], ValueError, executor=pool, chunksize=0)
+
+        with pytest.raises(ValueError, match="buffersize"):
+            collect_results_parallel(int, ["1"], ValueError, executor=pool, buffersize=0)
+
+
+def test_collect_options_parallel() -> None:
+    with ProcessPoolExecutor(2) as pool:
+        assert collect_options_parallel(
+            int, ["1", "2", "3"], ValueError, executor=pool, chunksize=2
+        ) == Some([1, 2, 3])
+        assert (
+            collect_options_parallel(int, ["1", "x", "3"], ValueError, executor=pool) is Null.null
+        )
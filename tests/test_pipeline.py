@@ -0,0 +1,81 @@
+import pytest
+
+from monads import pipeline as pipeline_module
+from monads.option import Null, Option, Some
+from monads.pipeline import OptionPipeline, ResultPipeline
+from monads.result import Err, Ok, Result
+
+
+def _parse(s: str) -> Result[int, str]:
+    return Ok(int(s)) if s.lstrip("-").isdigit() else Err(f"not a number: {s}")
+
+
+PARSE = ResultPipeline[str, str]().map(str.strip).map_into(_parse).map(abs).map_err(str.upper)
+
+
+def test_result_pipeline_ok() -> None:
+    assert PARSE(Ok(" -12 ")) == Ok(12)
+
+
+def test_result_pipeline_err_from_step() -> None:
+    assert PARSE(Ok("abc")) == Err("NOT A NUMBER: ABC")
+
+
+def test_result_pipeline_err_input() -> None:
+    seen: list[object] = []
+    pipeline = PARSE.inspect(seen.append).inspect_err(seen.append)
+    assert pipeline(Err("bad")) == Err("BAD")
+    assert seen == ["BAD"]
+
+
+def test_result_pipeline_matches_chain() -> None:
+    for value in [" 1", "-2 ", "x"]:
+        chained = Ok[str, str](value).map(str.strip).map_into(_parse).map(abs).map_err(str.upper)
+        assert PARSE(Ok(value)) == chained
+
+
+def test_result_pipeline_reuses_unchanged_input() -> None:
+    err = Err("untouched")
+    assert ResultPipeline[int, str]().map(str)(err) is err
+
+    ok = Ok(1)
+    assert ResultPipeline[int, str]().map_err(str.upper)(ok) is ok
+
+
+def test_fusion() -> None:
+    pipeline = ResultPipeline[int, str]().map(str).map(len).map_err(len).map_err(str)
+    assert len(pipeline._steps) == 2  # pyright: ignore[reportPrivateUsage]
+    assert pipeline(Ok(123)) == Ok(3)
+    assert pipeline(Err("four")) == Err("4")
+
+
+def test_compiled_once_on_first_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    compiled: list[object] = []
+    compile_result = pipeline_module._compile_result  # pyright: ignore[reportPrivateUsage]
+
+    def counting(steps: tuple[object, ...], /) -> object:
+        compiled.append(steps)
+        return compile_result(steps)  # pyright: ignore[reportArgumentType]
+
+    monkeypatch.setattr(pipeline_module, "_compile_result", counting)
+    pipeline = ResultPipeline[int, str]()
+    for _ in range(50):
+        pipeline = pipeline.map(abs).inspect(id)
+
+    assert compiled == []
+    assert pipeline(Ok(-1)) == Ok(1)
+    assert pipeline(Ok(-2)) == Ok(2)
+    assert len(compiled) == 1
+
+
+def test_option_pipeline() -> None:
+    def positive(n: int) -> Option[int]:
+        return Some(n) if n > 0 else Null.null
+
+    seen: list[int] = []
+    pipeline = OptionPipeline[str]().map(int).map_into(positive).inspect(seen.append).map(str)
+
+    assert pipeline(Some("12")) == Some("12")
+    assert pipeline(Some("-1")) is Null.null
+    assert pipeline(Null.null) is Null.null
+    assert seen == [12]
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from monads.result import Err, Ok, Result
@@ -56,3 +58,42 @@ def test_rich_comparison(
     assert (lhs >= rhs) == (lhs_t >= rhs_t)
     assert (lhs < rhs) == (lhs_t < rhs_t)
     assert (lhs <= rhs) == (lhs_t <= rhs_t)
+
+
+def test_frozen() -> None:
+    ok, err = Ok(1), Err("1")
+
+    with pytest.raises(AttributeError):
+        ok.ok_value = 2  # pyright: ignore[reportAttributeAccessIssue]
+
+    with pytest.raises(AttributeError):
+        err.err_value = "2"  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_hash() -> None:
+    assert hash(Ok(1)) == hash(Ok(1))
+    assert len({Ok(1), Ok(1), Err(1), Err(1)}) == 2
+
+
+def test_pickle() -> None:
+    assert pickle.loads(pickle.dumps(Ok(1))) == Ok(1)
+    assert pickle.loads(pickle.dumps(Err("1"))) == Err("1")
+
+
+def test_unchanged_variant_returned_as_is() -> None:
+    ok: Result[int, str] = Ok(1)
+    err: Result[int, str] = Err("1")
+    assert ok.map_err(len) is ok
+    assert ok.map_err_into(lambda e: Err(len(e))) is ok
+    assert err.map(str) is err
+    assert err.map_into(lambda v: Ok(str(v))) is err
+
+
+def test_tag() -> None:
+    assert Ok(1).tag == 1
+    assert Err(1).tag == 0
+
+
+@pytest.mark.parametrize(("result", "expected"), [(Ok(1), "ok 1"), (Err("e"), "err e")])
+def test_dispatch(result: Result[int, str], expected: str) -> None:
+    assert result.dispatch(lambda v: f"ok {v}", lambda e: f"err {e}") == expected
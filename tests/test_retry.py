@@ -0,0 +1,71 @@
+import asyncio
+from collections import abc
+
+import pytest
+
+from monads.result import Err, Ok, Result
+from monads.retry import Backoff, Retried, retry_result, retry_result_async
+
+_NO_DELAY = Backoff(initial=0, jitter=False)
+
+
+def _flaky(failures: int, /) -> abc.Callable[[], Result[str, str]]:
+    calls = 0
+
+    def f() -> Result[str, str]:
+        nonlocal calls
+        calls += 1
+        return Err(f"fail {calls}") if calls <= failures else Ok("done")
+
+    return f
+
+
+def test_retries_until_ok() -> None:
+    errors: list[str] = []
+    retried = retry_result(_flaky(2), attempts=5, backoff=_NO_DELAY, on_err=errors.append)
+    assert retried == Retried(Ok("done"), 3)
+    assert errors == ["fail 1", "fail 2"]
+
+
+def test_gives_up_after_attempts() -> None:
+    assert retry_result(_flaky(5), attempts=3, backoff=_NO_DELAY) == Retried(Err("fail 3"), 3)
+
+
+def test_stops_on_non_retryable_err() -> None:
+    retried = retry_result(
+        _flaky(5), attempts=None, backoff=_NO_DELAY, retry_on=lambda e: e != "fail 2"
+    )
+    assert retried == Retried(Err("fail 2"), 2)
+
+
+def test_deadline() -> None:
+    retried = retry_result(
+        _flaky(5), attempts=None, backoff=Backoff(initial=0.01, jitter=False), deadline=0.025
+    )
+    # sleeps 0.01, then 0.02 would overrun the deadline
+    assert retried == Retried(Err("fail 2"), 2)
+
+
+def test_backoff() -> None:
+    backoff = Backoff(initial=1, multiplier=3, max_delay=20, jitter=False)
+    assert [backoff(n) for n in range(1, 6)] == [1, 3, 9, 20, 20]
+    assert backoff(10_000) == 20
+
+    jittered = Backoff(initial=1, multiplier=3, max_delay=20)
+    assert all(0 <= jittered(3) <= 9 for _ in range(100))
+
+
+def test_invalid_attempts() -> None:
+    with pytest.raises(ValueError, match="attempts"):
+        retry_result(_flaky(0), attempts=0)
+
+
+def test_async() -> None:
+    failing = _flaky(1)
+
+    async def f() -> Result[str, str]:
+        await asyncio.sleep(0)
+        return failing()
+
+    retried = asyncio.run(retry_result_async(f, backoff=_NO_DELAY))
+    assert retried == Retried(Ok("done"), 2)
@@ -0,0 +1,53 @@
+import json
+from typing import Any
+
+import pytest
+
+from monads.option import Null, Some
+from monads.result import Err, Ok
+from monads.serde import dumps, from_tagged, from_tagged_many, loads, to_tagged, to_tagged_many
+
+VALUES: list[Any] = [Some(1), Null.null, Ok("a"), Err([1, 2]), Ok(Some(Err(None)))]
+
+
+def test_to_tagged() -> None:
+    assert to_tagged(Some(1)) == {"Some": 1}
+    assert to_tagged(Null.null) == {"Null": None}
+    assert to_tagged(Ok(1)) == {"Ok": 1}
+    assert to_tagged(Err(1)) == {"Err": 1}
+
+
+def test_to_tagged_wrong_type() -> None:
+    with pytest.raises(TypeError, match="not an Option or Result"):
+        to_tagged(1)
+
+
+def test_from_tagged_passthrough() -> None:
+    assert from_tagged({"Foo": 1}) == {"Foo": 1}
+    assert from_tagged({"Ok": 1, "Err": 2}) == {"Ok": 1, "Err": 2}
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_json_roundtrip(value: object) -> None:
+    decoded = loads(dumps(value))
+    assert decoded == value
+    if value is Null.null:
+        assert decoded is Null.null
+
+
+def test_json_nested() -> None:
+    assert dumps(Ok(Some(1))) == '{"Ok": {"Some": 1}}'
+    assert loads(dumps({"key": [Ok(1), Null.null]})) == {"key": [Ok(1), Null.null]}
+
+
+def test_tagged_many() -> None:
+    flat = [Some(1), Null.null, Ok("a"), Err([1, 2])]
+    tagged = to_tagged_many(flat)
+    assert tagged == [{"Some": 1}, {"Null": None}, {"Ok": "a"}, {"Err": [1, 2]}]
+    assert from_tagged_many(json.loads(json.dumps(tagged))) == flat
+
+
+@pytest.mark.parametrize("item", [{"Ok": 1, "Err": 2}, {}, {"Foo": 1}])
+def test_from_tagged_many_rejects_untagged(item: dict[str, int]) -> None:
+    with pytest.raises(ValueError, match="single key"):
+        from_tagged_many([{"Ok": 0}, item])
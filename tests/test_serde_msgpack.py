@@ -0,0 +1,49 @@
+from typing import Any
+
+import pytest
+
+pytest.importorskip("msgpack")
+
+import msgpack  # pyright: ignore[reportMissingTypeStubs]
+
+from monads.option import Null, Some
+from monads.result import Err, Ok
+from monads.serde_msgpack import packb, unpackb
+
+VALUES: list[Any] = [Some(1), Null.null, Ok("a"), Err([1, 2]), Ok(Some(Err(None)))]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_roundtrip(value: object) -> None:
+    assert unpackb(packb(value)) == value
+
+
+def test_roundtrip_batch() -> None:
+    decoded = unpackb(packb(VALUES))
+    assert decoded == VALUES
+    assert decoded[1] is Null.null
+
+
+def test_unknown_ext_passthrough() -> None:
+    ext = msgpack.ExtType(1, b"x")
+    assert unpackb(packb(ext)) == ext
+
+
+def test_wrong_type() -> None:
+    with pytest.raises(TypeError, match="not serializable"):
+        packb(object())
+
+
+def test_nested_payloads() -> None:
+    # payloads holding variants are packed through the hook, the others without it
+    values: list[Any] = [Ok([1, Some(2)]), Ok(3), Err({"a": Ok(1)}), Ok("x")]
+    assert unpackb(packb(values)) == values
+
+
+def test_kwargs_reach_payloads() -> None:
+    value = Ok({1: "a"})
+    with pytest.raises(ValueError, match="int is not allowed for map key"):
+        unpackb(packb(value))
+
+    assert unpackb(packb(value), strict_map_key=False) == value
+    assert unpackb(packb(Some((1, 2)), use_bin_type=True), use_list=False) == Some((1, 2))
@@ -0,0 +1,149 @@
+import json
+import os
+import subprocess
+import sys
+import types
+from collections import abc
+from typing import cast
+
+import pytest
+
+from monads.option import Null, Some
+from monads.result import Err, Ok
+
+speedups = pytest.importorskip("monads._speedups")
+pytestmark = pytest.mark.skipif(
+    bool(os.environ.get("MONADS_NO_SPEEDUPS")), reason="speedups disabled"
+)
+
+
+@pytest.mark.parametrize("cls", [Some, Null, Ok, Err])
+def test_installed(cls: type) -> None:
+    assert type(vars(cls)["map"]) is types.MethodDescriptorType
+
+
+def test_map_allocates_variant() -> None:
+    assert Some(1).map(str) == Some("1")
+    assert Ok(1).map(str) == Ok("1")
+    err = Err(1)
+    assert err.map(str) is err
+    assert Null.null.map(str) is Null.null
+
+
+@pytest.mark.parametrize("option", [Some(1), Null.null, Ok(1), Err(1)])
+def test_map_or_default_keyword(option: Some[int] | Null | Ok[int] | Err[int]) -> None:
+    assert option.map_or(str, default=None) == option.map_or(str, None)
+
+    with pytest.raises(TypeError):
+        option.map_or(str)  # pyright: ignore[reportCallIssue]
+
+    with pytest.raises(TypeError):
+        option.map_or(str, fallback=None)  # pyright: ignore[reportCallIssue]
+
+
+def test_uninitialized_slot() -> None:
+    some = cast("Some[int]", object.__new__(Some))
+
+    with pytest.raises(AttributeError):
+        some.map(str)
+
+
+def test_install_rejects_non_slots() -> None:
+    class Plain:
+        value = None
+
+    with pytest.raises(TypeError):
+        speedups.install_option(Plain, Plain)
+
+
+def test_run_result_block() -> None:
+    closed: list[bool] = []
+
+    def block(*results: Ok[int] | Err[str]) -> abc.Generator[object, int, int]:
+        total = 0
+        try:
+            for r in results:
+                total += yield r
+
+        finally:
+            closed.append(True)
+
+        return total
+
+    assert speedups.run_result_block(block(Ok(1), Ok(2))) == Ok(3)
+    assert speedups.run_result_block(block(Ok(1), Err("no"), Ok(2))) == Err("no")
+    assert speedups.run_option_block(block(Ok(1))) == Ok(1)
+    assert closed == [True, True, True]
+
+
+def test_run_block_propagates() -> None:
+    def block() -> abc.Generator[object, int, int]:
+        yield Some(1)
+        raise ValueError
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        speedups.run_option_block(block())
+
+
+def test_from_none_many() -> None:
+    options = speedups.from_none_many([1, None], Null.null)
+    assert options == [Some(1), Null.null]
+    assert type(options[0]) is Some
+
+    with pytest.raises(TypeError):
+        speedups.from_none_many([1])
+
+    with pytest.raises(TypeError, match="iterable"):
+        speedups.from_none_many(1, Null.null)
+
+
+@pytest.mark.parametrize("variant", [Some(1), Null.null, Ok(1), Err(1)])
+def test_dispatch_arity(variant: Some[int] | Null | Ok[int] | Err[int]) -> None:
+    assert type(vars(type(variant))["dispatch"]) is types.MethodDescriptorType
+
+    with pytest.raises(TypeError):
+        variant.dispatch(str)  # pyright: ignore[reportCallIssue]
+
+
+# prints the signature, without annotations, and the docstring of each method
+_DESCRIBE = """
+import inspect, json, types
+from monads.option import Null, Some
+from monads.result import Err, Ok
+
+def describe(obj):
+    sig = inspect.signature(obj)
+    params = [p.replace(annotation=p.empty) for p in sig.parameters.values()]
+    return str(sig.replace(parameters=params, return_annotation=sig.empty)), obj.__doc__
+
+print(json.dumps({
+    cls.__name__: {
+        "": describe(cls),
+        **{
+            name: describe(getattr(instance, name))
+            for name, attr in vars(cls).items()
+            if isinstance(attr, (types.FunctionType, types.MethodDescriptorType))
+        },
+    }
+    for cls, instance in [(Some, Some(1)), (Null, Null.null), (Ok, Ok(1)), (Err, Err(1))]
+}))
+"""
+
+
+def _describe(*, speedups: bool) -> dict[str, dict[str, list[str | None]]]:
+    env = {k: v for k, v in os.environ.items() if k != "MONADS_NO_SPEEDUPS"}
+    if not speedups:
+        env["MONADS_NO_SPEEDUPS"] = "1"
+
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _DESCRIBE], capture_output=True, check=True, env=env, text=True
+    )
+    return json.loads(process.stdout)
+
+
+def test_introspection_matches_python() -> None:
+    described = _describe(speedups=True)
+    assert described == _describe(speedups=False)
+    signature, doc = described["Ok"]["dispatch"]
+    assert signature == "(on_ok, on_err, /)"
+    assert doc is not None
@@ -1,16 +1,30 @@
 # ruff: noqa: PLW2901
+import pickle
+from collections import abc
 from typing import Never
 
 import pytest
 
-from monads.exceptions import UnwrapError
+from monads.exceptions import ErrFound, UnwrapError
 from monads.option import Null, Option, Some
 from monads.result import Err, Ok, Result
 from monads.tools import (
     CatchResult,
+    Errors,
+    TracebackMode,
+    collect_all_errors,
     collect_options,
     collect_results,
+    drop_traceback,
     from_none,
+    from_none_many,
+    from_nullable_columns,
+    options_from_mapping,
+    partition_results,
+    stream_options,
+    stream_results,
+    summarize_traceback,
+    traceback_summary,
     try_option,
     try_result,
 )
@@ -48,6 +62,34 @@ def test_catch_matmul_not_called() -> None:
         _ = catch.result
 
 
+def test_catch_reuse() -> None:
+    catch = CatchResult(ValueError)
+    results: list[Result[int, ValueError]] = []
+
+    for value in ["1", "x", "3"]:
+        with catch:
+            catch @= int(value)
+
+        results.append(catch.result)
+
+    assert results[0] == Ok(1)
+    assert type(results[1]) is Err
+    assert results[2] == Ok(3)
+
+
+def test_catch_reuse_clears_result() -> None:
+    catch = CatchResult(ValueError)
+
+    with catch:
+        catch @= 1
+
+    with catch:
+        pass
+
+    with pytest.raises(UnwrapError):
+        _ = catch.result
+
+
 def test_catch_does_not_swallow() -> None:
     with pytest.raises(TypeError), CatchResult(ValueError):
         raise TypeError
@@ -89,6 +131,27 @@ def test_from_none() -> None:
     assert from_none(123) == Some(123)
 
 
+@pytest.mark.parametrize("it", [[0, None, "a"], (0, None, "a"), iter([0, None, "a"])])
+def test_from_none_many(it: abc.Iterable[object]) -> None:
+    options = from_none_many(it)
+    assert options == [Some(0), Null.null, Some("a")]
+    assert options[1] is Null.null
+
+
+def test_options_from_mapping() -> None:
+    mapping = {"a": 1, "b": None}
+    assert options_from_mapping(mapping, ["a", "b", "c"]) == [Some(1), Null.null, Null.null]
+
+
+def test_from_nullable_columns() -> None:
+    class Column:
+        def tolist(self) -> list[int | None]:
+            return [None, 2]
+
+    columns = from_nullable_columns({"id": (1, 2), "age": Column()})
+    assert columns == {"id": [Some(1), Some(2)], "age": [Null.null, Some(2)]}
+
+
 @pytest.mark.parametrize(
     ("options", "result"),
     [
@@ -109,3 +172,130 @@ def test_collect_options[T](options: list[Option[T]], result: Option[list[T]]) -
 )
 def test_collect_results[T, E](results: list[Result[T, E]], result: Result[list[T], E]) -> None:
     assert collect_results(results) == result
+
+
+@pytest.mark.parametrize(
+    ("max_errors", "result"),
+    [
+        (None, Err(Errors(["foo", "bar", "baz"], 3))),
+        (2, Err(Errors(["foo", "bar"], 3))),
+        (0, Err(Errors[str]([], 3))),
+    ],
+)
+def test_collect_all_errors(max_errors: int | None, result: Result[list[int], Errors[str]]) -> None:
+    results: list[Result[int, str]] = [Ok(1), Err("foo"), Ok(3), Err("bar"), Err("baz")]
+    assert collect_all_errors(results, max_errors) == result
+
+
+def test_errors_hashable() -> None:
+    errors = Errors(["foo", "bar"], 3)
+    assert errors.values == ("foo", "bar")
+    assert {errors, Errors(("foo", "bar"), 3)} == {errors}
+    assert hash(Err(errors)) == hash(Err(Errors(["foo", "bar"], 3)))
+    assert pickle.loads(pickle.dumps(errors)) == errors
+
+
+def test_collect_all_errors_ok() -> None:
+    assert collect_all_errors(iter([Ok(1), Ok(2)])) == Ok([1, 2])
+
+
+def test_collect_all_errors_invalid_max() -> None:
+    with pytest.raises(ValueError, match="max_errors"):
+        collect_all_errors([Ok(1)], -1)
+
+
+def test_stream_options() -> None:
+    assert list(stream_options([Some(1), Some(2)])) == [1, 2]
+
+    stream = stream_options([Some(1), Null.null, Some(3)])
+    assert next(stream) == 1
+    with pytest.raises(UnwrapError):
+        next(stream)
+
+
+def test_stream_results_fail_fast() -> None:
+    seen: list[int] = []
+
+    with pytest.raises(ErrFound) as exc_info:
+        seen.extend(stream_results([Ok(1), Err("foo"), Ok(3)]))
+
+    assert seen == [1]
+    assert exc_info.value.err_value == "foo"
+    assert str(exc_info.value) == "Err('foo') found"
+
+
+def test_stream_results_is_lazy() -> None:
+    def results() -> abc.Iterator[Result[int, str]]:
+        yield Ok(1)
+        raise AssertionError
+
+    assert next(stream_results(results())) == 1
+
+
+def test_stream_results_on_err() -> None:
+    errors: list[str] = []
+    results: list[Result[int, str]] = [Ok(1), Err("foo"), Ok(3), Err("bar")]
+    assert list(stream_results(results, on_err=errors.append)) == [1, 3]
+    assert errors == ["foo", "bar"]
+
+
+def test_partition_results() -> None:
+    oks: list[int] = []
+    errs: list[str] = []
+    results: list[Result[int, str]] = [Ok(1), Err("foo"), Ok(3)]
+    assert partition_results(results, oks.append, errs.append) == (2, 1)
+    assert oks == [1, 3]
+    assert errs == ["foo"]
+
+
+def test_err_found_pickle() -> None:
+    exc = pickle.loads(pickle.dumps(ErrFound("foo")))
+    assert type(exc) is ErrFound
+    assert exc.err_value == "foo"
+
+
+def _raise_chained() -> int:
+    try:
+        return int("x")
+
+    except ValueError as e:
+        msg = "k"
+        raise KeyError(msg) from e
+
+
+def test_drop_traceback() -> None:
+    result = try_result(_raise_chained, KeyError).inspect_err(drop_traceback)
+    exc = result.unwrap_err()
+    assert exc.__traceback__ is None
+    assert exc.__cause__ is not None
+    assert exc.__cause__.__traceback__ is None
+    assert traceback_summary(exc) == []
+
+
+def test_summarize_traceback() -> None:
+    exc = try_result(_raise_chained, KeyError).unwrap_err()
+    frames = [frame.name for frame in traceback_summary(exc)]
+
+    summarize_traceback(exc)
+    assert exc.__traceback__ is None
+    assert [frame.name for frame in traceback_summary(exc)] == frames
+    assert frames[-1] == "_raise_chained"
+    assert traceback_summary(exc)[-1].line == "raise KeyError(msg) from e"
+
+    assert exc.__cause__ is not None
+    assert [frame.name for frame in traceback_summary(exc.__cause__)] == ["_raise_chained"]
+
+
+@pytest.mark.parametrize(("mode", "kept"), [("keep", True), ("drop", False), ("summary", False)])
+def test_catch_result_traceback(mode: TracebackMode, kept: bool) -> None:
+    with CatchResult(ValueError, traceback=mode) as catch:
+        catch @= int("x")
+
+    exc = catch.result.unwrap_err()
+    assert (exc.__traceback__ is not None) is kept
+    assert (len(traceback_summary(exc)) > 0) is (mode != "drop")
+
+
+def test_catch_result_invalid_traceback() -> None:
+    with pytest.raises(ValueError, match="traceback must be one of"):
+        CatchResult(ValueError, traceback="lazy")  # pyright: ignore[reportArgumentType]
@@ -23,6 +23,7 @@ class _Option[T](Protocol):
     # def map_into[U](self, f: abc.Callable[[T], "_Option[U]"], /) -> "_Option[U]": ...
     def map_or[U, D](self, f: abc.Callable[[T], U], /, default: D) -> U | D: ...
     def map_or_else[U, D](self, f: abc.Callable[[T], U], /, default: Factory[D]) -> U | D: ...
+    def dispatch[U, D](self, on_some: abc.Callable[[T], U], on_null: Factory[D], /) -> U | D: ...
     def inspect(self, f: abc.Callable[[T], object], /) -> Self: ...
     def ok_or[E](self, err: E, /) -> Result[T, E]: ...
     def ok_or_else[E](self, err: Factory[E], /) -> Result[T, E]: ...
@@ -24,6 +24,9 @@ class _Result[T, E](Protocol):
     ) -> result.Result[U, E] | result.Result[U, F]: ...
     def map_or[U, D](self, f: abc.Callable[[T], U], /, default: D) -> U | D: ...
     def map_or_else[U, D](self, f: abc.Callable[[T], U], /, default: Factory[D]) -> U | D: ...
+    def dispatch[U, D](
+        self, on_ok: abc.Callable[[T], U], on_err: abc.Callable[[E], D], /
+    ) -> U | D: ...
     def map_err[F](self, f: abc.Callable[[E], F], /) -> result.Result[T, F]: ...
     def map_err_into[U, F](
         self, f: abc.Callable[[E], result.Result[U, F]], /